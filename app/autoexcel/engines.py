@@ -7,6 +7,8 @@ import pandas as pd
 from openpyxl import load_workbook, Workbook
 from openpyxl.utils import get_column_letter
 from openpyxl.chart import BarChart, LineChart, PieChart, Reference
+from ..io.xlsx_reader import read_xlsx
+from ..core.utils import ensure_datetime
 
 try:
     if sys.platform == "win32":
@@ -42,6 +44,16 @@ class ExcelEngine:
     def export_pdf(self, path_pdf: str) -> None: ...
     def close(self) -> None: ...
 
+def _pivot_columns(path: str, sheet: str, rows: List[str], columns: List[str], values: List[str], filters: Dict[str, List[Any]]) -> Optional[List[str]]:
+    """피벗에 쓰이는 열 목록 (월 파생용 날짜 후보 포함). 값 열이 없으면 None(전체)"""
+    if not values:
+        return None
+    header = list(read_xlsx(path, sheet, nrows=0).columns)
+    need = set(rows) | set(columns) | set(filters or {}) | {v.split(":", 1)[0] for v in values}
+    if "월" in rows and "월" not in header:
+        need.update(c for c in header if "일" in c or "날짜" in c)
+    return [c for c in header if c in need]
+
 class FallbackEngine(ExcelEngine):
     def __init__(self, path: str):
         self.path = path
@@ -77,8 +89,8 @@ class FallbackEngine(ExcelEngine):
         return EngineResult(self.warnings, {"range": a1_range, "formula": formula})
 
     def create_pivot(self, source_sheet: str, target_sheet: str, rows: List[str], columns: List[str], values: List[str], filters: Dict[str, List[Any]], data_range: Optional[str]) -> EngineResult:
-        # pandas pivot_table로 결과표 생성
-        df = pd.read_excel(self.path, sheet_name=source_sheet)
+        # pandas pivot_table로 결과표 생성 (필요한 열만 스트리밍 리더로 읽기)
+        df = read_xlsx(self.path, source_sheet, usecols=_pivot_columns(self.path, source_sheet, rows, columns, values, filters))
         if filters:
             for col, allowed in filters.items():
                 if col in df.columns:
@@ -91,7 +103,7 @@ class FallbackEngine(ExcelEngine):
                 if "일" in c or "날짜" in c:
                     date_col = c; break
             if date_col:
-                s = pd.to_datetime(df[date_col], errors="coerce")
+                s = ensure_datetime(df[date_col])
                 df["월"] = s.dt.to_period("M").astype(str)
 
         agg_map = {}
@@ -107,7 +119,7 @@ class FallbackEngine(ExcelEngine):
         if not rows and not columns:
             rows = [value_cols[0]]
 
-        piv = pd.pivot_table(df, index=rows or None, columns=columns or None, values=value_cols, aggfunc=agg_map, fill_value=0, dropna=False)
+        piv = pd.pivot_table(df, index=rows or None, columns=columns or None, values=value_cols, aggfunc=agg_map, fill_value=0, dropna=False, observed=True)
         # 테이블을 일반 DataFrame으로
         piv = piv.reset_index()
         # 다중 컬럼일 경우 정리
@@ -5,6 +5,9 @@ from openpyxl.chart import BarChart, LineChart, PieChart, Reference
 from openpyxl.utils import get_column_letter
 import re
 
+from ..io import xlsx_writer
+from ..core.utils import ensure_datetime
+
 # 스네이크/일치 매핑 유틸 (dedupe의 것을 재사용 중이라면 import로 대체 가능)
 def _to_snake(name: str) -> str:
     if name is None: return name
@@ -45,6 +48,9 @@ def _dedupe_columns(df: pd.DataFrame) -> pd.DataFrame:
         df = df.loc[:, ~df.columns.duplicated(keep="first")]
     return df
 
+# '월' 파생에 쓰는 날짜 열 후보 (앞에 있을수록 우선)
+_MONTH_SOURCES = ('주문일','order_date','date','날짜')
+
 def _ensure_month_column(df: pd.DataFrame, colmap: dict) -> pd.DataFrame:
     # '월'이 이미 있고 DataFrame(중복 열)로 잡히면 첫 번째 열만 사용
     if '월' in df.columns and not isinstance(df['월'], pd.Series):
@@ -52,17 +58,62 @@ def _ensure_month_column(df: pd.DataFrame, colmap: dict) -> pd.DataFrame:
         return df
     # 없으면 날짜 후보에서 파생
     if '월' not in df.columns:
-        for cand in ('주문일','order_date','date','날짜'):
+        for cand in _MONTH_SOURCES:
             real = colmap.get(_to_snake(cand))
             if real and real in df.columns:
-                dts = pd.to_datetime(df[real], errors="coerce")
+                dts = ensure_datetime(df[real])
                 df = df.assign(월=dts.dt.to_period("M").astype(str))
                 break
     return df
 
-def create_pivot_from_df(df: pd.DataFrame, path, target_sheet, rows, values, filters=None):
-    df = df.copy()
-
+def pivot_inputs(header, rows, values, filters=None):
+    """create_pivot_from_df가 실제로 쓰는 열과 필터를 원본 열 이름으로 반환 (입력 로드 시 열 선택·필터용)
+    반환: ([열, …] header 순서, {원본 열: 허용값 목록}) — 매핑되지 않는 이름은 빠짐
+    """
+    colmap = {_to_snake(c): c for c in header}
+    need = set()
+    for name in list(rows or []) + [c for c, _ in values or []]:
+        real = colmap.get(_to_snake(name))
+        if real is not None:
+            need.add(real)
+    real_filters = {}
+    for col, allowed in (filters or {}).items():
+        real = colmap.get(_to_snake(col))
+        if real is not None:
+            real_filters[real] = list(allowed)
+            need.add(real)
+    # '월'이 없으면 _ensure_month_column이 쓰는 날짜 후보도 읽어야 함
+    if any(_to_snake(r) == _to_snake('월') for r in (rows or [])) and '월' not in header:
+        for cand in _MONTH_SOURCES:
+            real = colmap.get(_to_snake(cand))
+            if real is not None:
+                need.add(real)
+                break
+    return [c for c in header if c in need], real_filters
+
+def _write_frame_split(wb, target_sheet, df: pd.DataFrame):
+    """시트에 DataFrame 쓰기. 시트 행 한도를 넘으면 target_1, target_2, … 로 나눔. 반환: 시트별 행 수"""
+    limit = xlsx_writer.MAX_SHEET_ROWS - 1
+    n_parts = max(1, -(-len(df) // limit))
+    names = [target_sheet] if n_parts == 1 else xlsx_writer.split_sheet_names(target_sheet, n_parts)
+    if n_parts > 1 and target_sheet in wb.sheetnames:
+        del wb[target_sheet]
+    parts = []
+    for i, name in enumerate(names):
+        ws = wb[name] if name in wb.sheetnames else wb.create_sheet(name)
+        ws.delete_rows(1, ws.max_row)
+        ws.append(list(df.columns))
+        part = df.iloc[i * limit:(i + 1) * limit]
+        for row in part.itertuples(index=False):
+            ws.append(list(row))
+        parts.append({"sheet": name, "rows": len(part)})
+    return parts
+
+def create_pivot_from_df(df: pd.DataFrame, path, target_sheet, rows, values, filters=None, return_sheets=False):
+    """DataFrame으로 피벗을 만들어 path의 target_sheet에 기록. 반환: 피벗 shape
+    return_sheets=True면 (shape, [{"sheet", "rows"}, …]) — 행 한도 초과로 나뉜 시트 목록
+    """
+    # 입력 df는 수정하지 않음. 필터·열 선택·월 파생이 새 프레임을 만들므로 전체 복사는 하지 않음
     # 0) 컬럼 중복 제거 (중복이면 groupby가 'not 1-dimensional' 에러)
     df = _dedupe_columns(df)
     colmap = _colmap(df)
@@ -89,6 +140,11 @@ def create_pivot_from_df(df: pd.DataFrame, path, target_sheet, rows, values, fil
 
     # 3) '월' 요청 시 파생 보강 (주문일/날짜에서 월 추출)
     want_month = any(_to_snake(r) == _to_snake('월') for r in (rows or []))
+    # 피벗에 쓰는 열(+ 월 파생용 날짜 후보)만 남겨 이후 파생 열 추가가 전체 표를 복사하지 않게 함
+    keep = set(rows_real) | set(agg) | {'월'}
+    if want_month:
+        keep |= {colmap.get(_to_snake(c)) for c in _MONTH_SOURCES}
+    df = df[[c for c in df.columns if c in keep]]
     if want_month:
         df = _ensure_month_column(df, colmap)
         if '월' in df.columns and '월' not in rows_real:
@@ -107,18 +163,16 @@ def create_pivot_from_df(df: pd.DataFrame, path, target_sheet, rows, values, fil
         values=list(agg.keys()),
         aggfunc=agg,
         fill_value=0,
-        observed=False,
+        observed=True,      # category 열(optimize_memory)이면 관측된 조합만
         dropna=False,
     ).reset_index()
 
-    # 6) 엑셀로 쓰기
+    # 6) 엑셀로 쓰기 (행 한도 초과 시 시트 분할)
     wb = _ensure_book(path)
-    ws = wb[target_sheet] if target_sheet in wb.sheetnames else wb.create_sheet(target_sheet)
-    ws.delete_rows(1, ws.max_row)
-    ws.append(list(pvt.columns))
-    for row in pvt.itertuples(index=False):
-        ws.append(list(row))
+    sheets = _write_frame_split(wb, target_sheet, pvt)
     wb.save(path)
+    if return_sheets:
+        return pvt.shape, sheets
     return pvt.shape
 
 def add_chart(path, sheet, data_start_cell="A1", title="차트", chart_type="bar"):
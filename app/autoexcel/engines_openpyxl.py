@@ -7,6 +7,10 @@ from openpyxl.chart import BarChart, LineChart, PieChart, Reference
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.utils import get_column_letter
 import pandas as pd
+try:
+    from ..io import xlsx_reader
+except ImportError:  # app 폴더를 sys.path에 넣고 단독 실행하는 경우
+    xlsx_reader = None  # type: ignore[assignment]
 
 class OpenPyxlExcel:
     """openpyxl을 사용한 Excel 처리 엔진"""
@@ -14,9 +18,11 @@ class OpenPyxlExcel:
     def __init__(self):
         self.workbook = None
         self.active_sheet = None
+        self.path = None
     
     def open(self, path):
         """Excel 파일을 엽니다."""
+        self.path = path
         try:
             if os.path.exists(path):
                 self.workbook = load_workbook(path)
@@ -70,24 +76,30 @@ class OpenPyxlExcel:
             print(f"[debug] 소스 시트: {ws.title}")
             
             # 데이터를 pandas DataFrame으로 변환
-            data = []
-            headers = []
-            
-            for row in ws.iter_rows(values_only=True):
-                if not headers:
-                    headers = row
-                    continue
-                if any(cell is not None for cell in row):
-                    data.append(row)
-            
-            if not data:
+            if xlsx_reader and self.path and os.path.exists(self.path) and ws.title in xlsx_reader.sheet_names(self.path):
+                # 저장된 시트는 스트리밍 리더로 필요한 열만 읽기
+                df = xlsx_reader.read_xlsx(self.path, ws.title, usecols=list(rows) + list(values))
+                df = df.dropna(how="all")
+            else:
+                data = []
+                headers = []
+                
+                for row in ws.iter_rows(values_only=True):
+                    if not headers:
+                        headers = row
+                        continue
+                    if any(cell is not None for cell in row):
+                        data.append(row)
+                
+                df = pd.DataFrame(data, columns=headers)
+            
+            if df.empty:
                 raise ValueError("데이터가 없습니다")
             
-            df = pd.DataFrame(data, columns=headers)
             print(f"[debug] 데이터 로드 완료: {len(df)}행 x {len(df.columns)}열")
             
             # 피벗 테이블 생성
-            pivot_data = df.groupby(rows)[values].sum().reset_index()
+            pivot_data = df.groupby(rows, observed=True)[values].sum().reset_index()
             print(f"[debug] 피벗 데이터: {pivot_data}")
             
             # 대상 시트 생성 또는 선택
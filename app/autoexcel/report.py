@@ -4,18 +4,21 @@ import os, json, time, datetime as dt
 from typing import Dict, Any, List
 import pandas as pd
 from ..core.report import _log_dir
+from ..core.utils import ensure_datetime
+from ..io.xlsx_reader import read_xlsx
 from .pivot import run_pivot
 from .charts import run_chart
 
 def weekly_report(path: str, source_sheet: str, target_sheet: str, start: str, end: str, include: List[str], export: List[str]) -> Dict[str, Any]:
     # 간단한 요약표: 기간 내 금액/수량 합계
-    df = pd.read_excel(path, sheet_name=source_sheet)
+    header = read_xlsx(path, source_sheet, nrows=0).columns
     date_col = None
-    for c in df.columns:
+    for c in header:
         if "일" in c or "날짜" in c:
             date_col = c; break
+    df = read_xlsx(path, source_sheet, usecols=[c for c in header if c in (date_col, "금액", "수량")])
     if date_col:
-        s = pd.to_datetime(df[date_col], errors="coerce")
+        s = ensure_datetime(df[date_col])
         mask = (s >= pd.to_datetime(start)) & (s <= pd.to_datetime(end))
         df_period = df[mask].copy()
     else:
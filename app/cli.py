@@ -8,21 +8,27 @@ import sys
 import json
 import argparse
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 
 import pandas as pd
 
 from .core.logging import setup_logging, get_logger
 from .core.profile import profile_dataframe
 from .excel_ops.clean import level1_clean
-from .excel_ops.dedupe import dedupe
+from .excel_ops.dedupe import dedupe, dedupe_external, DEDUPE_MEMORY_MB, DEDUPE_CHUNK_ROWS
+from .excel_ops.dedupe_index import DedupeIndex
+from .excel_ops.fuzzy import fuzzy_dedupe, FUZZY_THRESHOLD
+from .excel_ops.memory import optimize_memory
 from .excel_ops.impute import handle_missing_values, analyze_missing_patterns, suggest_impute_strategies
 from .excel_ops.outlier import outlier
+from .excel_ops.pipeline import StreamPreprocessor
 from .excel_ops.schema import align_schemas, merge_aligned_dataframes, analyze_schema_compatibility
 from .recipes.manager import RecipeManager
 from .autoexcel.intent import parse as nl_parse
-from .autoexcel.engines_fallback import create_pivot_from_df, add_chart, write_formula
-from .io.loader import load_table, write_table, detect_encoding
+from .autoexcel.engines_fallback import create_pivot_from_df, add_chart, write_formula, pivot_inputs
+from .io.compression import compression_of, split_suffix
+from .io.loader import (load_table, load_many, write_table, export_table, detect_encoding, IO_ENGINES,
+                        expand_paths, parse_filters, read_columns, sheet_names)
 from .core.utils import ensure_df
 import platform
 
@@ -36,7 +42,7 @@ def build_parser():
     # profile
     sp = sub.add_parser("profile", help="Profile dataset")
     sp.add_argument("--path", required=True, help="Input CSV/XLSX path")
-    sp.add_argument("--sheet", default=None, help="Sheet name if Excel")
+    _add_io_args(sp)
     sp.set_defaults(func=cmd_profile)
 
     # clean
@@ -44,6 +50,13 @@ def build_parser():
     sp.add_argument("--path", required=True)
     sp.add_argument("--date-fmt", default="YYYY-MM-DD")
     sp.add_argument("--apply", action="store_true", help="Save cleaned file")
+    sp.add_argument("--split", choices=["sheets", "files"], default="sheets",
+                    help="How to split xlsx output beyond Excel's row limit")
+    sp.add_argument("--compress", choices=["gzip", "bz2", "xz", "zstd", "zip"], default=None,
+                    help="Compress CSV output (default: same as a compressed input)")
+    sp.add_argument("--jobs", type=int, default=1,
+                    help="Processes for column-parallel cleaning (-1 = all cores)")
+    _add_io_args(sp)
     sp.set_defaults(func=cmd_clean)
 
     # dedupe
@@ -52,18 +65,61 @@ def build_parser():
     sp.add_argument("--keys", default="거래ID", help="Comma separated keys")
     sp.add_argument("--keep", default="last", help="first/last/last_by:컬럼명")
     sp.add_argument("--apply", action="store_true")
+    sp.add_argument("--external", action="store_true",
+                    help="Out-of-core dedupe: spill keys to hash partitions on disk, stream the result")
+    sp.add_argument("--memory-mb", type=float, default=DEDUPE_MEMORY_MB,
+                    help="Memory budget per partition for --external (MB)")
+    sp.add_argument("--chunksize", type=int, default=DEDUPE_CHUNK_ROWS, help="Rows per chunk for --external")
+    sp.add_argument("--index", default=None,
+                    help="Persistent key index (SQLite) for incremental dedupe across files; updated on --apply")
+    sp.add_argument("--fuzzy", action="store_true",
+                    help="Near-duplicate dedupe on --keys text (spacing, (주)/주식회사, typos) via MinHash LSH blocking")
+    sp.add_argument("--threshold", type=float, default=FUZZY_THRESHOLD,
+                    help="Estimated Jaccard similarity of character bigrams for --fuzzy")
+    sp.add_argument("--mark", action="store_true",
+                    help="With --fuzzy: keep every row and add __cluster/__survivor columns instead of dropping")
+    sp.add_argument("--merge", default=None,
+                    help='Coalesce duplicates per column, e.g. "max:금액;first_non_null:메모;max:업데이트일" '
+                         '(policies: keep/first_non_null/last_non_null/max/min/sum/mean/concat, *: other columns)')
+    sp.add_argument("--split", choices=["sheets", "files"], default="sheets",
+                    help="How to split xlsx output beyond Excel's row limit")
+    sp.add_argument("--compress", choices=["gzip", "bz2", "xz", "zstd", "zip"], default=None,
+                    help="Compress CSV output (default: same as a compressed input)")
+    _add_compact_arg(sp)
+    _add_io_args(sp)
     sp.set_defaults(func=cmd_dedupe)
 
+    # dedupe-index (incremental dedupe key index)
+    sp = sub.add_parser("dedupe-index", help="Build, compact or inspect an incremental dedupe index")
+    sp.add_argument("action", choices=["build", "compact", "info"])
+    sp.add_argument("--index", required=True, help="Index file (SQLite)")
+    sp.add_argument("--path", default=None, help="build: history files, oldest first (glob or comma list)")
+    sp.add_argument("--keys", default=None, help="Comma separated keys (required when building a new index)")
+    sp.add_argument("--keep", default=None, help="first/last/last_by:컬럼명 (required when building a new index)")
+    sp.add_argument("--chunksize", type=int, default=DEDUPE_CHUNK_ROWS, help="Rows per chunk for build")
+    sp.add_argument("--before", default=None, help="compact: drop keys whose last_by value is older than this")
+    sp.set_defaults(func=cmd_dedupe_index)
+
     # preprocess (pipeline)
     sp = sub.add_parser("preprocess", help="Clean + (optional) impute/outlier")
     sp.add_argument("--path", required=True)
-    sp.add_argument("--sheet", default=None, help="Sheet name if Excel")
-    sp.add_argument("--impute", default=None, help='e.g. "median:금액;zero:수량"')
+    _add_io_args(sp)
+    sp.add_argument("--impute", default=None,
+                    help='e.g. "median:금액;zero:수량" (group-wise: "median:금액@by=카테고리+도시")')
     sp.add_argument("--outlier", default=None,
         help='e.g. "iqr_clip:금액@multiplier=1.5;zscore_clip:수량@z=3"  (alias: k= for multiplier)')
     sp.add_argument("--gate-dsl", default=None, help="Validation DSL file")
     sp.add_argument("--gate-pass-threshold", type=float, default=1.0)
+    sp.add_argument("--stream", action="store_true", help="Process in chunks with bounded memory")
+    sp.add_argument("--chunksize", type=int, default=100_000, help="Rows per chunk for --stream")
     sp.add_argument("--apply", action="store_true")
+    sp.add_argument("--split", choices=["sheets", "files"], default="sheets",
+                    help="How to split xlsx output beyond Excel's row limit")
+    sp.add_argument("--compress", choices=["gzip", "bz2", "xz", "zstd", "zip"], default=None,
+                    help="Compress CSV output (default: same as a compressed input)")
+    sp.add_argument("--jobs", type=int, default=1,
+                    help="Processes for column-parallel cleaning (-1 = all cores)")
+    _add_compact_arg(sp)
     sp.set_defaults(func=cmd_preprocess)
 
     # replay
@@ -79,8 +135,8 @@ def build_parser():
     # validate DSL
     sp = sub.add_parser("validate", help="Validate dataset by DSL")
     sp.add_argument("--path", required=True)
-    sp.add_argument("--sheet", default=None)
     sp.add_argument("--dsl", required=True)
+    _add_io_args(sp)
     sp.set_defaults(func=cmd_validate)
 
     # excel-auto (natural language → pivot/chart)
@@ -90,6 +146,8 @@ def build_parser():
     sp.add_argument("--parser", choices=["auto","rule","llm"], default="auto")
     sp.add_argument("--engine", choices=["fallback","com"], default="fallback")
     sp.add_argument("--out", default="data/automation/auto_out.xlsx")
+    _add_io_args(sp)
+    _add_compact_arg(sp)
     sp.set_defaults(func=cmd_excel_auto)
 
     # excel-formula (MoM/YTD)
@@ -107,6 +165,7 @@ def build_parser():
     sp.add_argument("--owner", default="Excel Copilot")
     sp.add_argument("--chart", default="bar")
     sp.add_argument("--pdf", action="store_true")
+    _add_io_args(sp)
     sp.set_defaults(func=cmd_excel_report)
 
     # watch
@@ -114,6 +173,11 @@ def build_parser():
     sp.add_argument("--dir", default="data/incoming")
     sp.set_defaults(func=cmd_watch)
 
+    # cache (parsed-input cache)
+    sp = sub.add_parser("cache", help="Show or clear the parsed-input cache")
+    sp.add_argument("--clear", action="store_true")
+    sp.set_defaults(func=cmd_cache)
+
     # undo
     sp = sub.add_parser("undo", help="Restore from undo token")
     sp.add_argument("--token", required=True)
@@ -121,6 +185,72 @@ def build_parser():
 
     return ap
 
+def _add_io_args(sp):
+    """입력 파일을 읽는 명령의 공통 옵션"""
+    sp.add_argument("--sheet", default=None, help='Sheet name if Excel ("*" = all sheets, loaded in parallel)')
+    sp.add_argument("--io-engine", choices=list(IO_ENGINES), default="pandas",
+                    help="CSV parser: pandas (default) or arrow (pyarrow, multithreaded)")
+    sp.add_argument("--no-cache", action="store_true", help="Do not use the parsed-input cache")
+    sp.add_argument("--io-jobs", type=int, default=None,
+                    help="Worker processes when --path is a glob or comma-separated list (default: CPU count)")
+    sp.add_argument("--columns", default=None, help="Comma separated columns to load (others are skipped)")
+    sp.add_argument("--where", action="append", default=None,
+                    help='Row filter pushed into the reader, e.g. "도시 in [서울, 부산]" or "카테고리=식품" (repeatable)')
+
+def _is_many(path: Optional[str]) -> bool:
+    """--path가 글롭 패턴이나 쉼표로 구분한 여러 파일인지"""
+    return bool(path and ("," in path or any(ch in path for ch in "*?[")))
+
+def _load_input(args, path: Optional[str] = None, **kwargs):
+    """인코딩 감지 + load_table (공통 IO 옵션 반영)
+    --path가 여러 파일(글롭/쉼표)이거나 --sheet "*"이면 load_many로 동시에 읽어 하나의 DataFrame으로 합침
+    (CSV가 여럿인 .zip을 --sheet 없이 주면 모든 멤버를 같은 방식으로)
+    columns/filters(명령이 계산한 값)가 없으면 --columns/--where를 사용, 필터는 둘을 합침
+    """
+    path = path or _resolve_path_arg(args)
+    sheet = kwargs.pop("sheet", getattr(args, "sheet", None))
+    if kwargs.get("columns") is None and getattr(args, "columns", None):
+        kwargs["columns"] = [c.strip() for c in args.columns.split(",") if c.strip()]
+    filters = parse_filters(getattr(args, "where", None))
+    for col, values in (kwargs.pop("filters", None) or {}).items():
+        filters.setdefault(col, []).extend(values)
+    if filters:
+        kwargs["filters"] = filters
+    is_zip = not _is_many(path) and compression_of(path) == "zip"
+    bundle = is_zip and sheet is None and len(sheet_names(path)) > 1
+    if bundle and kwargs.get("chunksize"):
+        raise SystemExit(f"--stream은 CSV 하나만 읽습니다. --sheet로 zip 멤버를 고르세요: {sheet_names(path)}")
+    if _is_many(path) or sheet == "*" or bundle:
+        if kwargs.get("chunksize"):
+            raise SystemExit("--stream은 입력 파일·시트 하나에만 사용할 수 있습니다")
+        df, meta = load_many(path, sheets=None if sheet == "*" or bundle else (sheet or 0), concat=True,
+                             workers=getattr(args, "io_jobs", None), engine=getattr(args, "io_engine", None),
+                             cache=not getattr(args, "no_cache", False),
+                             columns=kwargs.get("columns"), filters=kwargs.get("filters"))
+        print(json.dumps({"load_many": meta}, ensure_ascii=False, default=str), file=sys.stderr)
+        return df, meta
+    # zip은 멤버마다 인코딩이 다를 수 있으므로 load_table이 고른 멤버에서 감지
+    enc = {} if is_zip else detect_encoding(path)
+    return load_table(path, sheet=sheet, encoding=enc.get("encoding"),
+                      engine=getattr(args, "io_engine", None),
+                      cache=not getattr(args, "no_cache", False), **kwargs)
+
+def _input_columns(args, path: Optional[str] = None) -> List[str]:
+    """입력의 열 이름만 읽기 (여러 파일/시트면 합집합). 필요한 열만 고르기 전에 사용"""
+    path = path or _resolve_path_arg(args)
+    sheet = getattr(args, "sheet", None)
+    files = expand_paths(path) if _is_many(path) else [path]
+    header: List[str] = []
+    for f in files:
+        sheets: List[Optional[str]]
+        if sheet == "*" and f.lower().endswith((".xlsx", ".xlsm", ".xls")):
+            sheets = list(sheet_names(f))
+        else:
+            sheets = [None if sheet == "*" else sheet]
+        for sh in sheets:
+            header.extend(c for c in read_columns(f, sh) if c not in header)
+    return header
+
 def _resolve_path_arg(args):
     """경로 인자 해결 (--path 또는 위치 인자)"""
     if hasattr(args, 'path') and args.path:
@@ -131,8 +261,13 @@ def _resolve_path_arg(args):
 
 def _auto_out_path(input_path: str, suffix: str = "_cleaned") -> str:
     """자동 출력 경로 생성"""
-    p = Path(input_path)
-    return str(p.parent / f"{p.stem}{suffix}{p.suffix}")
+    if _is_many(input_path):
+        # 여러 입력을 합친 결과: 첫 패턴의 폴더에 combined<suffix>.<첫 패턴 확장자>
+        p = Path(input_path.split(",")[0].strip())
+        return str(p.parent / f"combined{suffix}{p.suffix if '*' not in p.suffix else '.csv'}")
+    # 압축 입력은 안쪽 확장자 기준: data.csv.gz → data_cleaned.csv.gz, bundle.zip → bundle_cleaned.csv.zip
+    p, comp = split_suffix(input_path)
+    return str(p.parent / f"{p.stem}{suffix}{p.suffix or ('.csv' if comp else '')}{comp}")
 
 def _parse_outlier_rules(outlier_str: str) -> List[Dict[str, Any]]:
     """이상치 규칙 파싱 (k -> multiplier 별칭 지원)"""
@@ -182,8 +317,7 @@ def cmd_profile(args):
     if not path:
         raise SystemExit("usage: profile --path <file>")
     
-    enc = detect_encoding(path)
-    df, meta = load_table(path, sheet=args.sheet, encoding=enc.get("encoding"))
+    df, meta = _load_input(args, path)
     df = ensure_df(df)
     
     prof = profile_dataframe(df)
@@ -199,16 +333,16 @@ def cmd_clean(args):
     if not path:
         raise SystemExit("usage: clean --path <file>")
     
-    enc = detect_encoding(path)
-    df, meta = load_table(path, sheet=args.sheet, encoding=enc.get("encoding"))
+    df, meta = _load_input(args, path)
     df = ensure_df(df)
     
-    df_cleaned = level1_clean(df, date_fmt=args.date_fmt)
+    # 날짜는 datetime64로 두고 서식은 저장/출력 시점에
+    df_cleaned = level1_clean(df, date_fmt=args.date_fmt, workers=args.jobs, date_output="datetime", copy=False)
     
     if args.apply:
         out_path = _auto_out_path(path, "_cleaned")
-        write_table(df_cleaned, out_path, sheet="정리본")
-        print(json.dumps({"saved": out_path}, ensure_ascii=False, indent=2))
+        saved = write_table(df_cleaned, out_path, sheet="정리본", split=args.split, compression=args.compress)
+        print(json.dumps({"saved": saved["path"], **_split_info(saved)}, ensure_ascii=False, indent=2))
     else:
         print(df_cleaned.head(20).to_string(index=False))
 
@@ -218,19 +352,133 @@ def cmd_dedupe(args):
     if not path:
         raise SystemExit("usage: dedupe --path <file>")
     
-    enc = detect_encoding(path)
-    df, meta = load_table(path, sheet=args.sheet, encoding=enc.get("encoding"))
-    
     keys = [k.strip() for k in args.keys.split(",")]
-    df_dedup, info = dedupe(df, keys, args.keep)
+    if sum(map(bool, (args.external, args.index, args.fuzzy))) > 1:
+        raise SystemExit("--external, --index, --fuzzy는 함께 쓸 수 없습니다")
+    if args.merge and (args.external or args.index or args.fuzzy):
+        raise SystemExit("--merge는 --external, --index, --fuzzy와 함께 쓸 수 없습니다")
+    if args.external:
+        return _dedupe_external(args, path, keys)
+
+    index = None
+    if args.index:
+        index = DedupeIndex(args.index, keys=keys, keep=args.keep)
+        if not _is_many(path) and index.applied(path):
+            raise SystemExit(f"이미 인덱스에 반영한 파일입니다: {path}")
+
+    df, meta = _load_input(args, path)
+    df, compact = _compact(args, ensure_df(df))
     
-    print(json.dumps({
+    if index is not None:
+        df_dedup, info = index.dedupe(df)
+    elif args.fuzzy:
+        df_dedup, info = fuzzy_dedupe(df, keys, args.keep, threshold=args.threshold, mark=args.mark)
+    else:
+        try:
+            df_dedup, info = dedupe(df, keys, args.keep, merge=_parse_merge_rules(args.merge))
+        except ValueError as e:
+            raise SystemExit(f"[dedupe] {e}")
+    
+    result = {
         "input_rows": len(df),
         "output_rows": len(df_dedup),
         "removed": info["removed"],
         "keys": info["keys"],
-        "keep": info["keep"]
-    }, ensure_ascii=False, indent=2))
+        "keep": info["keep"],
+        **compact,
+    }
+    if index is not None:
+        result.update({k: info[k] for k in ("removed_in_file", "removed_by_index", "replaced", "index")})
+    if args.fuzzy:
+        result.update({k: v for k, v in info.items() if k not in result})
+    if "merge" in info:
+        result["merge"] = info["merge"]
+    if args.apply:
+        saved = write_table(df_dedup, _auto_out_path(path, "_deduped"), sheet="중복제거본", split=args.split,
+                            compression=args.compress)
+        result = {"saved": saved["path"], **_split_info(saved), **result}
+        if index is not None:
+            # 저장에 성공한 뒤 인덱스 반영 (트랜잭션 하나)
+            result["index_updated"] = index.update(df_dedup, source=None if _is_many(path) else path)
+    if index is not None:
+        index.close()
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+def cmd_dedupe_index(args):
+    """증분 중복 제거 인덱스 만들기/압축/상태"""
+    if args.action == "build":
+        if not args.path:
+            raise SystemExit("usage: dedupe-index build --index <file> --path <files> --keys <열> --keep <규칙>")
+        keys = [k.strip() for k in args.keys.split(",")] if args.keys else None
+        with DedupeIndex(args.index, keys=keys, keep=args.keep) as index:
+            out = index.build(expand_paths(args.path), chunksize=args.chunksize)
+    else:
+        with DedupeIndex(args.index) as index:
+            out = index.compact(before=args.before) if args.action == "compact" else index.info()
+    print(json.dumps(out, ensure_ascii=False, indent=2))
+
+def _dedupe_external(args, path: str, keys: List[str]):
+    """--external: 키 해시 파티션으로 나눠 중복 제거 후 결과를 청크로 저장 (입력은 두 번 읽음)"""
+    if _is_many(path) or getattr(args, "sheet", None) == "*":
+        raise SystemExit("--external은 입력 파일·시트 하나에만 사용할 수 있습니다")
+    if args.compact:
+        raise SystemExit("--external과 --compact는 함께 쓸 수 없습니다")
+    load_kwargs: Dict[str, Any] = {"sheet": getattr(args, "sheet", None),
+                                   "encoding": detect_encoding(path).get("encoding"),
+                                   "engine": getattr(args, "io_engine", None)}
+    if getattr(args, "columns", None):
+        load_kwargs["columns"] = [c.strip() for c in args.columns.split(",") if c.strip()]
+    filters = parse_filters(getattr(args, "where", None))
+    if filters:
+        load_kwargs["filters"] = filters
+    chunks, info = dedupe_external(path, keys, args.keep, memory_mb=args.memory_mb,
+                                   chunksize=args.chunksize, **load_kwargs)
+    result = {"input_rows": info["input_rows"], "output_rows": info["input_rows"] - info["removed"], **info}
+    if args.apply:
+        saved = export_table(chunks, _auto_out_path(path, "_deduped"), sheet="중복제거본", split=args.split,
+                             compression=args.compress)
+        result = {"saved": saved["path"], **_split_info(saved), **result}
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+def _split_info(saved: Dict[str, Any]) -> Dict[str, Any]:
+    """write_table/export_table 결과에서 시트 분할 정보만 (분할되지 않았으면 빈 dict)"""
+    if not saved.get("split"):
+        return {}
+    return {"split": True, "parts": saved["parts"]}
+
+def _add_compact_arg(sp):
+    sp.add_argument("--compact", action="store_true",
+                    help="Shrink dtypes (low-cardinality text → category, integer downcast) before pivot/dedupe/save")
+
+def _compact(args, df: pd.DataFrame):
+    """--compact면 optimize_memory 적용. 반환: (df, JSON 결과에 덧붙일 {"compact": 보고} 또는 {})"""
+    if not getattr(args, "compact", False):
+        return df, {}
+    df, report = optimize_memory(df)
+    return df, {"compact": report}
+
+def _parse_impute_rules(impute_str: str) -> Dict[str, Union[str, Dict[str, Any]]]:
+    """'median:금액;zero:수량'과 같은 결측치 규칙 파싱 ('median:금액@by=카테고리+도시'는 그룹별 대체)"""
+    strategies = {}
+    for rule in (impute_str or "").split(";"):
+        if not rule.strip():
+            continue
+        head, *attrs = rule.split("@")
+        strat, col = head.split(":")
+        by = [b.strip() for a in attrs if a.strip().startswith("by=") for b in a.split("=", 1)[1].split("+")]
+        strategies[col] = {"strategy": strat, "by": by} if by else strat
+    return strategies
+
+def _parse_merge_rules(merge_str: Optional[str]) -> Optional[Dict[str, str]]:
+    """'max:금액;first_non_null:메모;keep:*'와 같은 병합 정책 파싱 (없으면 None)"""
+    if not merge_str:
+        return None
+    rules: Dict[str, str] = {}
+    for rule in merge_str.split(";"):
+        if rule.strip():
+            policy, col = rule.split(":")
+            rules[col.strip()] = policy.strip()
+    return rules
 
 def cmd_preprocess(args):
     """전처리 파이프라인 (정리 + 결측/이상치 처리)"""
@@ -238,39 +486,59 @@ def cmd_preprocess(args):
     if not path:
         raise SystemExit("usage: preprocess --path <file>")
     
-    enc = detect_encoding(path)
-    df, meta = load_table(path, sheet=args.sheet, encoding=enc.get("encoding"))
+    if getattr(args, "stream", False):
+        return _preprocess_stream(args, path)
+    
+    df, meta = _load_input(args, path)
     df = ensure_df(df)
     
+    # 단계마다 df 소유권을 넘겨(copy=False) 전체 사본이 하나만 살아 있게 함
     # 1단계: 기본 정리
-    df = level1_clean(df)
+    df = level1_clean(df, workers=args.jobs, date_output="datetime", copy=False)
     
     # 2단계: 결측치 처리
     if args.impute:
-        # 'median:금액;zero:수량'과 같은 규칙 파싱
-        strategies = {}
-        for rule in args.impute.split(";"):
-            if not rule.strip():
-                continue
-            strat, col = rule.split(":")
-            strategies[col] = strat
-        df = handle_missing_values(df, strategies)
+        df, impute_report = handle_missing_values(df, _parse_impute_rules(args.impute), copy=False, return_report=True)
+        print(f"[impute] 처리 완료: {json.dumps(impute_report, ensure_ascii=False, default=str)}")
 
     # 3단계: 이상치 처리
     if args.outlier:
         # 이상치 규칙 파싱 및 처리
         rules = _parse_outlier_rules(args.outlier)
-        df, outlier_report = outlier(df, rules)
+        df, outlier_report = outlier(df, rules, copy=False)
         if outlier_report.get("outlier"):
             print(f"[outlier] 처리 완료: {json.dumps(outlier_report, ensure_ascii=False)}")
     
+    # 4단계: 메모리 최적화 (--compact)
+    df, compact = _compact(args, df)
+    
     if args.apply:
         out_path = _auto_out_path(path, "_preprocessed")
-        write_table(df, out_path, sheet="전처리본")
-        print(json.dumps({"saved": out_path}, ensure_ascii=False, indent=2))
+        saved = write_table(df, out_path, sheet="전처리본", split=args.split, compression=args.compress)
+        print(json.dumps({"saved": saved["path"], **_split_info(saved), **compact}, ensure_ascii=False, indent=2))
     else:
         print(df.head(20).to_string(index=False))
 
+def _preprocess_stream(args, path: str):
+    """청크 단위 전처리 (--stream): 첫 청크에서 정한 열 결정을 모든 청크에 적용"""
+    chunks, meta = _load_input(args, path, chunksize=args.chunksize)
+    proc = StreamPreprocessor(
+        strategies=_parse_impute_rules(args.impute),
+        outlier_rules=_parse_outlier_rules(args.outlier),
+        workers=args.jobs,
+    )
+    
+    if args.apply:
+        out_path = _auto_out_path(path, "_preprocessed")
+        saved = export_table(proc.run(chunks), out_path, sheet="전처리본", split=args.split,
+                             compression=args.compress)
+        print(json.dumps({"saved": saved["path"], **_split_info(saved), "stream": proc.report},
+                         ensure_ascii=False, indent=2, default=str))
+    else:
+        first = next(proc.run(chunks), None)
+        if first is not None:
+            print(first.head(20).to_string(index=False))
+
 def cmd_replay(args):
     """레시피 실행"""
     print(f"레시피 실행: {args.recipe}")
@@ -286,9 +554,6 @@ def cmd_goldens(args):
 def cmd_validate(args):
     """DSL 검증"""
     import yaml
-    enc = detect_encoding(args.path)
-    df, _ = load_table(args.path, sheet=args.sheet, encoding=enc.get("encoding"))
-    df = ensure_df(df)
     
     # YAML 또는 JSON 파일 읽기
     try:
@@ -301,18 +566,26 @@ def cmd_validate(args):
         print(f"DSL 파일 읽기 오류: {e}")
         return
     
-    from .validate.dsl import validate as vrun
+    from .validate.dsl import validate as vrun, spec_columns
+    # DSL이 검사하는 열만 읽음
+    df, _ = _load_input(args, columns=spec_columns(spec) or None)
+    df = ensure_df(df)
     rep = vrun(df, spec)
     print(json.dumps(rep, ensure_ascii=False, indent=2, default=str))
 
 def cmd_excel_auto(args):
     """자연어 → 피벗/차트 자동 생성"""
-    enc = detect_encoding(args.path)
-    df, meta = load_table(args.path, sheet=args.sheet, encoding=enc.get("encoding"))
-    df = ensure_df(df)
+    # 자연어 의도 파싱 (헤더만 읽어 열 이름 전달)
+    header = _input_columns(args)
+    intent = nl_parse(args.ask, columns=header, parser=args.parser)
+    rows = intent.rows or ["월","카테고리"]
+    vals = intent.values or [("금액","sum")]
+    filters = getattr(intent, "filters", None)
     
-    # 자연어 의도 파싱
-    intent = nl_parse(args.ask, columns=df.columns, parser=args.parser)
+    # 피벗에 쓰는 열만, 필터 조건에 맞는 행만 읽음
+    columns, pushdown = pivot_inputs(header, rows, vals, filters)
+    df, meta = _load_input(args, columns=columns or None, filters=pushdown)
+    df, compact = _compact(args, ensure_df(df))
     
     Path(args.out).parent.mkdir(parents=True, exist_ok=True)
     
@@ -322,8 +595,6 @@ def cmd_excel_auto(args):
             from .autoexcel.engines_com import create_pivot_chart
             tmp_src = "data/automation/_tmp_src.xlsx"
             write_table(df, tmp_src, sheet="원본")
-            rows = intent.rows or ["월","카테고리"]
-            vals = intent.values or [("금액","sum")]
             create_pivot_chart(tmp_src, args.out, "원본", "03_피벗", rows, vals, chart_type=intent.chart or "bar")
             print(json.dumps({"engine": "com", "out": args.out}, ensure_ascii=False, indent=2))
         except Exception as e:
@@ -333,17 +604,18 @@ def cmd_excel_auto(args):
     
     if args.engine == "fallback":
         # Fallback 엔진 사용
-        rows = intent.rows or ["월","카테고리"]
-        vals = intent.values or [("금액","sum")]
-        filters = getattr(intent, "filters", None)
-        shape = create_pivot_from_df(df, args.out, "03_피벗", rows, vals, filters=filters)
+        shape, sheets = create_pivot_from_df(df, args.out, "03_피벗", rows, vals, filters=filters, return_sheets=True)
         if intent.chart:
-            add_chart(args.out, "03_피벗", title="자동 차트", chart_type=intent.chart)
-        print(json.dumps({
+            add_chart(args.out, sheets[0]["sheet"], title="자동 차트", chart_type=intent.chart)
+        result = {
             "engine": "fallback",
             "out": args.out,
-            "pivot_shape": shape
-        }, ensure_ascii=False, indent=2))
+            "pivot_shape": shape,
+            **compact,
+        }
+        if len(sheets) > 1:
+            result["pivot_sheets"] = sheets
+        print(json.dumps(result, ensure_ascii=False, indent=2))
 
 def cmd_excel_formula(args):
     """MoM/YTD 수식 열 자동 추가"""
@@ -359,9 +631,8 @@ def cmd_excel_report(args):
     """Excel 보고서 생성 (표지/KPI/샘플/피벗+차트)"""
     from .report.template import build_report
     
-    # 데이터 로드
-    enc = detect_encoding(args.path)
-    result = load_table(args.path, sheet=args.sheet, encoding=enc.get("encoding"))
+    # 데이터 로드 (시트 미지정 시 첫 시트만 읽음)
+    result = _load_input(args, sheet=args.sheet or 0)
     
     # load_table 결과 처리
     if isinstance(result, tuple):
@@ -421,6 +692,15 @@ def cmd_watch(args):
     cmd = [sys.executable, "tools/watch_run.py", "--dir", args.dir]
     subprocess.run(cmd, check=False)
 
+def cmd_cache(args):
+    """파싱 결과 캐시 상태 확인/비우기"""
+    from .io import cache as input_cache
+    out = {}
+    if args.clear:
+        out["removed"] = input_cache.clear()
+    out.update(input_cache.stats())
+    print(json.dumps(out, ensure_ascii=False, indent=2))
+
 def cmd_undo(args):
     """이전 백업에서 복원"""
     print(f"복원 토큰: {args.token}")
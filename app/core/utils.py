@@ -1,4 +1,3 @@
-import chardet
 from pathlib import Path
 from typing import Dict, Any, Optional
 import pandas as pd
@@ -9,12 +8,16 @@ def ensure_df(x):
         return x[0]
     return x
 
+def ensure_datetime(s: pd.Series) -> pd.Series:
+    """이미 datetime64 열(level1_clean(date_output="datetime") 결과 등)이면 그대로, 아니면 파싱(실패는 NaT)"""
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s
+    return pd.to_datetime(s, errors="coerce")
+
 def detect_encoding(file_path: str) -> Dict[str, Any]:
-    """파일의 인코딩을 감지합니다."""
-    with open(file_path, 'rb') as f:
-        raw_data = f.read()
-        result = chardet.detect(raw_data)
-        return result
+    """파일의 인코딩을 감지합니다. (app.io.loader의 샘플링·캐시 감지기 사용)"""
+    from app.io.loader import detect_encoding as _detect
+    return _detect(file_path)
 
 def load_table(file_path: str, sheet: Optional[str] = None, encoding: Optional[str] = None) -> tuple:
     """테이블을 로드합니다."""
@@ -28,9 +31,9 @@ def load_table(file_path: str, sheet: Optional[str] = None, encoding: Optional[s
 
 def write_table(df, file_path: str, sheet: str = "Sheet1", encoding: str = "utf-8"):
     """테이블을 저장합니다."""
-    import pandas as pd
     if file_path.endswith('.csv'):
         df.to_csv(file_path, index=False, encoding=encoding)
     else:
-        with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name=sheet, index=False)
+        # xlsx는 app.io.loader.write_table (대용량이면 스트리밍 작성기)
+        from app.io.loader import write_table as _write
+        _write(df, file_path, sheet=sheet)
@@ -1,21 +1,19 @@
 from __future__ import annotations
+import os
 import re
+import functools
 import unicodedata
 import logging
+from concurrent.futures import ProcessPoolExecutor
 import warnings
-from typing import Any, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 from dateutil import parser as date_parser
 from app.core.utils import ensure_df
 
 # --- precompiled regex (속도 ↑) ---
-RE_ISO_DATE     = re.compile(r"^\d{4}-\d{1,2}-\d{1,2}$")
-RE_SLASH_DATE   = re.compile(r"^\d{4}/\d{1,2}/\d{1,2}$")
-RE_DOT_DATE     = re.compile(r"^\d{4}\.\d{1,2}\.\d{1,2}$")
-RE_DT_WITH_TIME = re.compile(r"^\d{4}[-/\.]\d{1,2}[-/\.]\d{1,2}[ T]\d{2}:\d{2}:\d{2}$")
-RE_CONTIG_DATE  = re.compile(r"^\d{8}$")  # 새롭게 추가: YYYYMMDD
-
 # 다양한 통화 기호 인식 (₩, 원, $, €, ¥, £ 및 통화 코드)
 RE_HAS_CURRENCY = re.compile(
     r"(?:₩|원|KRW|krw|\$|USD|usd|€|EUR|eur|¥|JPY|jpy|£|GBP|gbp)"
@@ -37,16 +35,55 @@ def _to_snake(name: str) -> str:
     return s.lower()
 
 
-def _snake_columns(df: pd.DataFrame) -> pd.DataFrame:
-    out = df.copy()
+def _snake_columns(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+    out = df.copy() if copy else df
     out.columns = [_to_snake(c) for c in out.columns]
     return out
 
 
+def _transform_uniques(s: pd.Series, *transforms):
+    """문자열 열을 factorize해 고유값(+결측 1칸)에만 transforms를 차례로 적용하고 정수 코드로 다시 펼침.
+    반복이 많은 열(도시, 활성, 금액 등)은 비용이 행 수가 아니라 고유값 수에 비례.
+    마지막 변환이 튜플을 돌려주면 각 결과를 펼친 튜플을 반환
+    """
+    st = s.astype("string")
+    codes, uniques = pd.factorize(st)
+    if len(uniques) * 2 > len(st):
+        # 거의 모두 고유하면 factorize 이득이 없으므로 열 전체에 바로 적용
+        res = st
+        for fn in transforms:
+            res = fn(res)
+        return res
+    u = pd.concat([pd.Series(uniques), pd.Series([pd.NA], dtype=uniques.dtype)], ignore_index=True)
+    codes = np.where(codes < 0, len(uniques), codes)   # 결측은 마지막 칸(NA에 변환을 적용한 결과)
+    for fn in transforms:
+        u = fn(u)
+
+    def _expand(r: pd.Series) -> pd.Series:
+        return pd.Series(r.array.take(codes), index=s.index, name=s.name)
+
+    if isinstance(u, tuple):
+        return tuple(_expand(r) for r in u)
+    return _expand(u)
+
+
+def _trim_values(st: pd.Series) -> pd.Series:
+    return st.str.strip().str.replace(r"\s+", " ", regex=True)
+
+
 def _trim_spaces(s: pd.Series) -> pd.Series:
-    s = s.astype("string")
-    s = s.str.strip().str.replace(r"\s+", " ", regex=True)
-    return s
+    return _transform_uniques(s, _trim_values)
+
+
+def _bool_values(st: pd.Series) -> pd.Series:
+    su = st.str.strip().str.upper()
+    mapped = su.map(BOOL_MAP)              # object dtype, 값은 True/False/np.nan
+    mask = mapped.notna()
+    # 불리언 dtype 시리즈를 만들고, 매핑된 곳만 채움
+    out = pd.Series(pd.NA, index=st.index, dtype="boolean")
+    # astype(bool)로 Python bool 캐스팅 → boolean dtype에 넣기
+    out.loc[mask] = mapped.loc[mask].astype(bool)
+    return out
 
 
 def _normalize_bool(s: pd.Series):
@@ -55,38 +92,208 @@ def _normalize_bool(s: pd.Series):
     - 매핑된 값은 True/False
     - 매핑 실패는 <NA> (문자열을 섞지 않음)
     """
-    su = s.astype("string").str.strip().str.upper()
-    mapped = su.map(BOOL_MAP)              # object dtype, 값은 True/False/np.nan
-    mask = mapped.notna()
-    # 불리언 dtype 시리즈를 만들고, 매핑된 곳만 채움
-    out = pd.Series(pd.NA, index=s.index, dtype="boolean")
-    # astype(bool)로 Python bool 캐스팅 → boolean dtype에 넣기
-    out.loc[mask] = mapped.loc[mask].astype(bool)
-    hit = float(mask.mean())
+    out = _transform_uniques(s, _bool_values)
+    hit = float(out.notna().mean())
     return out, hit
 
 
-def _parse_currency_fast(s: pd.Series, currency_split: bool):
-    st = s.astype("string")
+def _currency_values(st: pd.Series) -> Tuple[pd.Series, pd.Series]:
     has_cur = st.str.contains(RE_HAS_CURRENCY, regex=True, na=False)
     cleaned = st.str.replace(RE_NUM_KEEP, "", regex=True)
-    nums = pd.to_numeric(cleaned, errors="coerce")
+    return pd.to_numeric(cleaned, errors="coerce"), has_cur
+
+
+def _parse_currency_fast(s: pd.Series, currency_split: bool):
+    nums, has_cur = _transform_uniques(s, _currency_values)
     if currency_split:
         cur = pd.Series(np.where(has_cur.to_numpy(), "KRW", None), index=s.index, dtype="object")
         return nums, cur, has_cur.mean()
     return nums, None, has_cur.mean()
 
 
-def _parse_date_fast(
-    s: pd.Series, *, keep_time: bool = False, date_fmt: Optional[str] = None
-) -> Tuple[pd.Series, float]:
+# --- 날짜 형식 추론 ---
+# 값의 숫자를 모두 0으로 바꾼 '모양'(2024년 3월 5일 → 0000년 0월 0일)마다 strptime 형식을 한 번 정하고,
+# 같은 모양의 값은 길이·자릿수 위치가 같으므로 NumPy로 잘라 정수 연산으로 파싱
+_DATE_MARKERS = {"년": "Y", "월": "m", "일": "d", "시": "H", "분": "M", "초": "S"}
+_MERIDIEM = {"오전": "am", "오후": "pm", "AM": "am", "PM": "pm", "am": "am", "pm": "pm"}
+_DATE_LITERAL_CHARS = set(" -/.:T,년월일시분초")
+_DATE_DIRECTIVES = {"Y": "%Y", "y": "%y", "m": "%m", "d": "%d", "H": "%H", "M": "%M", "S": "%S"}
+_NAT_INT = np.iinfo(np.int64).min
+_DAY_NS = 86_400 * 10 ** 9
+_FIXED_WIDTH_BLOCK = 1 << 16   # _parse_fixed_width 한 번에 처리할 행 수
+RE_SHAPE_TOKEN = re.compile(r"0+|[^0]+")
+RE_DIGIT = r"[0-9]"     # \d는 전각 숫자도 포함하므로 ASCII만
+
+DateSpec = Tuple[str, Tuple[Tuple[str, int, int], ...], Optional[str]]
+
+
+def _date_order(lens: List[int], sep: str = "") -> Optional[str]:
+    """표시 없는 숫자 묶음 자릿수(와 첫 구분자) → 날짜 필드 순서.
+    2자리 세 묶음은 '.'/'-' 구분일 때만 국내 관례대로 YY.MM.DD (12/05/24 같은 '/'는 느린 경로에 맡김)"""
+    if len(lens) >= 3 and max(lens[1:3]) <= 2 and lens[0] == 4:
+        return "Ymd"
+    if len(lens) >= 3 and max(lens[:2]) <= 2 and lens[2] == 4:
+        return "mdY"
+    if lens[:3] == [2, 2, 2] and sep.strip() in (".", "-"):
+        return "ymd"
+    if len(lens) == 2 and lens[0] == 4 and lens[1] <= 2:
+        return "Ym"
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _shape_spec(shape: str) -> Optional[DateSpec]:
+    """값 모양 → (strptime 형식, ((필드, 시작, 자릿수), ...), 'am'|'pm'|None). 지원하지 않는 모양은 None
+    - 년/월/일/시/분/초가 붙은 숫자는 그 필드
+    - 나머지 숫자는 앞에서부터 날짜(YYYYMMDD, YYYY-MM-DD, MM/DD/YYYY, YY.MM.DD, YYYY-MM) → 시각(H:M[:S])
+    """
+    parts: List[Any] = []           # 숫자 묶음은 [시작, 자릿수, 필드], 나머지는 문자열
+    meridiem = None
+    pos = 0
+    tokens = RE_SHAPE_TOKEN.findall(shape)
+    for i, t in enumerate(tokens):
+        if t[0] == "0":
+            nxt = tokens[i + 1][0] if i + 1 < len(tokens) else ""
+            parts.append([pos, len(t), _DATE_MARKERS.get(nxt)])
+        else:
+            rest = t
+            for word, ampm in _MERIDIEM.items():
+                if word in rest:
+                    if meridiem:
+                        return None
+                    meridiem, rest = ampm, rest.replace(word, "")
+            if not set(rest) <= _DATE_LITERAL_CHARS:
+                return None
+            parts.append(t)
+        pos += len(t)
+    runs = [p for p in parts if isinstance(p, list)]
+
+    free = [r for r in runs if r[2] is None]
+    if not any(r[2] in ("Y", "y", "m", "d") for r in runs):
+        if free and free[0][1] == 8:
+            free[0][2] = "Ymd"
+        else:
+            nxt = parts.index(free[0]) + 1 if free else len(parts)
+            sep = parts[nxt] if nxt < len(parts) and isinstance(parts[nxt], str) else ""
+            order = _date_order([r[1] for r in free], sep)
+            if order is None:
+                return None
+            for r, role in zip(free, order):
+                r[2] = role
+        free = [r for r in runs if r[2] is None]
+    if len(free) > 3:
+        return None
+    for r, role in zip(free, "HMS"):
+        r[2] = role
+
+    fields: List[Tuple[str, int, int]] = []
+    for start, length, role in runs:
+        if role == "Ymd":
+            fields += [("Y", start, 4), ("m", start + 4, 2), ("d", start + 6, 2)]
+        else:
+            fields.append((role, start, length))
+    roles = [f[0] for f in fields]
+    if len(set(roles)) != len(roles) or not {"Y", "y"} & set(roles) or "m" not in roles:
+        return None
+    for role, _, length in fields:
+        if length != {"Y": 4, "y": 2}.get(role, length) or length > (4 if role == "Y" else 2):
+            return None
+    if meridiem and "H" not in roles:
+        return None
+
+    fmt = ""
+    for p in parts:
+        if isinstance(p, list):
+            fmt += "".join("%I" if meridiem and r == "H" else _DATE_DIRECTIVES[r] for r in p[2])
+        else:
+            for word in _MERIDIEM:
+                p = p.replace(word, "%p")
+            fmt += p
+    return fmt, tuple(fields), meridiem
+
+
+def _date_shapes(st: pd.Series) -> pd.Series:
+    return st.str.replace(RE_DIGIT, "0", regex=True)
+
+
+def _parse_fixed_width(values: np.ndarray, spec: DateSpec) -> np.ndarray:
+    """같은 모양(같은 길이) 문자열 배열 → datetime64[ns] 정수값. 범위를 벗어난 날짜·시각은 NaT"""
+    _, fields, meridiem = spec
+    width = max(len(values[0]), 1)
+    # 글자 코드 행렬(행 × 폭)은 uint32 그대로 두고, 필드가 쓰는 자리만 정수로 (전체를 int64로 바꾸면 폭×8바이트/행)
+    chars = np.asarray(values, dtype=f"<U{width}").view(np.uint32).reshape(len(values), width)
+
+    def field(role: str, default: int) -> np.ndarray:
+        for r, start, length in fields:
+            if r == role:
+                acc = chars[:, start].astype(np.int64) - 48
+                for k in range(1, length):
+                    acc = acc * 10 + (chars[:, start + k].astype(np.int64) - 48)
+                return acc
+        return np.full(len(values), default, dtype=np.int64)
+
+    if any(f[0] == "Y" for f in fields):
+        year = field("Y", 0)
+    else:
+        yy = field("y", 0)
+        year = np.where(yy < 69, 2000 + yy, 1900 + yy)   # strptime %y와 같은 기준
+    month, day = field("m", 1), field("d", 1)
+    hour, minute, sec = field("H", 0), field("M", 0), field("S", 0)
+    ok = (year >= 1678) & (year <= 2261)     # datetime64[ns] 표현 범위
+    ok &= (month >= 1) & (month <= 12) & (day >= 1) & (minute <= 59) & (sec <= 59)
+    if meridiem:
+        ok &= (hour >= 1) & (hour <= 12)
+        hour = hour % 12 + (12 if meridiem == "pm" else 0)
+    ok &= hour <= 23
+
+    ym = (year - 1970) * 12 + np.clip(month, 1, 12) - 1
+    first = ym.astype("datetime64[M]").astype("datetime64[D]").astype(np.int64)
+    days_in_month = (ym + 1).astype("datetime64[M]").astype("datetime64[D]").astype(np.int64) - first
+    ok &= day <= days_in_month
+    ns = (((first + day - 1) * 24 + hour) * 60 + minute) * 60 + sec
+    return np.where(ok, ns * 1_000_000_000, _NAT_INT)
+
+
+def _parse_date_shapes(st: pd.Series) -> pd.Series:
+    """결측 없는 string 시리즈 → datetime64[ns]. 지원하는 모양만 파싱하고 나머지는 NaT"""
+    vals = np.full(len(st), _NAT_INT, dtype=np.int64)
+    if len(st):
+        codes, shapes = pd.factorize(_date_shapes(st))
+        keys = st.to_numpy(dtype=object)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(shapes) + 1))
+        for k, shape in enumerate(shapes):
+            spec = _shape_spec(shape)
+            if spec is not None:
+                # 블록 단위로 잘라 글자 행렬·필드 임시 배열의 최대 크기를 제한
+                for lo in range(bounds[k], bounds[k + 1], _FIXED_WIDTH_BLOCK):
+                    idx = order[lo:min(lo + _FIXED_WIDTH_BLOCK, bounds[k + 1])]
+                    vals[idx] = _parse_fixed_width(keys[idx], spec)
+    return pd.Series(vals.view("datetime64[ns]"), index=st.index)
+
+
+def infer_date_formats(s: pd.Series, limit: int = 5) -> List[str]:
+    """열(또는 표본)의 값 모양에서 strptime 형식을 추론해 많이 쓰인 순으로 반환 (최대 limit개).
+    예: ["%Y년 %m월 %d일", "%y.%m.%d"]. 추론되지 않는 값(영문 월 이름 등)은 느린 경로로 파싱
     """
-    다양한 문자열 날짜를 인식하는 확장된 파서.
+    st = s.astype("string").dropna()
+    counts: Dict[str, int] = {}
+    for shape, n in _date_shapes(st).value_counts().items():
+        spec = _shape_spec(shape)
+        if spec is not None:
+            counts[spec[0]] = counts.get(spec[0], 0) + int(n)
+    return sorted(counts, key=lambda f: -counts[f])[:limit]
+
+
+def _parse_date_values(st: pd.Series, date_fmt: Optional[str] = None) -> pd.Series:
+    """
+    다양한 문자열 날짜를 인식하는 확장된 파서 (string 시리즈 → datetime64[ns]).
     date_fmt가 제공되면 'YYYYMMDD' 같은 형식을 %Y%M%... 형태로 변환해 우선 적용하고,
-    이후 여러 패턴별로 파싱한 뒤 마지막으로 format="mixed" 또는 dateutil 파싱을 시도합니다.
+    남은 값은 모양별로 추론한 형식(_shape_spec)을 NumPy 고정폭 파싱으로 처리합니다.
+    그래도 남은 값(영문 월 이름, 소수 초, 범위 밖 값 등)만 format="mixed" 또는 dateutil로 파싱합니다.
+    값마다 독립적으로 해석되므로 고유값만 넘겨도 결과가 같습니다.
     """
-    st = s.astype("string")
-    out = pd.Series(pd.NaT, index=s.index, dtype="datetime64[ns]")
+    out = pd.Series(pd.NaT, index=st.index, dtype="datetime64[ns]")
 
     # 사용자 정의 포맷 처리
     if date_fmt:
@@ -97,29 +304,13 @@ def _parse_date_fast(
         except Exception:
             pass
 
-    # 간단한 패턴 우선 처리
-    mask_time = st.str.match(RE_DT_WITH_TIME, na=False)
-    if mask_time.any():
-        out.loc[mask_time] = pd.to_datetime(st[mask_time], errors="coerce")
-
-    for regex, fmt in (
-        (RE_ISO_DATE, "%Y-%m-%d"),
-        (RE_SLASH_DATE, "%Y/%m/%d"),
-        (RE_DOT_DATE, "%Y.%m.%d"),
-    ):
-        mask = st.str.match(regex, na=False)
-        if mask.any():
-            out.loc[mask] = pd.to_datetime(st[mask], format=fmt, errors="coerce")
-
-    # 연속 날짜 (YYYYMMDD) 처리
-    mask_contig = st.str.match(RE_CONTIG_DATE, na=False)
-    if mask_contig.any():
-        out.loc[mask_contig] = pd.to_datetime(
-            st[mask_contig], format="%Y%m%d", errors="coerce"
-        )
+    # 모양별 추론 형식 (고정폭 NumPy 파싱)
+    rest = out.isna() & st.notna()
+    if rest.any():
+        out.loc[rest] = _parse_date_shapes(st[rest])
 
     # 남은 값은 format="mixed" 또는 dateutil 파싱
-    mask_remaining = out.isna()
+    mask_remaining = out.isna() & st.notna()
     if mask_remaining.any():
         try:
             # pandas>=2.0 일부 버전에서 지원
@@ -140,16 +331,225 @@ def _parse_date_fast(
             parsed_dates = st[mask_remaining].map(_parse)
             out.loc[mask_remaining] = parsed_dates
 
-    # 문자열 포맷으로 변환
-    if keep_time:
-        result = out.dt.strftime("%Y-%m-%d %H:%M:%S")
-    else:
-        result = out.dt.strftime("%Y-%m-%d")
+    return out.astype("datetime64[ns]")
+
+
+# 문자열 → 파싱 결과(ns 정수, 실패는 NaT) 프로세스 전역 LRU 캐시. date_fmt별로 따로 보관
+DATE_CACHE_MAX = 200_000
+_date_cache: Dict[Optional[str], "OrderedDict[str, int]"] = {}
+_date_cache_stats = {"hits": 0, "misses": 0}
+
+
+def date_cache_info() -> Dict[str, int]:
+    """날짜 파싱 캐시 상태 {"hits", "misses", "size"}"""
+    return {**_date_cache_stats, "size": sum(len(c) for c in _date_cache.values())}
 
-    hit_ratio = float((~out.isna()).mean())
+
+def clear_date_cache() -> None:
+    _date_cache.clear()
+    _date_cache_stats.update(hits=0, misses=0)
+
+
+def _parse_date_cached(keys: np.ndarray, date_fmt: Optional[str]) -> np.ndarray:
+    """고유 문자열 배열 → datetime64[ns] 정수값. 캐시에 없는 값만 모아 한 번에 파싱"""
+    cache = _date_cache.setdefault(date_fmt, OrderedDict())
+    vals = np.empty(len(keys), dtype=np.int64)
+    miss = []
+    for i, k in enumerate(keys):
+        v = cache.get(k)
+        if v is None:
+            miss.append(i)
+        else:
+            vals[i] = v
+            cache.move_to_end(k)
+    _date_cache_stats["hits"] += len(keys) - len(miss)
+    _date_cache_stats["misses"] += len(miss)
+    if miss:
+        miss_keys = keys[miss]
+        parsed = _parse_date_values(pd.Series(miss_keys, dtype="string"), date_fmt)
+        parsed = parsed.to_numpy().view(np.int64)
+        vals[miss] = parsed
+        # 캐시보다 많은 새 값은 넣어도 곧 밀려나므로 마지막 DATE_CACHE_MAX개만 (중간 dict가 커지는 것 방지)
+        keep = slice(max(0, len(miss_keys) - DATE_CACHE_MAX), None)
+        cache.update(zip(miss_keys[keep].tolist(), parsed[keep].tolist()))
+        while len(cache) > DATE_CACHE_MAX:
+            cache.popitem(last=False)
+    return vals
+
+
+def _parse_date_fast(
+    s: pd.Series, *, keep_time: bool = False, date_fmt: Optional[str] = None, as_datetime: bool = False
+) -> Tuple[pd.Series, float]:
+    """
+    문자열 날짜 열을 'YYYY-MM-DD'(keep_time이면 'YYYY-MM-DD HH:MM:SS') 문자열로 표준화.
+    as_datetime이면 문자열 대신 datetime64[ns] 열(keep_time이 아니면 자정으로 내림)을 반환하고,
+    서식은 저장 시점(write_table/Excel 작성기)에 정합니다.
+    열을 factorize해 고유값만 파싱·포맷하고(프로세스 전역 LRU 캐시 사용) 정수 코드로 다시 펼칩니다.
+    반환: (표준화된 열, 파싱 성공 비율)
+    """
+    st = s.astype("string")
+    codes, uniques = pd.factorize(st)
+    keys = np.asarray(uniques, dtype=object)
+    vals = _parse_date_cached(keys, date_fmt)
+
+    if as_datetime:
+        if not keep_time:
+            vals = np.where(vals == _NAT_INT, _NAT_INT, vals // _DAY_NS * _DAY_NS)
+        stamps = np.append(vals, _NAT_INT).view("datetime64[ns]")   # 마지막 칸 = 결측
+        result = pd.Series(stamps[np.where(codes < 0, len(vals), codes)], index=s.index)
+    else:
+        # 문자열 포맷으로 변환 (고유값만)
+        parsed = pd.Series(vals.view("datetime64[ns]"))
+        if keep_time:
+            text = parsed.dt.strftime("%Y-%m-%d %H:%M:%S")
+        else:
+            text = parsed.dt.strftime("%Y-%m-%d")
+        result = pd.Series(text.array.take(codes, allow_fill=True), index=s.index)
+
+    ok = np.zeros(len(codes), dtype=bool)
+    valid = codes >= 0
+    ok[valid] = vals[codes[valid]] != _NAT_INT
+    hit_ratio = float(ok.mean()) if len(ok) else float("nan")
     return result, hit_ratio
 
 
+def _is_text(s: pd.Series) -> bool:
+    return pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s)
+
+
+# 열 유형 계획에 쓰는 표본 행 수 (이보다 짧은 열은 전체로 판단)
+PLAN_SAMPLE_ROWS = 5_000
+
+
+def _ratio(mask: pd.Series) -> float:
+    """불리언 마스크의 True 비율 (빈 시리즈·결측은 0으로)"""
+    if len(mask) == 0:
+        return 0.0
+    return float(mask.fillna(False).astype(bool).mean())
+
+
+def _sample_rows(df: pd.DataFrame, n: int) -> pd.DataFrame:
+    """앞부분에 치우치지 않도록 균등 간격으로 n행 표본 추출"""
+    if len(df) <= n:
+        return df
+    return df.iloc[np.linspace(0, len(df) - 1, n).astype(np.int64)]
+
+
+def _number_values(st: pd.Series) -> pd.Series:
+    return pd.to_numeric(st.str.replace(",", "", regex=False), errors="coerce")
+
+
+def _parse_number(s: pd.Series) -> pd.Series:
+    try:
+        if not _is_text(s):
+            return _number_values(s)
+        return _transform_uniques(s, _number_values)
+    except Exception:
+        return pd.Series(index=s.index, dtype=float)
+
+
+def _classify_column(s: pd.Series, date_fmt: Optional[str]) -> Tuple[str, Dict[str, float]]:
+    """표본 열 하나의 변환 종류를 결정. 판단 순서·기준은 불리언 → 통화/숫자 → 날짜
+    반환: (종류, 단계별 히트율)
+    """
+    hits: Dict[str, float] = {}
+    mapped = s.astype("string").str.strip().str.upper().map(BOOL_MAP)
+    hits["bool"] = _ratio(mapped.notna())
+    # 열의 90% 이상이 불리언으로 매핑되는 경우에만 불리언 컬럼으로 채택
+    if hits["bool"] > 0.9:
+        return "bool", hits
+
+    nums, _, _ = _parse_currency_fast(s, False)
+    conv = _parse_number(s)
+    hits["currency"] = _ratio(s.astype("string").str.contains(RE_HAS_CURRENCY, regex=True, na=False))
+    hits["number"] = _ratio(conv.notna())
+    if hits["currency"] > 0.2 or hits["number"] > 0.5:
+        # 통화가 더 설득력 있으면 채택
+        if hits["currency"] >= 0.2 and nums.notna().sum() >= conv.notna().sum():
+            return "currency", hits
+        return "number", hits
+
+    _, hits["date"] = _parse_date_fast(s, date_fmt=date_fmt)
+    if hits["date"] > 0.6:
+        return "date", hits
+    return "string", hits
+
+
+def _plan_entry(sample: pd.Series, date_fmt: Optional[str]) -> Dict[str, Any]:
+    """표본 열 하나의 계획 로그 {"kind", "hit"} (날짜 열은 추론한 형식 "date_formats"도)"""
+    kind, hits = _classify_column(sample, date_fmt)
+    entry: Dict[str, Any] = {"kind": kind, "hit": {k: round(v, 4) for k, v in hits.items()}}
+    if kind == "date":
+        entry["date_formats"] = infer_date_formats(sample)
+    return entry
+
+
+def _clean_column(
+    s: pd.Series, kind: Optional[str], trim: bool, date_fmt: Optional[str],
+    currency_split: bool, keep_time: bool, date_output: str = "string",
+    sample_rows: int = PLAN_SAMPLE_ROWS,
+) -> Tuple[pd.Series, Optional[pd.Series], str, Optional[Dict[str, Any]]]:
+    """문자열 열 하나 정리: 트림 → (kind가 없으면 표본으로 유형 결정) → 정해진 변환 하나만 실행.
+    프로세스 풀에서도 실행되므로 모듈 최상위 함수.
+    반환: (정리된 열, 통화 열 | None, 유형, 계획 로그 | None)
+    """
+    if trim:
+        s = _trim_spaces(s)
+    entry = None
+    if kind is None:
+        entry = _plan_entry(_sample_rows(s, sample_rows), date_fmt)
+        kind = entry["kind"]
+    cur = None
+    if kind == "bool":
+        s = _normalize_bool(s)[0]
+    elif kind == "currency":
+        s, cur, _ = _parse_currency_fast(s, currency_split)
+    elif kind == "number":
+        s = _parse_number(s)
+    elif kind == "date":
+        s, _ = _parse_date_fast(s, keep_time=keep_time, date_fmt=date_fmt,
+                                as_datetime=date_output == "datetime")
+    return s, cur, kind, entry
+
+
+def _clean_column_task(args):
+    return _clean_column(*args)
+
+
+def plan_columns(
+    df: pd.DataFrame, date_fmt: Optional[str] = "YYYY-MM-DD", sample_rows: int = PLAN_SAMPLE_ROWS
+) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """문자열 열마다 변환 종류('bool'|'currency'|'number'|'date'|'string')를 표본으로 한 번에 결정.
+    반환: (plan, log) — log는 {"sample_rows", "columns": {열: {"kind", "hit": {단계: 비율}}}},
+    날짜 열은 표본에서 추론한 strptime 형식 목록 "date_formats"도 포함
+    """
+    sample = _sample_rows(df, sample_rows)
+    plan: Dict[str, str] = {}
+    cols: Dict[str, Any] = {}
+    for c in df.columns:
+        if not _is_text(df[c]):
+            continue
+        cols[c] = _plan_entry(sample[c], date_fmt)
+        plan[c] = cols[c]["kind"]
+    return plan, {"sample_rows": len(sample), "columns": cols}
+
+
+DATE_OUTPUTS = ("string", "datetime")
+
+_KIND_ORDER = {"bool": 0, "currency": 1, "number": 1, "date": 2}
+
+# workers>1이어도 (행 수 × 문자열 열 수)가 이보다 작으면 프로세스 풀 없이 처리 (시작·전송 비용이 더 큼)
+PARALLEL_MIN_CELLS = 500_000
+
+
+def _resolve_workers(workers: Optional[int], n_tasks: int, n_cells: int) -> int:
+    if not workers or workers == 1 or n_tasks < 2 or n_cells < PARALLEL_MIN_CELLS:
+        return 1
+    if workers < 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, n_tasks))
+
+
 def level1_clean(
     df: pd.DataFrame,
     trim: bool = True,
@@ -158,75 +558,101 @@ def level1_clean(
     drop_empty: bool = True,
     preserve_time_cols = ("업데이트일",),
     return_logs: bool = False,
+    plan: Optional[Dict[str, str]] = None,
+    workers: Optional[int] = None,
+    date_output: str = "string",
+    copy: bool = True,
 ):
     """FastPath 클리닝. 기존 시그니처 호환.
     preserve_time_cols: 시각까지 보존할 컬럼명 리스트 (기본: ['업데이트일'])
     return_logs: True면 (df, type_info, normalize_log) 반환, False면 df만 반환
+      normalize_log: 열 유형 계획 내역 ({"sample_rows", "columns": {열: {"kind", "hit"}}},
+      날짜 열은 추론한 형식 "date_formats" 포함, plan을 받았으면 {"plan": "given"})
+    plan: 이전 실행의 type_info({열: 'bool'|'currency'|'number'|'date'|'string'}).
+          주어지면 히트율 판단 없이 같은 변환을 그대로 적용 (청크 간 결정 고정)
+    workers: 문자열 열을 나눠 처리할 프로세스 수 (None/1이면 현재 프로세스, -1이면 CPU 수).
+          열은 Arrow 기반 string 열로 넘겨 버퍼 단위로 전송하고, 결과는 원래 열 순서로 다시 조립
+    date_output: 'string'이면 날짜 열을 'YYYY-MM-DD' 문자열로(기존 동작), 'datetime'이면 datetime64[ns]로 유지.
+          같은 프로세스에서 이어 쓰는 파이프라인(CLI clean/preprocess, StreamPreprocessor)은 'datetime'을 쓰고
+          서식은 저장 시점(write_table/export_table/Excel 작성기)에 정함
+    copy: False면 df의 소유권을 넘겨받아 복사 없이 열을 바꿔 끼움 (호출자는 이후 원래 df를 쓰지 말 것).
+          파이프라인에서 전체 사본이 하나만 살아 있게 함
+    열 유형은 트림 후 표본(PLAN_SAMPLE_ROWS행)으로 열마다 한 번 정하고, 전체 열에는 정해진 변환 하나만 실행
     """
     df = ensure_df(df)            # ★ 들어오는 게 튜플이어도 방어
+    if date_output not in DATE_OUTPUTS:
+        raise ValueError(f"date_output은 {DATE_OUTPUTS} 중 하나여야 합니다: {date_output}")
     if preserve_time_cols is None:
         preserve_time_cols = ["업데이트일"]
 
-    out = df.copy()
-
-    # 0) 열 이름 표준화
-    out = _snake_columns(out)
+    # 0) 열 이름 표준화 (copy=True여도 복사는 한 번만)
+    out = _snake_columns(df, copy=copy)
     # 디버깅 메시지는 logging을 사용해 출력 (필요 시만)
     logger = logging.getLogger(__name__)
     logger.debug("Columns after snake_case: %s", list(out.columns))
     logger.debug("Columns repr: %s", repr(list(out.columns)))
 
-    # 1) 문자열 트림
-    if trim:
-        for c in out.columns:
-            if pd.api.types.is_object_dtype(out[c]) or pd.api.types.is_string_dtype(out[c]):
-                out[c] = _trim_spaces(out[c])
-
-    # 2) 불리언 표준화
-    for c in out.columns:
-        if pd.api.types.is_object_dtype(out[c]) or pd.api.types.is_string_dtype(out[c]):
-            bool_series, hit = _normalize_bool(out[c])
-            # 열 전체의 90% 이상이 불리언으로 매핑되는 경우에만 불리언 컬럼으로 채택
-            if hit > 0.9:
-                out[c] = bool_series
-            # 그렇지 않으면 원본 유지 (섞지 않음)
-
-    # 3) 통화/숫자 표준화 (벡터화)
-    for c in out.columns:
-        s = out[c]
-        if pd.api.types.is_string_dtype(s) or pd.api.types.is_object_dtype(s):
-            nums, cur, hit = _parse_currency_fast(s, currency_split)
-            # 통화/숫자 히트율로 판단
-            try:
-                conv = pd.to_numeric(s.str.replace(",", "", regex=False), errors="coerce")
-            except Exception:
-                conv = pd.Series(index=s.index, dtype=float)
-            if hit > 0.2 or conv.notna().mean() > 0.5:
-                # 통화가 더 설득력 있으면 채택
-                if hit >= 0.2 and nums.notna().sum() >= conv.notna().sum():
-                    out[c] = nums
-                    if currency_split:
-                        out[f"{c}__currency"] = cur
-                else:
-                    out[c] = conv
-
-    # 4) 날짜 표준화 (포맷 분기) - boolean, date, currency/number 순으로 처리
-    for c in out.columns:
-        s = out[c]
-        if pd.api.types.is_string_dtype(s) or pd.api.types.is_object_dtype(s):
-            keep_time = any(_to_snake(c) == _to_snake(x) for x in preserve_time_cols)
-            parsed, hit = _parse_date_fast(s, keep_time=keep_time, date_fmt=date_fmt)
-            if hit > 0.6:
-                out[c] = parsed
-                logger.debug(f"Date parsing for column '{c}': hit_ratio={hit:.3f}")
-
-    # 5) 빈 행/열 제거
+    if plan is not None:
+        # 계획된 열은 청크별 dtype 추론 결과와 무관하게 문자열로 보고 변환
+        for c, kind in plan.items():
+            if c in out.columns and kind != "string" and not _is_text(out[c]):
+                out[c] = out[c].astype("string")
+
+    # 1) 문자열 열마다 트림 → 유형 결정(표본) → 변환
+    text_pos = [i for i in range(out.shape[1]) if _is_text(out.iloc[:, i])]
+    names = list(out.columns)
+    tasks = []
+    for i in text_pos:
+        c = names[i]
+        s = out.iloc[:, i]
+        keep_time = any(_to_snake(c) == _to_snake(x) for x in preserve_time_cols)
+        tasks.append((s, None if plan is None else plan.get(c, "string"),
+                      trim, date_fmt, currency_split, keep_time, date_output))
+    n_workers = _resolve_workers(workers, len(tasks), len(out) * len(tasks))
+    if n_workers > 1:
+        if trim:
+            # 트림도 string 변환부터 시작하므로 미리 바꿔 Arrow 버퍼로 전송 (object 열 피클 비용 회피)
+            tasks = [(t[0].astype("string"),) + t[1:] for t in tasks]
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(_clean_column_task, tasks))
+    else:
+        results = [_clean_column(*t) for t in tasks]
+
+    # 2) 원래 열 순서로 조립, type_info는 불리언 → 통화/숫자 → 날짜 → 문자열 순
+    type_info: Dict[str, str] = {}
+    log_cols: Dict[str, Any] = {}
+    currency_cols = []
+    for i, (s, cur, kind, entry) in zip(text_pos, results):
+        c = names[i]
+        out.isetitem(i, s)
+        if cur is not None:
+            currency_cols.append((c, cur))
+        if entry is not None:
+            log_cols[c] = entry
+    kinds = {names[i]: r[2] for i, r in zip(text_pos, results)}
+    for c in sorted((c for c in kinds if kinds[c] in _KIND_ORDER), key=lambda c: _KIND_ORDER[kinds[c]]):
+        type_info[c] = kinds[c]
+    for c, cur in currency_cols:
+        out[f"{c}__currency"] = cur
+    for c in kinds:
+        if c not in type_info:
+            type_info[c] = "string"
+    if plan is None:
+        normalize_log = {"sample_rows": min(len(out), PLAN_SAMPLE_ROWS), "columns": log_cols}
+    else:
+        normalize_log = {"plan": "given"}
+
+    # 3) 빈 행/열 제거 (지울 것이 있을 때만 새 프레임을 만듦)
     if drop_empty:
-        out = out.dropna(how="all")
-        out = out.dropna(axis=1, how="all")
+        empty = out.isna()
+        empty_rows = empty.all(axis=1).to_numpy()
+        empty_cols = empty.all(axis=0).to_numpy()
+        del empty
+        if empty_rows.any():
+            out = out.loc[~empty_rows]
+        if empty_cols.any():
+            out = out.loc[:, ~empty_cols]
 
-    type_info = {}        # 필요시 채워 사용
-    normalize_log = {}    # 필요시 채워 사용
     if return_logs:
         return out, type_info, normalize_log
     return out
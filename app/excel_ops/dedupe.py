@@ -1,9 +1,37 @@
 from __future__ import annotations
-from typing import List, Optional, Any, Dict, Union, Tuple, Iterable
+from typing import List, Optional, Any, Dict, Union, Tuple, Iterable, Iterator
+import os
 import re
+import math
+import pickle
+import tempfile
+import numpy as np
 import pandas as pd
 from app.core.utils import ensure_df
 
+# 외부 메모리 중복 제거 (dedupe_external)
+DEDUPE_MEMORY_MB = 512          # 파티션 하나를 메모리에서 처리할 때의 목표 상한
+DEDUPE_CHUNK_ROWS = 100_000     # 입력을 나눠 읽는 행 수
+MAX_PARTITIONS = 256            # 한 번에 여는 스필 파일 수 상한
+MAX_SPLIT_DEPTH = 3             # 큰 파티션을 다른 해시로 다시 나누는 최대 깊이
+_ROW = "__row"
+_KEY = "__key"
+_KEY_SEP = "\x1f"              # 여러 키 열을 이을 때의 구분자
+_KEY_NA = "\x00"               # 결측 키
+
+# 병합 모드 (dedupe(merge=...)): 정책 → groupby 집계 함수. '*' 키는 나머지 열의 기본 정책
+MERGE_POLICIES = {
+    "keep": None,                 # 남는 행(keep 규칙)의 값 그대로
+    "first_non_null": "first",    # 원래 순서에서 처음 나온 비결측 값
+    "last_non_null": "last",      # 원래 순서에서 마지막 비결측 값
+    "max": "max",
+    "min": "min",
+    "sum": "sum",
+    "mean": "mean",
+    "concat": None,               # 서로 다른 비결측 값을 MERGE_SEP로 이어 붙임
+}
+MERGE_SEP = " | "
+
 
 def _to_snake(name: str) -> str:
     if name is None:
@@ -44,29 +72,323 @@ def _map_one(df: pd.DataFrame, key: str) -> str:
     return _map_keys(df, [key])[0]
 
 
-def dedupe(df: pd.DataFrame, keys: Union[str, List[str]], keep: str = "last") -> Tuple[pd.DataFrame, Dict[str, Any]]:
+def _order_values(s: pd.Series) -> np.ndarray:
+    """last_by 기준 열 → 크기 비교용 정수/실수 배열 (결측은 가장 작은 값, 전체 정렬 없음)"""
+    if pd.api.types.is_datetime64_any_dtype(s.dtype):
+        if getattr(s.dtype, "tz", None) is not None:
+            s = s.dt.tz_convert(None)
+        return s.to_numpy(dtype="datetime64[ns]").view(np.int64)   # NaT = int64 최솟값
+    if pd.api.types.is_bool_dtype(s.dtype) or pd.api.types.is_numeric_dtype(s.dtype):
+        if pd.api.types.is_integer_dtype(s.dtype) and not s.hasnans:
+            return s.to_numpy(dtype=np.int64)
+        return s.to_numpy(dtype="float64", na_value=-np.inf)
+    # 문자열 등: 고유값만 정렬해 순위 코드로 (결측 -1)
+    codes, _ = pd.factorize(s, sort=True)
+    return codes
+
+
+def _last_by_mask(df: pd.DataFrame, keys: List[str], by: str) -> np.ndarray:
+    """키 그룹마다 by 값이 가장 큰 행 하나(같으면 먼저 나온 행)만 True. 해시 그룹핑이라 행을 정렬하지 않음"""
+    groups = df.groupby(keys, sort=False, dropna=False).ngroup().to_numpy()
+    order = _order_values(df[by])
+    best = pd.Series(order).groupby(groups, sort=False).transform("max").to_numpy()
+    cand = np.flatnonzero(order == best)
+    mask = np.zeros(len(df), dtype=bool)
+    mask[cand[~pd.Series(groups[cand]).duplicated().to_numpy()]] = True
+    return mask
+
+
+def _policy_fits(s: pd.Series, policy: str) -> bool:
+    """정책의 집계를 열 dtype에 적용할 수 있는지 (sum/mean은 숫자·기간, max/min은 비교 가능한 값만)"""
+    dtype = s.dtype
+    if pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_timedelta64_dtype(dtype):
+        return True
+    if policy == "sum":
+        return False
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return True
+    if policy == "mean":
+        return False
+    if policy in ("max", "min"):
+        return pd.api.types.infer_dtype(s, skipna=True) in ("string", "empty")
+    return True
+
+
+def _merge_policies(df: pd.DataFrame, keys: List[str],
+                    merge: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """{열(사용자 입력형) 또는 '*': 정책} → ({실제 열: 정책}, {dtype에 맞지 않아 keep으로 둔 열: 정책})
+    'keep'은 제외, 키 열은 병합하지 않음. 명시한 열의 정책이 dtype에 맞지 않으면 ValueError,
+    '*' 기본 정책이 맞지 않는 열은 keep으로 둠"""
+    bad = sorted({p for p in merge.values() if p not in MERGE_POLICIES})
+    if bad:
+        raise ValueError(f"지원하지 않는 병합 정책: {bad} / 사용 가능: {list(MERGE_POLICIES)}")
+    default = merge.get("*", "keep")
+    explicit = {_map_one(df, c): p for c, p in merge.items() if c != "*"}
+    clash = [c for c in explicit if c in keys]
+    if clash:
+        raise ValueError(f"키 열은 병합할 수 없습니다: {clash}")
+    mismatch = [f"{c}({df[c].dtype}): {p}" for c, p in explicit.items() if not _policy_fits(df[c], p)]
+    if mismatch:
+        raise ValueError(f"열 dtype에 적용할 수 없는 병합 정책: {mismatch}")
+    policies = {c: explicit.get(c, default) for c in df.columns if c not in keys}
+    skipped = {c: p for c, p in policies.items() if c not in explicit and not _policy_fits(df[c], p)}
+    return {c: p for c, p in policies.items() if p != "keep" and c not in skipped}, skipped
+
+
+def _concat_groups(s: pd.Series, groups: np.ndarray, n_groups: int) -> pd.Series:
+    """그룹별 서로 다른 비결측 값을 나온 순서대로 MERGE_SEP로 연결 (값이 없으면 결측)"""
+    pairs = pd.DataFrame({"g": groups, "v": s.to_numpy()}).dropna().drop_duplicates()
+    pairs = pairs.sort_values("g", kind="stable")
+    g = pairs["g"].to_numpy()
+    values = pairs["v"].astype(str).to_numpy(dtype=object)
+    if not len(values):
+        return pd.Series([np.nan] * n_groups, dtype=object)
+    starts = np.flatnonzero(np.r_[True, g[1:] != g[:-1]])
+    tail = np.ones(len(values), dtype=bool)
+    tail[starts] = False
+    values[tail] = MERGE_SEP + values[tail]              # 그룹 두 번째 값부터 구분자를 붙여 한 번에 이어 붙임
+    joined = pd.Series(np.add.reduceat(values, starts), index=g[starts], dtype=object)
+    return joined.reindex(range(n_groups))
+
+
+def _merge_rows(df: pd.DataFrame, keys: List[str], mask: np.ndarray,
+                merge: Dict[str, str]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """남길 행(mask)에 같은 키 그룹의 값을 정책별로 합침 — 그룹핑 한 번, 정책마다 벡터화 집계 한 번.
+    보고: filled_cells = 남는 행에서 결측이었는데 버려진 행의 값으로 채워진 셀 수"""
+    policies, skipped = _merge_policies(df, keys, merge)
+    result = df[mask]
+    report: Dict[str, Any] = {"policies": policies, "filled_cells": 0, "filled": {}}
+    if skipped:
+        report["skipped"] = {c: f"skip:not_applicable:{p}" for c, p in skipped.items()}
+    if not policies:
+        return result, report
+
+    groups = df.groupby(keys, sort=False, dropna=False).ngroup().to_numpy()
+    n_groups = int(groups.max()) + 1 if len(groups) else 0
+    kept = groups[mask]
+    by_policy: Dict[str, List[str]] = {}
+    for col, policy in policies.items():
+        by_policy.setdefault(policy, []).append(col)
+
+    grouped = df[list(policies)].groupby(groups, sort=True)   # 결과 행 위치 = 그룹 번호
+    result = result.copy()
+    for policy, cols in by_policy.items():
+        if policy == "concat":
+            agg = pd.DataFrame({c: _concat_groups(df[c], groups, n_groups) for c in cols})
+        elif policy == "sum":
+            agg = grouped[cols].sum(min_count=1)               # 전부 결측인 그룹은 0이 아니라 결측
+        else:
+            agg = grouped[cols].agg(MERGE_POLICIES[policy])
+        for col in cols:
+            merged = agg[col].iloc[kept].set_axis(result.index)
+            filled = int((result[col].isna() & merged.notna()).sum())
+            report["filled"][col] = filled
+            report["filled_cells"] += filled
+            result[col] = merged
+    return result, report
+
+
+def dedupe(df: pd.DataFrame, keys: Union[str, List[str]], keep: str = "last",
+           merge: Optional[Dict[str, str]] = None) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     """
     keys: 중복 판단 키 목록(사용자 입력형). 내부에서 실제 컬럼명으로 매핑함.
     keep: 'first' | 'last' | 'last_by:<열명>'
+    merge: {열명 또는 '*': 정책} — keep 규칙으로 고른 행에 버려지는 중복 행의 값을 합침
+           (정책: MERGE_POLICIES, 예: {"금액": "max", "메모": "first_non_null"}). 보고에 merge 항목 추가
+    키를 해시로 묶어 남길 행을 고르므로 정렬하지 않고, 결과는 원래 행 순서를 유지함
     """
     df = ensure_df(df)  # ★ 방어
-    out = df.copy()
+    out = df            # 행 선택만 하므로 입력은 수정하지 않음 (복사 불필요)
     if not keys or (isinstance(keys, (list, tuple)) and len(keys) == 0):
+        if merge:
+            raise ValueError("병합 모드(merge)에는 중복 판단 키가 필요합니다")
         before = len(out)
         result = out.drop_duplicates(keep=("last" if keep == "last" else "first"))
         return result, {"keys": "ALL", "removed": before - len(result), "keep": keep}
 
     keys_real = _map_many(out, keys)
     before = len(out)
+    extra: Dict[str, Any] = {}
 
     if isinstance(keep, str) and keep.startswith("last_by:"):
         by_raw = keep.split(":", 1)[1]
         by_real = _map_one(out, by_raw)
-        result = (
-            out.sort_values(by=[by_real] + keys_real, ascending=[False] + [True]*len(keys_real))
-               .drop_duplicates(subset=keys_real, keep="first")
-        )
-        return result, {"keys": keys_real, "removed": before - len(result), "keep": keep, "sorted_by": by_real}
-
-    result = out.sort_values(keys_real).drop_duplicates(subset=keys_real, keep=("last" if keep == "last" else "first"))
-    return result, {"keys": keys_real, "removed": before - len(result), "keep": keep}
+        mask = _last_by_mask(out, keys_real, by_real)
+        extra["sorted_by"] = by_real
+    else:
+        mask = ~out.duplicated(subset=keys_real, keep=("last" if keep == "last" else "first")).to_numpy()
+
+    if merge:
+        result, extra["merge"] = _merge_rows(out, keys_real, mask, merge)
+    else:
+        result = out[mask]
+    return result, {"keys": keys_real, "removed": before - len(result), "keep": keep, **extra}
+
+
+def _key_strings(df: pd.DataFrame, keys: List[str]) -> pd.Series:
+    """키 열 → 파일마다 dtype 추론이 달라도 같은 값이면 같은 문자열 (5와 5.0, 결측 포함)"""
+    parts = []
+    for c in keys:
+        s = df[c]
+        if pd.api.types.is_float_dtype(s.dtype):
+            f = s.astype("float64")
+            txt = f.astype("string")
+            whole = f.notna() & np.isfinite(f) & (f == np.floor(f)) & (f.abs() < 2**63)
+            txt[whole] = f[whole].astype("int64").astype("string")
+        else:
+            txt = s.astype("string")
+        parts.append(txt.fillna(_KEY_NA))
+    out = parts[0]
+    for p in parts[1:]:
+        out = out.str.cat(p, sep=_KEY_SEP)
+    return out.astype(object)
+
+
+def _partition_ids(keys: pd.DataFrame, n_parts: int, depth: int) -> np.ndarray:
+    """키 행 → 파티션 번호. 청크마다 dtype 추론이 달라도(int/float, object/string) 같은 키는 같은 파티션"""
+    canon = {}
+    for c in keys.columns:
+        s = keys[c]
+        numeric = pd.api.types.is_numeric_dtype(s.dtype) and not pd.api.types.is_bool_dtype(s.dtype)
+        # 문자열 해시는 NUL 문자(결측 키 표시 _KEY_NA)가 있으면 같은 값도 프레임마다 달라지므로 바꿔서 해시
+        # (파티션이 겹치는 것은 무해: 파티션 안에서는 원래 키로 비교)
+        canon[c] = s.astype("float64") if numeric else s.astype("string").str.replace("\x00", "\x01", regex=False)
+    h = pd.util.hash_pandas_object(pd.DataFrame(canon), index=False, hash_key=f"sec-dedupe-{depth:05d}")
+    return (h.to_numpy() % np.uint64(n_parts)).astype(np.int64)
+
+
+def _spill(frames: Iterable[pd.DataFrame], keys: List[str], n_parts: int, depth: int, tmp: str) -> List[str]:
+    """프레임들을 키 해시로 n_parts개 파일에 나눠 기록 (파일마다 pickle된 조각이 입력 순서대로 이어짐)"""
+    folder = tempfile.mkdtemp(prefix=f"d{depth}_", dir=tmp)
+    paths = [os.path.join(folder, f"{i}.pkl") for i in range(n_parts)]
+    files = [open(p, "wb") for p in paths]
+    try:
+        for frame in frames:
+            if not len(frame):
+                continue
+            part = _partition_ids(frame[keys], n_parts, depth)
+            order = np.argsort(part, kind="stable")
+            bounds = np.searchsorted(part[order], np.arange(n_parts + 1))
+            for i in np.flatnonzero(np.diff(bounds)):
+                pickle.dump(frame.iloc[order[bounds[i]:bounds[i + 1]]], files[i], protocol=pickle.HIGHEST_PROTOCOL)
+    finally:
+        for f in files:
+            f.close()
+    return paths
+
+
+def _read_spill(path: str) -> Iterator[pd.DataFrame]:
+    with open(path, "rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+def _kept_rows(part: pd.DataFrame, keys: List[str], keep: str, by: Optional[str]) -> np.ndarray:
+    """파티션(행 번호 순) 안에서 dedupe와 같은 규칙으로 남길 행 번호"""
+    if by is not None:
+        mask = _last_by_mask(part, keys, by)
+    else:
+        mask = ~part.duplicated(subset=keys, keep=("last" if keep == "last" else "first")).to_numpy()
+    return part[_ROW].to_numpy()[mask]
+
+
+def _dedupe_partition(path: str, keys: List[str], keep: str, by: Optional[str],
+                      budget: int, depth: int, tmp: str, stats: Dict[str, int]) -> Iterator[np.ndarray]:
+    """스필 파일 하나 처리. 예산보다 크면 다른 해시로 다시 나눠 재귀 처리"""
+    size = os.path.getsize(path)
+    stats["spill_bytes"] += size
+    if size > budget and depth < MAX_SPLIT_DEPTH:
+        n_sub = min(MAX_PARTITIONS, max(2, math.ceil(size / budget)))
+        subs = _spill(_read_spill(path), keys, n_sub, depth + 1, tmp)
+        os.remove(path)
+        stats["partitions"] += n_sub - 1
+        for sub in subs:
+            yield from _dedupe_partition(sub, keys, keep, by, budget, depth + 1, tmp, stats)
+        return
+    pieces = list(_read_spill(path))
+    os.remove(path)
+    if pieces:
+        yield _kept_rows(pd.concat(pieces, ignore_index=True), keys, keep, by)
+
+
+def dedupe_external(
+    path: str,
+    keys: Union[str, List[str], None],
+    keep: str = "last",
+    memory_mb: float = DEDUPE_MEMORY_MB,
+    chunksize: int = DEDUPE_CHUNK_ROWS,
+    tmp_dir: Optional[str] = None,
+    **load_kwargs: Any,
+) -> Tuple[Iterator[pd.DataFrame], Dict[str, Any]]:
+    """메모리에 다 올릴 수 없는 파일의 중복 제거 (dedupe와 같은 keep/last_by 규칙, 원래 행 순서 유지).
+
+    1) 키(+last_by 기준) 열만 청크로 읽어 정규화 문자열 키(_key_strings)와 행 번호를
+       키 해시 파티션 파일(tmp_dir)에 나눠 기록
+    2) 파티션마다 메모리에서 남길 행 번호를 고름 (memory_mb보다 큰 파티션은 다른 해시로 다시 나눔)
+    3) 입력을 다시 청크로 읽으며 남길 행만 내보냄 — 반환 이터레이터를 export_table 등에 바로 넘김
+    load_kwargs: load_table 옵션 (sheet, encoding, engine, filters, columns — columns는 내보낼 열)
+    반환: (청크 이터레이터, report) — report는 dedupe 보고에 input_rows/partitions/spill_bytes/memory_mb 추가
+    """
+    from app.io.loader import load_table, read_columns
+
+    columns = load_kwargs.pop("columns", None)
+    load_kwargs.setdefault("cache", False)
+    header = read_columns(path, load_kwargs.get("sheet"), load_kwargs.get("encoding"))
+    if columns is not None:
+        header = [c for c in header if c in set(columns)]
+    header = pd.DataFrame(columns=header)
+    keys_real = _map_many(header, keys) if keys else list(header.columns)
+    by_real = None
+    if keys and isinstance(keep, str) and keep.startswith("last_by:"):
+        by_real = _map_one(header, keep.split(":", 1)[1])
+    needed = list(dict.fromkeys(keys_real + ([by_real] if by_real else [])))
+
+    budget = max(1, int(memory_mb * 2**20))
+    n_parts = min(MAX_PARTITIONS, max(1, math.ceil(os.path.getsize(path) / budget)))
+    total = 0
+
+    def key_chunks() -> Iterator[pd.DataFrame]:
+        nonlocal total
+        chunks, _ = load_table(path, chunksize=chunksize, columns=needed, **load_kwargs)
+        for chunk in chunks:
+            # 청크마다 dtype 추론이 달라도(1 / 1.0 / "1") 같은 키가 같은 값이 되도록 정규화 문자열 키 하나로
+            part = pd.DataFrame({_KEY: _key_strings(chunk, keys_real).astype("string").to_numpy()})
+            if by_real:
+                part[by_real] = chunk[by_real].to_numpy()
+            part[_ROW] = np.arange(total, total + len(part), dtype=np.int64)
+            total += len(part)
+            yield part
+
+    stats = {"partitions": n_parts, "spill_bytes": 0}
+    with tempfile.TemporaryDirectory(prefix="sec_dedupe_", dir=tmp_dir) as tmp:
+        spills = _spill(key_chunks(), [_KEY], n_parts, 0, tmp)
+        keep_mask = np.zeros(total, dtype=bool)
+        for path_i in spills:
+            for rows in _dedupe_partition(path_i, [_KEY], keep, by_real, budget, 0, tmp, stats):
+                keep_mask[rows] = True
+
+    report: Dict[str, Any] = {
+        "keys": keys_real if keys else "ALL",
+        "removed": int(total - keep_mask.sum()),
+        "keep": keep,
+        "input_rows": total,
+        "partitions": stats["partitions"],
+        "spill_bytes": stats["spill_bytes"],
+        "memory_mb": memory_mb,
+    }
+    if by_real:
+        report["sorted_by"] = by_real
+
+    def kept_chunks() -> Iterator[pd.DataFrame]:
+        chunks, _ = load_table(path, chunksize=chunksize, columns=columns, **load_kwargs)
+        pos = 0
+        for chunk in chunks:
+            sel = keep_mask[pos:pos + len(chunk)]
+            pos += len(chunk)
+            if sel.any():
+                yield chunk[sel]
+
+    return kept_chunks(), report
@@ -0,0 +1,232 @@
+# app/excel_ops/dedupe_index.py
+"""
+증분 중복 제거용 영구 키 인덱스 (SQLite)
+매일 들어오는 파일을 지난 기록 전체와 다시 합치지 않고, 키마다 남은 행의 기준값만 로컬에 보관해
+새 파일을 그 크기에 비례하는 시간으로 중복 제거합니다.
+
+- entries(k, v): 키(여러 열이면 구분자로 이은 정규화 문자열) → last_by 기준값(first/last는 NULL)
+- 새 파일은 임시 표에 넣고 키 기본 인덱스로 조인해 남길 행을 고름
+- 반영(update)은 트랜잭션 하나로 실행 (중간에 실패하면 이전 상태 그대로)
+- 반영한 파일은 지문(app.io.cache.fingerprint)으로 기록해 같은 파일을 두 번 반영하지 않음
+
+keep 규칙 (이전 파일의 행이 항상 먼저 나온 행):
+- first: 인덱스에 없는 키만 남김
+- last: 새 파일의 행이 이전 행을 대체 (모두 남기고 대체된 키 수를 보고)
+- last_by:<열>: 인덱스에 없거나 기준값이 더 큰 행만 남김 (같으면 이전 행, 결측은 가장 작은 값)
+"""
+from __future__ import annotations
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+from app.core.utils import ensure_df
+from app.io.cache import fingerprint
+from .dedupe import dedupe, _map_many, _map_one, _to_snake, _key_strings
+
+_INSERT_BATCH = 50_000
+
+
+def _order_column(s: pd.Series) -> List[Any]:
+    """last_by 기준 열 → SQLite에 저장·비교할 값 (숫자는 숫자, 날짜는 CSV 저장과 같은 텍스트, 결측은 None)"""
+    if pd.api.types.is_datetime64_any_dtype(s.dtype):
+        if getattr(s.dtype, "tz", None) is not None:
+            s = s.dt.tz_convert(None)
+        midnight = s.dt.normalize() == s
+        txt = s.dt.strftime("%Y-%m-%d %H:%M:%S").where(~midnight, s.dt.strftime("%Y-%m-%d"))
+        return txt.astype(object).where(s.notna(), None).tolist()
+    if pd.api.types.is_bool_dtype(s.dtype) or pd.api.types.is_numeric_dtype(s.dtype):
+        return s.astype(object).where(s.notna(), None).tolist()
+    return s.astype("string").astype(object).where(s.notna(), None).tolist()
+
+
+class DedupeIndex:
+    """키별 최신 기준값을 보관하는 SQLite 인덱스.
+
+    with DedupeIndex("data/history.sqlite", keys=["거래ID"], keep="last_by:업데이트일") as idx:
+        out, report = idx.dedupe(today)        # 오늘 파일 안 + 이전 파일과의 중복 제거 (인덱스는 그대로)
+        save(out); idx.update(out, source="today.csv")   # 저장에 성공한 뒤 반영
+    keys/keep은 처음 만들 때 기록되고, 이후 다른 값으로 열면 ValueError
+    """
+
+    def __init__(self, path: Union[str, Path], keys: Optional[Iterable[str]] = None, keep: Optional[str] = None):
+        self.path = Path(path)
+        keys = None if keys is None else list(keys)    # 이터레이터여도 아래에서 여러 번 읽음
+        exists = self.path.exists()
+        if not exists:
+            if not keys or not keep:
+                raise FileNotFoundError(f"인덱스가 없습니다: {self.path} (새로 만들려면 keys와 keep 필요)")
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        if not exists and keys and keep:
+            self._create(keys, keep)
+        meta = dict(self.conn.execute("SELECT k, v FROM meta"))
+        self.keys: List[str] = json.loads(meta["keys"])
+        self.keep: str = meta["keep"]
+        if keys and [_to_snake(k) for k in keys] != self.keys:
+            raise ValueError(f"인덱스 키가 다릅니다: {self.keys} (요청: {list(keys)})")
+        if keep and keep != self.keep:
+            raise ValueError(f"인덱스 keep 규칙이 다릅니다: {self.keep} (요청: {keep})")
+        self.by: Optional[str] = self.keep.split(":", 1)[1] if self.keep.startswith("last_by:") else None
+
+    def _create(self, keys: List[str], keep: str) -> None:
+        if keep not in ("first", "last") and not keep.startswith("last_by:"):
+            raise ValueError(f"알 수 없는 keep 규칙: {keep} (first/last/last_by:<열>)")
+        with self.conn:
+            self.conn.execute("BEGIN")
+            self.conn.execute("CREATE TABLE meta (k TEXT PRIMARY KEY, v TEXT)")
+            self.conn.execute("CREATE TABLE entries (k TEXT PRIMARY KEY, v) WITHOUT ROWID")
+            self.conn.execute("CREATE TABLE files (fingerprint TEXT PRIMARY KEY, path TEXT, rows INTEGER, applied_at REAL)")
+            self.conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+                ("keys", json.dumps([_to_snake(k) for k in keys], ensure_ascii=False)),
+                ("keep", keep),
+                ("created_at", str(time.time())),
+            ])
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "DedupeIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ── 새 파일 중복 제거 ────────────────────────────────────────────
+    def _condition(self) -> str:
+        """배치 행 b가 인덱스 행 i(없으면 NULL)보다 우선하는 조건"""
+        if self.keep == "first":
+            return "i.k IS NULL"
+        if self.keep == "last":
+            return "1"
+        return "i.k IS NULL OR (b.v IS NOT NULL AND (i.v IS NULL OR b.v > i.v))"
+
+    def _load_batch(self, df: pd.DataFrame) -> None:
+        """파일 안 중복을 제거한 df를 임시 표 batch(k, v, pos)에 적재"""
+        keys_real = _map_many(df, self.keys)
+        k = _key_strings(df, keys_real).tolist()
+        v = _order_column(df[_map_one(df, self.by)]) if self.by else [None] * len(df)
+        self.conn.execute("DROP TABLE IF EXISTS temp.batch")
+        self.conn.execute("CREATE TEMP TABLE batch (k TEXT PRIMARY KEY, v, pos INTEGER) WITHOUT ROWID")
+        for lo in range(0, len(df), _INSERT_BATCH):
+            hi = lo + _INSERT_BATCH
+            self.conn.executemany("INSERT INTO batch VALUES (?, ?, ?)", zip(k[lo:hi], v[lo:hi], range(lo, min(hi, len(df)))))
+
+    def dedupe(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """파일 안의 중복과 이전 파일과의 중복을 제거 (인덱스는 바꾸지 않음 — 반영은 update).
+        반환: (df, report) — report는 dedupe 보고에 removed_in_file/removed_by_index/replaced 추가
+        """
+        df = ensure_df(df)
+        own, info = dedupe(df, self.keys, self.keep)
+        self._load_batch(own)
+        cond = self._condition()
+        rows = self.conn.execute(
+            f"SELECT b.pos, i.k IS NOT NULL FROM batch b LEFT JOIN entries i ON i.k = b.k WHERE {cond}").fetchall()
+        self.conn.execute("DROP TABLE temp.batch")
+        pos = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+        pos.sort()
+        result = own.iloc[pos]
+        report = {**info,
+                  "removed": len(df) - len(result),
+                  "removed_in_file": info["removed"],
+                  "removed_by_index": len(own) - len(result),
+                  "replaced": int(sum(r[1] for r in rows)),
+                  "index": str(self.path)}
+        return result, report
+
+    # ── 인덱스 반영 ─────────────────────────────────────────────────
+    def applied(self, source: Union[str, Path]) -> bool:
+        """이미 반영한 파일인지 (파일 지문 기준)"""
+        return self.conn.execute("SELECT 1 FROM files WHERE fingerprint = ?", (fingerprint(str(source)),)).fetchone() is not None
+
+    def update(self, df: pd.DataFrame, source: Union[str, Path, None] = None) -> int:
+        """df의 키·기준값을 인덱스에 반영 (트랜잭션 하나). source 파일은 반영 기록에 남김.
+        반환: 추가되거나 기준값이 바뀐 키 수
+        """
+        df = ensure_df(df)
+        own, _ = dedupe(df, self.keys, self.keep)
+        cond = self._condition()
+        upsert = ("DO NOTHING" if self.keep == "first" else
+                  "DO UPDATE SET v = excluded.v" if self.keep == "last" else
+                  "DO UPDATE SET v = excluded.v WHERE excluded.v IS NOT NULL AND (entries.v IS NULL OR excluded.v > entries.v)")
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._load_batch(own)
+            changed = self.conn.execute(
+                f"SELECT count(*) FROM batch b LEFT JOIN entries i ON i.k = b.k WHERE {cond}").fetchone()[0]
+            self.conn.execute(f"INSERT INTO entries (k, v) SELECT k, v FROM batch WHERE 1 ON CONFLICT(k) {upsert}")
+            self.conn.execute("DROP TABLE temp.batch")
+            if source is not None:
+                self._record_file(source, len(df))
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('updated_at', ?)", (str(time.time()),))
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return int(changed)
+
+    def _record_file(self, source: Union[str, Path], rows: int) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                          (fingerprint(str(source)), str(source), rows, time.time()))
+
+    def build(self, paths: Iterable[str], chunksize: int = 100_000, **load_kwargs: Any) -> Dict[str, Any]:
+        """이전 파일들(오래된 것부터)을 청크로 읽어 인덱스에 반영. 이미 반영한 파일은 건너뜀"""
+        from app.io.loader import load_table
+        load_kwargs.setdefault("cache", False)
+        done: List[Dict[str, Any]] = []
+        for p in paths:
+            if self.applied(p):
+                done.append({"path": str(p), "skipped": True})
+                continue
+            rows = changed = 0
+            chunks, _ = load_table(str(p), chunksize=chunksize, **load_kwargs)
+            for chunk in chunks:
+                changed += self.update(chunk)
+                rows += len(chunk)
+            # 파일 기록은 마지막에 한 번 (중간에 실패하면 다시 build할 때 처음부터 반영)
+            self._record_file(p, rows)
+            done.append({"path": str(p), "rows": rows, "changed": changed})
+        return {**self.info(), "built": done}
+
+    # ── 관리 ───────────────────────────────────────────────────────
+    def compact(self, before: Any = None) -> Dict[str, Any]:
+        """before가 있으면 기준값이 그보다 작은 키를 지운 뒤(last_by 인덱스만) VACUUM/ANALYZE"""
+        size = self._size()
+        removed = 0
+        if before is not None:
+            if not self.by:
+                raise ValueError("before는 last_by 인덱스에만 사용할 수 있습니다")
+            if isinstance(before, str):
+                try:
+                    before = float(before)      # 숫자 기준 열 (SQLite는 숫자 < 텍스트로 비교)
+                except ValueError:
+                    pass
+            with self.conn:
+                self.conn.execute("BEGIN IMMEDIATE")
+                removed = self.conn.execute("DELETE FROM entries WHERE v < ?", (before,)).rowcount
+        self.conn.execute("VACUUM")
+        self.conn.execute("ANALYZE")
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")     # VACUUM 결과가 WAL에 남지 않게
+        return {"removed": removed, "bytes_before": size, "bytes_after": self._size()}
+
+    def _size(self) -> int:
+        return sum(os.path.getsize(p) for p in (self.path, Path(f"{self.path}-wal")) if p.exists())
+
+    def info(self) -> Dict[str, Any]:
+        """인덱스 상태: 키·규칙, 항목 수, 반영한 파일 수·최근 파일, 크기"""
+        recent = self.conn.execute("SELECT path, rows FROM files ORDER BY applied_at DESC LIMIT 5").fetchall()
+        meta = dict(self.conn.execute("SELECT k, v FROM meta"))
+        return {
+            "index": str(self.path),
+            "keys": self.keys,
+            "keep": self.keep,
+            "entries": self.conn.execute("SELECT count(*) FROM entries").fetchone()[0],
+            "files": self.conn.execute("SELECT count(*) FROM files").fetchone()[0],
+            "recent_files": [{"path": p, "rows": r} for p, r in recent],
+            "updated_at": float(meta["updated_at"]) if "updated_at" in meta else None,
+            "bytes": self._size(),
+        }
@@ -0,0 +1,223 @@
+# app/excel_ops/fuzzy.py
+"""
+유사 중복(퍼지) 제거
+상호명·거래처명처럼 띄어쓰기, 주식회사/(주) 표기, 오타만 다른 행을 같은 묶음(클러스터)으로 모으고
+묶음마다 한 행(survivor)만 남깁니다. 모든 쌍을 비교하지 않고 블로킹으로 후보 쌍만 만들어 거의 선형 시간.
+
+1) 정규화: NFKC, 소문자, 회사 형태 표기(주식회사·(주)·㈜·유한회사·Inc·Co.,Ltd 등)·공백·기호 제거
+   (같은 정규화 결과는 고유값 하나로 묶어 이후 단계는 고유값 수에 비례)
+2) 글자 n-gram(앞뒤 경계 포함) → MinHash 서명 (NumPy로 블록 단위 계산)
+3) 블로킹: LSH 밴드별 해시 정렬 이웃 + 정규화 문자열 정렬 이웃(sorted neighborhood)에서 후보 쌍
+4) 점수: 서명 일치 비율(자카드 유사도 추정)을 후보 쌍 전체에 벡터 연산으로 계산, threshold 이상만 연결
+5) 유니온-파인드(포인터 점프)로 클러스터 → keep 규칙(first/last/last_by:<열>)으로 survivor 선택
+"""
+from __future__ import annotations
+import re
+from typing import Any, Dict, List, Tuple, Union
+import numpy as np
+import pandas as pd
+from app.core.utils import ensure_df
+from .clean import _transform_uniques
+from .dedupe import _map_many, _map_one, _last_by_mask
+
+FUZZY_THRESHOLD = 0.5       # 추정 자카드 유사도 (2글자 n-gram, 5~8글자 이름의 한 글자 오타 ≈ 0.5~0.65)
+FUZZY_NGRAM = 2
+FUZZY_NUM_PERM = 96
+FUZZY_BANDS = 32            # 밴드 32 × 3행: 유사도 0.5 쌍이 후보가 될 확률 ≈ 0.99, 0.3 ≈ 0.58
+FUZZY_WINDOW = 4            # 같은 밴드 해시·정렬 이웃 안에서 비교할 앞뒤 거리
+_MAX_CHARS = 48             # n-gram을 만들 때 쓰는 정규화 문자열 최대 길이
+_BLOCK_ROWS = 1 << 15
+_PRIME = np.uint64((1 << 61) - 1)
+CLUSTER_COL = "__cluster"
+SURVIVOR_COL = "__survivor"
+
+RE_COMPANY_FORM = re.compile(
+    r"주식회사|유한회사|유한책임회사|합자회사|합명회사|사단법인|재단법인|\(주\)|\(유\)|\(사\)|\(재\)"
+    r"|\b(?:co\.?\s*,?\s*ltd|corp(?:oration)?|inc(?:orporated)?|ltd|llc|co)\b\.?"
+)
+RE_NON_WORD = re.compile(r"[\W_]+")
+
+
+def _normalize_values(st: pd.Series) -> pd.Series:
+    st = st.str.normalize("NFKC").str.lower()     # ㈜ → (주), 전각 → 반각
+    st = st.str.replace(RE_COMPANY_FORM, "", regex=True)
+    return st.str.replace(RE_NON_WORD, "", regex=True)
+
+
+def normalize_names(s: pd.Series) -> pd.Series:
+    """비교용 정규화 문자열 ("(주) 스타벅스 코리아" → "스타벅스코리아"). 결측은 결측"""
+    return _transform_uniques(s, _normalize_values)
+
+
+def _code_matrix(values: np.ndarray, width: int) -> Tuple[np.ndarray, np.ndarray]:
+    """문자열 배열 → (글자 코드 행렬 uint32 [행 × width], 길이). 앞뒤에 경계 글자(0x1/0x2)를 붙임"""
+    padded = np.char.add(np.char.add("\x01", values.astype(f"<U{width - 2}")), "\x02")
+    codes = np.asarray(padded, dtype=f"<U{width}").view(np.uint32).reshape(len(values), width)
+    return codes, np.char.str_len(padded)
+
+
+def _fmix32(x: np.ndarray) -> np.ndarray:
+    """32비트 해시 마무리(murmur3 fmix32): 비슷한 입력도 고르게 퍼지게"""
+    m = np.uint64(0xFFFFFFFF)
+    x = x ^ (x >> np.uint64(16))
+    x = (x * np.uint64(0x85EBCA6B)) & m
+    x = x ^ (x >> np.uint64(13))
+    x = (x * np.uint64(0xC2B2AE35)) & m
+    return x ^ (x >> np.uint64(16))
+
+
+def _minhash(values: np.ndarray, ngram: int, num_perm: int, seed: int = 1) -> np.ndarray:
+    """정규화 문자열 배열 → MinHash 서명 (uint32 [행 × num_perm]).
+    n-gram 해시(32비트) 위에 multiply-shift 해시 ((a·h + b) mod 2^64) >> 32 를 순열 대신 사용
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(0, 2**64 - 1, num_perm, dtype=np.uint64, endpoint=True) | np.uint64(1)
+    b = rng.integers(0, 2**64 - 1, num_perm, dtype=np.uint64, endpoint=True)
+    sig = np.empty((len(values), num_perm), dtype=np.uint32)
+    width = min(max((len(v) for v in values), default=0), _MAX_CHARS) + 2
+    width = max(width, ngram)
+    shift, mask = np.uint64(32), np.uint64(0xFFFFFFFF)
+    for lo in range(0, len(values), _BLOCK_ROWS):
+        codes, lens = _code_matrix(values[lo:lo + _BLOCK_ROWS], width)
+        n_pos = width - ngram + 1
+        h = np.zeros((len(codes), n_pos), dtype=np.uint64)
+        for k in range(ngram):
+            h = _fmix32((h * np.uint64(0x01000193) + codes[:, k:k + n_pos].astype(np.uint64)) & mask)
+        invalid = np.arange(n_pos)[None, :] > (lens - ngram)[:, None]
+        invalid[:, 0] = False      # 한 글자 문자열도 경계 n-gram 하나는 가짐
+        for j in range(num_perm):
+            hp = (a[j] * h + b[j]) >> shift
+            hp[invalid] = mask
+            sig[lo:lo + len(codes), j] = hp.min(axis=1)
+    return sig
+
+
+def _neighbor_pairs(order_keys: np.ndarray, window: int, same_key: bool) -> np.ndarray:
+    """정렬 키 배열에서 앞뒤 window 안의 쌍 (same_key면 키가 같은 이웃만). 반환 [m × 2] 고유값 번호"""
+    order = np.argsort(order_keys, kind="stable")
+    ks = order_keys[order]
+    out = []
+    for d in range(1, window + 1):
+        i = np.arange(len(order) - d)
+        if same_key:
+            i = i[ks[:-d] == ks[d:]]
+        out.append(np.stack([order[i], order[i + d]], axis=1))
+    return np.concatenate(out) if out else np.empty((0, 2), dtype=np.int64)
+
+
+def _candidate_pairs(sig: np.ndarray, norm: np.ndarray, bands: int, window: int) -> np.ndarray:
+    """LSH 밴드 + 정렬 이웃 블로킹 → 중복 없는 후보 쌍 [m × 2] (작은 번호가 앞)"""
+    rows = sig.shape[1] // bands
+    parts = []
+    for band in range(bands):
+        # 밴드의 서명 값들 → uint64 다항 해시 (넘침은 버림. 충돌은 후보 쌍만 늘고 점수에서 걸러짐)
+        key = np.zeros(len(sig), dtype=np.uint64)
+        for j in range(band * rows, (band + 1) * rows):
+            key = key * np.uint64(0x9E3779B97F4A7C15) + sig[:, j].astype(np.uint64)
+        parts.append(_neighbor_pairs(key, window, same_key=True))
+    parts.append(_neighbor_pairs(norm, window, same_key=False))
+    pairs = np.concatenate(parts)
+    if not len(pairs):
+        return pairs
+    lo, hi = np.minimum(pairs[:, 0], pairs[:, 1]), np.maximum(pairs[:, 0], pairs[:, 1])
+    packed = pd.unique(lo.astype(np.int64) * len(norm) + hi)     # 해시 기반 (정렬 없음)
+    return np.stack([packed // len(norm), packed % len(norm)], axis=1)
+
+
+def _similarity(sig: np.ndarray, pairs: np.ndarray) -> np.ndarray:
+    """후보 쌍의 서명 일치 비율 (자카드 추정)"""
+    out = np.empty(len(pairs), dtype=np.float32)
+    for lo in range(0, len(pairs), _BLOCK_ROWS):
+        p = pairs[lo:lo + _BLOCK_ROWS]
+        out[lo:lo + len(p)] = np.count_nonzero(sig[p[:, 0]] == sig[p[:, 1]], axis=1)
+    return out / sig.shape[1]
+
+
+def _union_find(n: int, edges: np.ndarray) -> np.ndarray:
+    """간선 [m × 2] → 노드별 루트(연결 요소에서 가장 작은 번호). 벡터화한 hooking + 포인터 점프"""
+    parent = np.arange(n)
+    while len(edges):
+        while True:                                  # 경로 압축(포인터 점프)
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+        ra, rb = parent[edges[:, 0]], parent[edges[:, 1]]
+        live = ra != rb
+        if not live.any():
+            break
+        edges, ra, rb = edges[live], ra[live], rb[live]
+        np.minimum.at(parent, np.maximum(ra, rb), np.minimum(ra, rb))
+    return parent
+
+
+def fuzzy_clusters(
+    df: pd.DataFrame,
+    columns: Union[str, List[str]],
+    threshold: float = FUZZY_THRESHOLD,
+    ngram: int = FUZZY_NGRAM,
+    num_perm: int = FUZZY_NUM_PERM,
+    bands: int = FUZZY_BANDS,
+    window: int = FUZZY_WINDOW,
+) -> Tuple[pd.Series, Dict[str, Any]]:
+    """행마다 유사 중복 클러스터 번호 (처음 나온 순서대로 0부터, 값이 모두 결측인 행은 각자 클러스터).
+    columns: 비교할 열(여러 개면 정규화 후 이어 붙여 비교). 반환: (클러스터 시리즈, 통계)
+    """
+    df = ensure_df(df)
+    cols = _map_many(df, columns)
+    if num_perm % bands:
+        raise ValueError(f"num_perm({num_perm})은 bands({bands})의 배수여야 합니다")
+    text = normalize_names(df[cols[0]])
+    for c in cols[1:]:
+        text = text.str.cat(normalize_names(df[c]), sep=" ", na_rep="")
+    text = text.str.strip()
+    text = text.where(text.str.len() > 0)
+    codes, uniques = pd.factorize(text)
+    norm = np.asarray(uniques, dtype=object).astype(str)
+    stats = {"unique_values": len(norm), "candidate_pairs": 0, "matched_pairs": 0}
+    root = np.arange(len(norm))
+    if len(norm) > 1:
+        sig = _minhash(norm, ngram, num_perm)
+        pairs = _candidate_pairs(sig, norm, bands, window)
+        sim = _similarity(sig, pairs)
+        edges = pairs[sim >= threshold]
+        stats.update(candidate_pairs=int(len(pairs)), matched_pairs=int(len(edges)))
+        root = _union_find(len(norm), edges)
+    # 결측(정규화 후 빈 문자열 포함)은 서로 묶지 않음
+    row_root = np.where(codes >= 0, root[np.maximum(codes, 0)], len(norm) + np.arange(len(codes)))
+    cluster, _ = pd.factorize(row_root)
+    return pd.Series(cluster, index=df.index, name=CLUSTER_COL), stats
+
+
+def fuzzy_dedupe(
+    df: pd.DataFrame,
+    columns: Union[str, List[str]],
+    keep: str = "first",
+    threshold: float = FUZZY_THRESHOLD,
+    mark: bool = False,
+    **options: Any,
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """유사 중복 제거. 클러스터마다 keep 규칙('first' | 'last' | 'last_by:<열>')으로 한 행을 남김.
+    mark=False: survivor 행만 (__cluster 열 포함), mark=True: 모든 행 + __cluster, __survivor 열
+    options: ngram, num_perm, bands, window (fuzzy_clusters 참고)
+    """
+    df = ensure_df(df)
+    cluster, stats = fuzzy_clusters(df, columns, threshold=threshold, **options)
+    out = df.assign(**{CLUSTER_COL: cluster})
+    if isinstance(keep, str) and keep.startswith("last_by:"):
+        survivor = _last_by_mask(out, [CLUSTER_COL], _map_one(df, keep.split(":", 1)[1]))
+    else:
+        survivor = ~cluster.duplicated(keep=("last" if keep == "last" else "first")).to_numpy()
+    sizes = cluster.map(cluster.value_counts())
+    report = {
+        "keys": _map_many(df, columns),
+        "keep": keep,
+        "threshold": threshold,
+        "removed": int(len(df) - survivor.sum()),
+        "clusters": int(cluster[sizes.gt(1)].nunique()),
+        "rows_in_clusters": int(sizes.gt(1).sum()),
+        **stats,
+    }
+    if mark:
+        return out.assign(**{SURVIVOR_COL: survivor}), report
+    return out[survivor], report
@@ -19,11 +19,283 @@ class ImputeStrategy(Enum):
     INTERPOLATE = "interpolate"
     DROP = "drop"
 
+# impute() 규칙의 별칭 → ImputeStrategy 값
+_METHOD_ALIASES = {
+    "0": ImputeStrategy.ZERO.value,
+    "avg": ImputeStrategy.MEAN.value,
+    "most_frequent": ImputeStrategy.MODE.value,
+    "ffill": ImputeStrategy.FORWARD_FILL.value,
+    "bfill": ImputeStrategy.BACKWARD_FILL.value,
+    "backfill": ImputeStrategy.BACKWARD_FILL.value,
+}
+_STAT_METHODS = (ImputeStrategy.MEAN.value, ImputeStrategy.MEDIAN.value, ImputeStrategy.MODE.value)
+_ROW_METHODS = (
+    ImputeStrategy.FORWARD_FILL.value,
+    ImputeStrategy.BACKWARD_FILL.value,
+    ImputeStrategy.INTERPOLATE.value,
+    ImputeStrategy.DROP.value,
+)
+
+# by(그룹별 대체)를 쓰는 방법: 통계는 그룹 값, 빈 그룹은 전체 통계로 / ffill·bfill은 그룹 안에서만
+_GROUP_METHODS = _STAT_METHODS + (ImputeStrategy.FORWARD_FILL.value, ImputeStrategy.BACKWARD_FILL.value)
+
+
+def _rule_config(strategy: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """"mean" 또는 {"strategy": "mean", ...} → 별칭을 정리한 설정"""
+    cfg: Dict[str, Any] = {"strategy": strategy} if isinstance(strategy, str) else dict(strategy)
+    name = str(cfg.get("strategy", "mean")).lower()
+    cfg["strategy"] = _METHOD_ALIASES.get(name, name)
+    by = cfg.get("by")
+    cfg["by"] = [by] if isinstance(by, str) else list(by or [])
+    return cfg
+
+
+def _float_block(df: pd.DataFrame, cols: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """float64 열들 → (열×행 연속 배열 사본, 결측 마스크). 결측 수·통계·채우기가 이 마스크 하나를 같이 씀"""
+    values = np.empty((len(cols), len(df)), dtype=np.float64)
+    for i, c in enumerate(cols):
+        values[i] = df[c].to_numpy()
+    return values, np.isnan(values)
+
+
+def _block_stat(values: np.ndarray, mask: np.ndarray, rows: List[int], name: str) -> List[float]:
+    """블록 행(열)마다 결측을 뺀 평균/중앙값 (값이 없으면 NaN). 중앙값은 정렬 대신 partition 한 번"""
+    out: List[float] = []
+    for i in rows:
+        count = mask.shape[1] - int(np.count_nonzero(mask[i]))
+        if not count:
+            out.append(np.nan)
+        elif name == ImputeStrategy.MEAN.value:
+            out.append(float(np.nansum(values[i])) / count)
+        else:
+            k = count // 2
+            part = np.partition(values[i][~mask[i]], k)     # k번째 값만 제자리에 (전체 정렬 없음)
+            out.append(float(part[k]) if count % 2 else float(part[:k].max() + part[k]) / 2)
+    return out
+
+
+def _impute_values(
+    df: pd.DataFrame,
+    rules: Dict[str, Dict[str, Any]],
+    block: Optional[Tuple[Dict[str, int], np.ndarray, np.ndarray]] = None,
+) -> Tuple[Dict[str, Any], Dict[str, str], Dict[str, str]]:
+    """규칙 → (열별 대체값, 행 단위 연산 열, 건너뛴 열 상태).
+    평균/중앙값/최빈값은 방법마다 대상 열 전체를 한 번에 계산 (block에 있는 float64 열은 NumPy로)"""
+    fills: Dict[str, Any] = {}
+    row_ops: Dict[str, str] = {}
+    skipped: Dict[str, str] = {}
+    wanted: Dict[str, List[str]] = {m: [] for m in _STAT_METHODS}
+    for col, cfg in rules.items():
+        name = cfg["strategy"]
+        if name == ImputeStrategy.ZERO.value:
+            fills[col] = 0
+        elif name in wanted:
+            wanted[name].append(col)
+        elif name in _ROW_METHODS:
+            row_ops[col] = name
+        elif cfg.get("fill_value") is not None:
+            fills[col] = cfg["fill_value"]
+        else:
+            skipped[col] = "skip:unknown_method"
+
+    pos = block[0] if block is not None else {}
+    for name in (ImputeStrategy.MEAN.value, ImputeStrategy.MEDIAN.value):
+        numeric = [c for c in wanted[name] if pd.api.types.is_numeric_dtype(df[c])]
+        skipped.update({c: "skip:not_numeric" for c in wanted[name] if c not in numeric})
+        in_block = [c for c in numeric if c in pos]
+        if block is not None and in_block:
+            fills.update(zip(in_block, _block_stat(block[1], block[2], [pos[c] for c in in_block], name)))
+        rest = [c for c in numeric if c not in pos]
+        if rest:
+            fills.update(getattr(df[rest], name)().to_dict())
+    if wanted[ImputeStrategy.MODE.value]:
+        modes = df[wanted[ImputeStrategy.MODE.value]].mode(dropna=True)
+        if len(modes):
+            fills.update(modes.iloc[0].dropna().to_dict())
+    return {c: v for c, v in fills.items() if not pd.isna(v)}, row_ops, skipped
+
+
+def _group_mode(s: pd.Series, codes: np.ndarray) -> pd.Series:
+    """그룹별 최빈값을 행마다 펼침 (동률이면 작은 값, 값이 없는 그룹은 결측).
+    (그룹, 값 코드)를 정수 키 하나로 묶어 빈도를 한 번에 셈"""
+    values, uniques = pd.factorize(s, sort=True)
+    valid = values >= 0
+    if not valid.any():
+        return pd.Series(np.nan, index=s.index).astype(s.dtype)
+    n_values = len(uniques)
+    keys, counts = np.unique(codes[valid].astype(np.int64) * n_values + values[valid], return_counts=True)
+    group, value = keys // n_values, keys % n_values
+    order = np.lexsort((value, -counts, group))         # 그룹별 최다 빈도, 동률이면 작은 값이 맨 앞
+    first = order[np.r_[True, group[order][1:] != group[order][:-1]]]
+    best = np.full(int(codes.max()) + 1, -1, dtype=np.int64)
+    best[group[first]] = value[first]
+    return pd.Series(pd.Categorical.from_codes(best[codes], categories=uniques), index=s.index).astype(s.dtype)
+
+
+def _group_fill(out: pd.DataFrame, col: str, method: str, codes: np.ndarray) -> pd.Series:
+    """그룹 번호(codes)별로 열 하나를 채움 — 규칙마다 그룹 transform 한 번"""
+    s = out[col]
+    grouped = s.groupby(codes, sort=False)
+    if method == ImputeStrategy.FORWARD_FILL.value:
+        return grouped.ffill()
+    if method == ImputeStrategy.BACKWARD_FILL.value:
+        return grouped.bfill()
+    if method == ImputeStrategy.MODE.value:
+        return s.fillna(_group_mode(s, codes))
+    return _fill_column(s, grouped.transform(method))
+
+
+def _fill_column(s: pd.Series, value: Any) -> pd.Series:
+    """열 하나를 value로 채움. 정수 열에 소수 대체값(평균 등)이면 Float64로 올려서 채움"""
+    try:
+        return s.fillna(value)
+    except (TypeError, ValueError):
+        if pd.api.types.is_integer_dtype(s.dtype):
+            return s.astype("Float64").fillna(value)
+        raise
+
+
+def impute_frame(
+    df: pd.DataFrame,
+    strategies: Dict[str, Union[str, Dict[str, Any]]],
+    drop_threshold: Optional[float] = None,
+    copy: bool = True,
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    결측치 처리 엔진: 대상 열의 결측 수와 필요한 통계를 한 번에 계산하고 한꺼번에 채웁니다.
+
+    Args:
+        df: 처리할 데이터프레임
+        strategies: 열별 처리 전략 (handle_missing_values와 같은 형식, impute 별칭 허용)
+            - {"strategy": "median", "by": ["카테고리", "도시"]}: by 그룹의 통계로 채우고
+              값이 없는 그룹은 전체 통계로 (mean/median/mode, forward_fill/backward_fill은 그룹 안에서만)
+        drop_threshold: 지정하면 결측치 비율이 이 값을 초과하는 열을 먼저 삭제
+        copy: False면 df를 복사하지 않고 열을 바꿔 끼움 (df의 소유권을 넘겨받음)
+
+    Returns:
+        (처리된 데이터프레임, 보고) — 보고는 rows, dropped_columns, dropped_rows, filled(합계),
+        columns(열별 col/method/missing/filled/status, by 규칙은 by/groups/group_filled/fallback 추가)
+    """
+    out = df.copy() if copy else df
+    n = len(out)
+    report: Dict[str, Any] = {"rows": n, "dropped_columns": [], "dropped_rows": 0, "filled": 0, "columns": []}
+
+    if drop_threshold is not None and n:
+        # 열마다 count()만 계산 (전체 결측 행렬을 만들지 않음)
+        missing_ratio = {c: 1 - s.count() / n for c, s in out.items()}
+        report["dropped_columns"] = [c for c, r in missing_ratio.items() if r > drop_threshold]
+        if report["dropped_columns"]:
+            out = out.drop(columns=report["dropped_columns"])
+
+    rules = {col: _rule_config(st) for col, st in strategies.items()}
+    targets = [c for c in rules if c in out.columns]
+    # float64 대상 열은 블록 하나로 모아 결측 마스크를 한 번만 계산 (결측 수·통계·채우기에 재사용)
+    fast = [c for c in targets if out[c].dtype == np.float64]
+    pos = {c: i for i, c in enumerate(fast)}
+    values, mask = _float_block(out, fast)
+    block_missing = np.count_nonzero(mask, axis=1)
+    missing = {c: int(block_missing[pos[c]]) if c in pos else int(n - out[c].count()) for c in targets}
+    todo = {c: rules[c] for c in targets if missing[c]}
+    fills, row_ops, status = _impute_values(out, todo, block=(pos, values, mask))
+
+    # 그룹별 대체(by): 같은 by 조합은 그룹 번호를 한 번만 계산하고 규칙마다 그룹 transform 한 번.
+    # 빈 그룹(값이 전부 결측)에 남은 결측은 아래 전체 통계 채우기가 처리
+    groups: Dict[str, Dict[str, Any]] = {}
+    codes_by: Dict[Tuple[str, ...], Tuple[np.ndarray, int]] = {}
+    for c, cfg in todo.items():
+        if not cfg["by"] or cfg["strategy"] not in _GROUP_METHODS or c in status:
+            continue
+        missing_by = [b for b in cfg["by"] if b not in out.columns]
+        if missing_by:
+            status[c] = f"skip:by_not_found:{missing_by}"
+            fills.pop(c, None)
+            continue
+        key = tuple(cfg["by"])
+        if key not in codes_by:
+            codes = out.groupby(list(key), sort=False, dropna=False, observed=True).ngroup().to_numpy()
+            codes_by[key] = (codes, int(codes.max()) + 1 if len(codes) else 0)
+        codes, n_groups = codes_by[key]
+        out[c] = _group_fill(out, c, cfg["strategy"], codes)
+        row_ops.pop(c, None)
+        left = int(n - out[c].count())
+        groups[c] = {"by": cfg["by"], "groups": n_groups,
+                     "fallback": left if c in fills else 0, "group_filled": missing[c] - left}
+
+    # 대체값 채우기: 블록 열은 마스크 위치에 바로 쓰고, 나머지는 한 번의 fillna
+    # (dtype이 맞지 않는 열만 열 단위로 다시 시도)
+    rest = {}
+    for c, value in fills.items():
+        if c in pos and c not in groups and isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_)):
+            row = values[pos[c]]
+            np.copyto(row, value, where=mask[pos[c]])
+            out[c] = pd.Series(row, index=out.index, name=c, copy=False)
+        else:
+            rest[c] = value
+    if rest:
+        cols = list(rest)
+        try:
+            filled = out[cols].fillna(rest)
+            for c in cols:
+                out[c] = filled[c]
+        except (TypeError, ValueError):
+            for c in cols:
+                try:
+                    out[c] = _fill_column(out[c], rest[c])
+                except (TypeError, ValueError) as e:
+                    status[c] = f"error:{e}"
+
+    # 행 단위 연산: 같은 연산의 열을 묶어 한 번에
+    by_op: Dict[str, List[str]] = {}
+    for c, op in row_ops.items():
+        by_op.setdefault(op, []).append(c)
+    for c in by_op.get(ImputeStrategy.INTERPOLATE.value, []):
+        if not pd.api.types.is_numeric_dtype(out[c]):
+            status[c] = "skip:not_numeric"
+    for op, cols in by_op.items():
+        cols = [c for c in cols if c not in status]
+        if not cols or op == ImputeStrategy.DROP.value:
+            continue
+        if op == ImputeStrategy.FORWARD_FILL.value:
+            filled = out[cols].ffill()
+        elif op == ImputeStrategy.BACKWARD_FILL.value:
+            filled = out[cols].bfill()
+        else:
+            filled = out[cols].interpolate(method="linear")
+        for c in cols:
+            out[c] = filled[c]
+
+    # 대체값으로 채운 열은 남은 결측이 없으므로 다시 세지 않음
+    filled_now = {c: missing[c] if c in fills and c not in status else missing[c] - int(n - out[c].count())
+                  for c in todo}
+    drop_rows = by_op.get(ImputeStrategy.DROP.value, [])
+    if drop_rows:
+        before = len(out)
+        out = out.dropna(subset=drop_rows)
+        report["dropped_rows"] = before - len(out)
+
+    for col in strategies:
+        entry = {"col": col, "method": rules[col]["strategy"]}
+        if col in report["dropped_columns"]:
+            entry["status"] = "dropped"
+        elif col not in missing:
+            entry["status"] = "skip:not_found"
+        elif not missing[col]:
+            entry.update(missing=0, filled=0, status="noop")
+        else:
+            entry.update(missing=missing[col], filled=filled_now[col], status=status.get(col, "ok"))
+            entry.update(groups.get(col, {}))
+        report["columns"].append(entry)
+    report["filled"] = sum(e.get("filled", 0) for e in report["columns"])
+    return out, report
+
+
 def handle_missing_values(
     df: pd.DataFrame,
     strategies: Dict[str, Union[str, Dict[str, Any]]],
-    drop_threshold: float = 0.5
-) -> pd.DataFrame:
+    drop_threshold: float = 0.5,
+    copy: bool = True,
+    return_report: bool = False,
+) -> Union[pd.DataFrame, Tuple[pd.DataFrame, Dict[str, Any]]]:
     """
     결측치를 지정된 전략에 따라 처리합니다.
     
@@ -31,36 +303,16 @@ def handle_missing_values(
         df: 처리할 데이터프레임
         strategies: 열별 처리 전략
             - 문자열: 전략 이름 (예: "mean", "median")
-            - 딕셔너리: 상세 설정 (예: {"strategy": "mean", "fill_value": 0})
+            - 딕셔너리: 상세 설정 (예: {"strategy": "mean", "fill_value": 0}, {"strategy": "median", "by": ["도시"]})
         drop_threshold: 열의 결측치 비율이 이 값을 초과하면 열을 삭제
+        copy: False면 df를 복사하지 않고 열을 바꿔 끼움 (df의 소유권을 넘겨받음)
+        return_report: True면 (데이터프레임, impute_frame 보고)를 반환
         
     Returns:
         결측치가 처리된 데이터프레임
     """
-    df_cleaned = df.copy()
-    
-    # 결측치 비율이 높은 열 삭제
-    missing_ratio = df_cleaned.isnull().sum() / len(df_cleaned)
-    cols_to_drop = missing_ratio[missing_ratio > drop_threshold].index.tolist()
-    
-    if cols_to_drop:
-        print(f"[impute] 결측치 비율이 높은 열 삭제: {cols_to_drop}")
-        df_cleaned = df_cleaned.drop(columns=cols_to_drop)
-    
-    # 열별 전략 적용
-    for col, strategy in strategies.items():
-        if col not in df_cleaned.columns:
-            print(f"[impute] 경고: 열 '{col}'을 찾을 수 없습니다.")
-            continue
-            
-        if isinstance(strategy, str):
-            strategy_config = {"strategy": strategy}
-        else:
-            strategy_config = strategy
-            
-        df_cleaned = apply_impute_strategy(df_cleaned, col, strategy_config)
-    
-    return df_cleaned
+    out, report = impute_frame(df, strategies, drop_threshold=drop_threshold, copy=copy)
+    return (out, report) if return_report else out
 
 def apply_impute_strategy(
     df: pd.DataFrame,
@@ -78,60 +330,8 @@ def apply_impute_strategy(
     Returns:
         처리된 데이터프레임
     """
-    strategy = config.get("strategy", "mean")
-    fill_value = config.get("fill_value", None)
-    
-    if df[col].isnull().sum() == 0:
-        return df
-    
-    before_count = df[col].isnull().sum()
-    
-    try:
-        if strategy == ImputeStrategy.ZERO.value:
-            df[col] = df[col].fillna(0)
-        elif strategy == ImputeStrategy.MEAN.value:
-            if pd.api.types.is_numeric_dtype(df[col]):
-                df[col] = df[col].fillna(df[col].mean())
-            else:
-                print(f"[impute] 경고: '{col}' 열은 숫자형이 아니므로 평균 대체를 건너뜁니다.")
-        elif strategy == ImputeStrategy.MEDIAN.value:
-            if pd.api.types.is_numeric_dtype(df[col]):
-                df[col] = df[col].fillna(df[col].median())
-            else:
-                print(f"[impute] 경고: '{col}' 열은 숫자형이 아니므로 중앙값 대체를 건너뜁니다.")
-        elif strategy == ImputeStrategy.MODE.value:
-            mode_value = df[col].mode()
-            if len(mode_value) > 0:
-                df[col] = df[col].fillna(mode_value[0])
-        elif strategy == ImputeStrategy.FORWARD_FILL.value:
-            df[col] = df[col].fillna(method='ffill')
-        elif strategy == ImputeStrategy.BACKWARD_FILL.value:
-            df[col] = df[col].fillna(method='bfill')
-        elif strategy == ImputeStrategy.INTERPOLATE.value:
-            if pd.api.types.is_numeric_dtype(df[col]):
-                df[col] = df[col].interpolate(method='linear')
-            else:
-                print(f"[impute] 경고: '{col}' 열은 숫자형이 아니므로 보간을 건너뜁니다.")
-        elif strategy == ImputeStrategy.DROP.value:
-            df = df.dropna(subset=[col])
-        else:
-            if fill_value is not None:
-                df[col] = df[col].fillna(fill_value)
-            else:
-                print(f"[impute] 경고: 알 수 없는 전략 '{strategy}'")
-                return df
-        
-        after_count = df[col].isnull().sum()
-        filled_count = before_count - after_count
-        
-        if filled_count > 0:
-            print(f"[impute] '{col}' 열: {strategy} 전략으로 {filled_count}개 결측치 처리")
-            
-    except Exception as e:
-        print(f"[impute] 오류: '{col}' 열 처리 중 {e}")
-        return df
-    
-    return df
+    out, _ = impute_frame(df, {col: config}, copy=False)
+    return out
 
 def analyze_missing_patterns(df: pd.DataFrame) -> Dict[str, Any]:
     """
@@ -205,47 +405,26 @@ def suggest_impute_strategies(df: pd.DataFrame) -> Dict[str, str]:
     
     return suggestions
 
-def impute(df: pd.DataFrame, rules: Iterable[Dict[str, Any]]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+def impute(df: pd.DataFrame, rules: Iterable[Dict[str, Any]], copy: bool = True) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     """
     rules: [{"col":"금액","method":"median"}, {"col":"수량","method":"zero"}, {"col":"메모","method":"value","value":""}, ...]
-    return: (df_new, report)
+           {"col":"금액","method":"median","by":["카테고리","도시"]} — 그룹 통계로 채우고 빈 그룹은 전체 통계로
+    copy: False면 df를 복사하지 않고 열을 바꿔 끼움 (df의 소유권을 넘겨받음)
+    return: (df_new, report) — 통계·채우기는 impute_frame이 모든 규칙을 묶어 한 번에 처리
     """
-    out = df.copy()
-    report: List[Dict[str, Any]] = []
+    strategies: Dict[str, Union[str, Dict[str, Any]]] = {}
+    order: List[Tuple[str, str]] = []
     for r in rules or []:
-        col = r.get("col")
+        col = r.get("col", "")
         method = (r.get("method") or "").lower()
-        if col not in out.columns: 
-            report.append({"col": col, "method": method, "status": "skip:not_found"}); 
-            continue
-        s = out[col]
-        n_before = int(s.isna().sum())
-        if n_before == 0:
-            report.append({"col": col, "method": method, "status": "noop"}); 
-            continue
+        order.append((col, method))
+        if col not in strategies:   # 같은 열의 규칙이 여러 개면 첫 규칙만 적용
+            strategies[col] = {"strategy": method, "fill_value": r.get("value"), "by": r.get("by")}
+    out, frame_report = impute_frame(df, strategies, copy=copy)
 
-        if method in ("zero","0"):
-            out[col] = s.fillna(0)
-        elif method in ("mean","avg"):
-            out[col] = s.fillna(s.astype("Float64").mean(skipna=True))
-        elif method == "median":
-            out[col] = s.fillna(s.astype("Float64").median(skipna=True))
-        elif method in ("mode","most_frequent"):
-            try:
-                val = s.mode(dropna=True).iloc[0]
-                out[col] = s.fillna(val)
-            except Exception:
-                out[col] = s
-        elif method in ("ffill","forward_fill"):
-            out[col] = s.fillna(method="ffill")
-        elif method in ("bfill","backfill"):
-            out[col] = s.fillna(method="bfill")
-        elif method in ("value","const"):
-            out[col] = s.fillna(r.get("value"))
-        else:
-            report.append({"col": col, "method": method, "status": "skip:unknown_method"}); 
-            continue
-
-        n_after = int(out[col].isna().sum())
-        report.append({"col": col, "method": method, "filled": n_before - n_after, "status": "ok"})
+    entries = {e["col"]: e for e in frame_report["columns"]}
+    report: List[Dict[str, Any]] = []
+    for col, method in order:
+        entry = entries.pop(col, None)
+        report.append({**entry, "method": method} if entry else {"col": col, "method": method, "status": "skip:duplicate"})
     return out, {"impute": report}
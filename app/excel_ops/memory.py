@@ -0,0 +1,107 @@
+# app/excel_ops/memory.py
+"""
+메모리 최적화 단계
+정리된 표의 열 dtype을 더 작은 것으로 바꿔, 이후 피벗·중복 제거가 작은 열 위에서 돌도록 합니다.
+
+- 고유값 비율이 낮은 문자열 열(도시, 카테고리, __currency 등) → category
+- 정수 열 → 값 범위에 맞는 가장 작은 부호 있는 정수 (결측이 있으면 nullable Int8/16/32)
+- 값이 모두 정수인 실수 열(금액 1234.0 등) → 같은 방식의 nullable 정수
+  (소수가 있는 실수는 float32로 줄이면 합계 오차가 생기므로 그대로 둠)
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterable, Optional, Tuple
+import numpy as np
+import pandas as pd
+from app.core.utils import ensure_df
+
+# 고유값 수 / 행 수가 이 비율 이하인 문자열 열만 category로
+CATEGORY_MAX_RATIO = 0.5
+
+_INT_TYPES = (
+    (np.int8, "Int8"),
+    (np.int16, "Int16"),
+    (np.int32, "Int32"),
+    (np.int64, "Int64"),
+)
+
+
+def _smallest_int(lo: int, hi: int, nullable: bool) -> Optional[str]:
+    for np_type, ext in _INT_TYPES:
+        info = np.iinfo(np_type)
+        if info.min <= lo and hi <= info.max:
+            return ext if nullable else np.dtype(np_type).name
+    return None
+
+
+def _downcast_numeric(s: pd.Series) -> Optional[pd.Series]:
+    """정수·정수값 실수 열을 값을 바꾸지 않는 가장 작은 정수 dtype으로. 줄일 수 없으면 None"""
+    dtype = s.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return None
+    vals = s.dropna()
+    if pd.api.types.is_integer_dtype(dtype):
+        if not len(vals):
+            return None
+        target = _smallest_int(int(vals.min()), int(vals.max()), nullable=isinstance(dtype, pd.api.extensions.ExtensionDtype))
+    elif pd.api.types.is_float_dtype(dtype):
+        num = vals.to_numpy(dtype="float64")
+        if not len(num) or not np.isfinite(num).all() or not (num == np.round(num)).all():
+            return None
+        target = _smallest_int(int(num.min()), int(num.max()), nullable=True)
+    else:
+        return None
+    if target is None or target == str(dtype):
+        return None
+    return s.astype(target)
+
+
+def _to_category(s: pd.Series, max_ratio: float) -> Optional[pd.Series]:
+    """고유값 비율이 낮은 문자열 열 → category (더 작아질 때만). 아니면 None"""
+    n = s.notna().sum()
+    if not n:
+        return None
+    try:
+        uniques = s.nunique(dropna=True)
+    except TypeError:   # 리스트 등 해시할 수 없는 값
+        return None
+    if uniques > n * max_ratio:
+        return None
+    cat = s.astype("category")
+    if cat.memory_usage(deep=True, index=False) >= s.memory_usage(deep=True, index=False):
+        return None
+    return cat
+
+
+def optimize_memory(
+    df: pd.DataFrame,
+    category_max_ratio: float = CATEGORY_MAX_RATIO,
+    exclude: Optional[Iterable[Any]] = None,
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """열 dtype을 값 손실 없이 더 작게 바꿈 (category 변환, 정수 다운캐스트).
+    exclude: 바꾸지 않을 열 (이후 새 범주 값으로 채울 열 등)
+    반환: (df, report) — report는 {"bytes_before", "bytes_after", "saved_ratio", "columns": {열: {"from", "to"}}}
+    """
+    df = ensure_df(df)
+    skip = set(exclude or ())
+    before = int(df.memory_usage(deep=True, index=False).sum())
+    out = df.copy()
+    changed: Dict[str, Dict[str, str]] = {}
+    for i, c in enumerate(out.columns):
+        if c in skip:
+            continue
+        s = out.iloc[:, i]
+        if pd.api.types.is_object_dtype(s.dtype) or pd.api.types.is_string_dtype(s.dtype):
+            new = _to_category(s, category_max_ratio)
+        else:
+            new = _downcast_numeric(s)
+        if new is not None:
+            out.isetitem(i, new)
+            changed[str(c)] = {"from": str(s.dtype), "to": str(new.dtype)}
+    after = int(out.memory_usage(deep=True, index=False).sum())
+    report = {
+        "bytes_before": before,
+        "bytes_after": after,
+        "saved_ratio": round(1 - after / before, 4) if before else 0.0,
+        "columns": changed,
+    }
+    return out, report
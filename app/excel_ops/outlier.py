@@ -84,14 +84,15 @@ def zscore_clip_series(s: pd.Series, z: float = 3.0) -> Tuple[pd.Series, Dict[st
     
     return clipped, {"mean": mu, "std": sd, "lo": lo, "hi": hi, "z": float(z)}
 
-def outlier(df: pd.DataFrame, rules: Iterable[Dict[str, Any]]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+def outlier(df: pd.DataFrame, rules: Iterable[Dict[str, Any]], copy: bool = True) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     """
     rules 예:
       - {"col":"금액","method":"iqr_clip","multiplier":1.5}
       - {"col":"수량","method":"zscore_clip","z":3}
     * 호환: iqr_clip에서 'k' 별칭도 인식 (k -> multiplier)
+    copy: False면 df를 복사하지 않고 열을 바꿔 끼움 (df의 소유권을 넘겨받음)
     """
-    out = df.copy()
+    out = df.copy() if copy else df
     rep: List[Dict[str, Any]] = []
 
     for r in rules or []:
@@ -0,0 +1,231 @@
+"""
+스트리밍 전처리 파이프라인
+대용량 파일을 청크 단위로 정리 → 결측치 → 이상치 처리합니다.
+첫 청크에서 열 변환 계획(불리언/통화/날짜)과 통계값(대체값, 클리핑 경계)을 확정하고
+이후 모든 청크에 같은 결정을 적용하므로, 메모리는 청크 1개 분량만 사용합니다.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+import numpy as np
+import pandas as pd
+
+from .clean import level1_clean
+from .impute import ImputeStrategy, _fill_column, _impute_values, _rule_config
+from .outlier import iqr_clip_series, zscore_clip_series, _to_numeric, _cast_back_like
+
+
+_ROW_FILLS = (ImputeStrategy.FORWARD_FILL.value, ImputeStrategy.BACKWARD_FILL.value)
+
+
+def _freeze_impute(df: pd.DataFrame, strategies: Dict[str, Union[str, Dict[str, Any]]]) -> Dict[str, Any]:
+    """handle_missing_values와 같은 규칙으로 대체값을 계산해 고정 (통계는 방법별로 한 번에).
+    by(그룹별 대체)의 통계 규칙은 청크 사이에서 같은 값을 쓰도록 전체 통계 하나로 고정하고,
+    forward_fill/backward_fill은 by 열을 기록해 두었다가 청크 안에서 그룹별로 채움 (row_by)"""
+    rules = {col: _rule_config(st) for col, st in strategies.items() if col in df.columns}
+    fills, row_ops, skipped = _impute_values(df, rules)
+    row_by: Dict[str, List[str]] = {}
+    for col, op in list(row_ops.items()):
+        by = rules[col]["by"]
+        if op not in _ROW_FILLS or not by:
+            continue
+        missing_by = [b for b in by if b not in df.columns]
+        if missing_by:
+            skipped[col] = f"skip:by_not_found:{missing_by}"
+            del row_ops[col]
+        else:
+            row_by[col] = by
+    return {"fills": fills, "row_ops": row_ops, "row_by": row_by, "skipped": skipped}
+
+
+def _freeze_outlier(df: pd.DataFrame, rules: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """outlier()와 같은 규칙으로 첫 청크에서 클리핑 경계를 계산해 고정"""
+    frozen: List[Dict[str, Any]] = []
+    for r in rules or []:
+        col = r.get("col")
+        method = (r.get("method") or "").lower()
+        if not col or col not in df.columns:
+            frozen.append({"col": col, "method": method, "status": "skip:not_found"})
+            continue
+        if method in ("iqr", "iqr_clip"):
+            try:
+                m = float(r.get("multiplier", r.get("k", 1.5)))
+            except Exception:
+                m = 1.5
+            _, stats = iqr_clip_series(df[col], multiplier=m)
+            frozen.append({"col": col, "method": "iqr_clip", **stats, "changed": 0, "status": "ok"})
+        elif method in ("z", "zscore", "zscore_clip"):
+            try:
+                z = float(r.get("z", r.get("threshold", 3.0)))
+            except Exception:
+                z = 3.0
+            _, stats = zscore_clip_series(df[col], z=z)
+            entry: Dict[str, Any] = {"col": col, "method": "zscore_clip", **stats, "changed": 0, "status": "ok"}
+            if stats["std"] == 0 or pd.isna(stats["std"]):
+                entry["lo"] = entry["hi"] = None  # 분산 0: 클리핑하지 않음
+            frozen.append(entry)
+        else:
+            frozen.append({"col": col, "method": method, "status": "skip:unknown_method"})
+    return frozen
+
+
+class StreamPreprocessor:
+    """청크 단위 전처리기. run()에 청크 이터레이터를 넘기면 처리된 청크를 순서대로 돌려줍니다.
+    날짜 열은 기본으로 datetime64로 두고(date_output) 서식은 export_table이 저장할 때 정합니다.
+    열 구성은 첫 청크의 원본 열 전체로 고정(빈 열도 유지)하고, drop_threshold는 열을 지우는 대신
+    전체 청크 기준 결측 비율이 넘는 열을 report["impute"]["over_threshold"]로 알립니다.
+    """
+
+    def __init__(
+        self,
+        date_fmt: str = "YYYY-MM-DD",
+        strategies: Optional[Dict[str, Union[str, Dict[str, Any]]]] = None,
+        outlier_rules: Optional[List[Dict[str, Any]]] = None,
+        drop_threshold: float = 0.5,
+        workers: Optional[int] = None,
+        date_output: str = "datetime",
+    ):
+        self.date_fmt = date_fmt
+        self.workers = workers
+        self.date_output = date_output
+        self.strategies = strategies or {}
+        self.outlier_rules = outlier_rules or []
+        self.drop_threshold = drop_threshold
+        self.plan: Optional[Dict[str, str]] = None
+        self.columns: Optional[List[str]] = None
+        self.impute_state: Optional[Dict[str, Any]] = None
+        self.outlier_state: Optional[List[Dict[str, Any]]] = None
+        self._carry: Dict[str, Any] = {}
+        self._rows = 0
+        self._missing: Dict[str, int] = {}
+        self.report: Dict[str, Any] = {"chunks": 0, "rows_in": 0, "rows_out": 0}
+
+    def _clean(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        if self.plan is None:
+            # 첫 청크에서 비어 있는 열도 이후 청크에는 값이 있을 수 있으므로 빈 행만 지우고 열은 모두 고정
+            out, type_info, _ = level1_clean(chunk, date_fmt=self.date_fmt, drop_empty=False, return_logs=True,
+                                             workers=self.workers, date_output=self.date_output)
+            self.plan = type_info
+            self.columns = list(out.columns)
+            return out.dropna(how="all")
+        out = level1_clean(chunk, date_fmt=self.date_fmt, drop_empty=False, plan=self.plan,
+                           workers=self.workers, date_output=self.date_output)
+        out = out.reindex(columns=self.columns)
+        return out.dropna(how="all")
+
+    def _impute(self, df: pd.DataFrame) -> pd.DataFrame:
+        # 결측 비율은 모든 청크를 합쳐 세고(run 종료 시 보고), 열 삭제는 청크 하나로 정하지 않음
+        self._rows += len(df)
+        for col in self.strategies:
+            if col in df.columns:
+                self._missing[col] = self._missing.get(col, 0) + int(len(df) - df[col].count())
+        if self.impute_state is None:
+            self.impute_state = _freeze_impute(df, self.strategies)
+        st = self.impute_state
+        # 앞 청크에 값이 없어 통계를 못 낸 열은 값이 처음 나온 청크에서 고정
+        pending = {c: s for c, s in self.strategies.items()
+                   if c in df.columns and c not in st["fills"] and c not in st["row_ops"] and df[c].notna().any()}
+        if pending:
+            st["fills"].update(_freeze_impute(df, pending)["fills"])
+        for col, value in st["fills"].items():
+            # 정수 열에 소수 대체값이면 Float64로 올려 채움 (impute_frame과 같은 처리), 그래도 안 되면 보고
+            try:
+                df[col] = _fill_column(df[col], value)
+            except (TypeError, ValueError) as e:
+                st["skipped"][col] = f"error:{e}"
+        for col, op in st["row_ops"].items():
+            s = df[col]
+            if col in st["row_by"]:
+                df[col] = self._group_row_fill(df, col, op, st["row_by"][col])
+            elif op == ImputeStrategy.FORWARD_FILL.value:
+                # 이전 청크의 마지막 값을 이어받아 청크 경계에서도 채움
+                if col in self._carry and len(s) and pd.isna(s.iloc[0]):
+                    s = s.copy()
+                    s.iloc[0] = self._carry[col]
+                s = s.ffill()
+                last = s.dropna()
+                if len(last):
+                    self._carry[col] = last.iloc[-1]
+                df[col] = s
+            elif op == ImputeStrategy.BACKWARD_FILL.value:
+                df[col] = s.bfill()  # 청크 내부에서만 채움
+            elif op == ImputeStrategy.INTERPOLATE.value:
+                if pd.api.types.is_numeric_dtype(s):
+                    df[col] = s.interpolate(method="linear")
+            elif op == ImputeStrategy.DROP.value:
+                df = df.dropna(subset=[col])
+        return df
+
+    def _group_row_fill(self, df: pd.DataFrame, col: str, op: str, by: List[str]) -> pd.Series:
+        """by 그룹 안에서만 forward_fill/backward_fill (다른 그룹 값이 넘어오지 않게).
+        forward_fill은 그룹 키별 마지막 값을 다음 청크로 넘기고, backward_fill은 청크 안에서만 채움"""
+        codes = df.groupby(by, sort=False, dropna=False, observed=True).ngroup().to_numpy()
+        s = df[col]
+        if op == ImputeStrategy.BACKWARD_FILL.value:
+            return s.groupby(codes, sort=False).bfill()
+        if not len(s):
+            return s
+        # 그룹 번호는 처음 나온 순서이므로 각 그룹의 첫 행 위치 = 번호순 np.unique의 첫 등장 위치
+        _, first = np.unique(codes, return_index=True)
+        keys = [tuple(None if pd.isna(v) else v for v in row)
+                for row in df[by].iloc[first].itertuples(index=False, name=None)]
+        carry = self._carry.setdefault(col, {})
+        head = [(p, carry[k]) for p, k in zip(first, keys) if k in carry and pd.isna(s.iloc[p])]
+        if head:
+            s = s.copy()
+            s.iloc[[p for p, _ in head]] = [v for _, v in head]
+        s = s.groupby(codes, sort=False).ffill()
+        has = s.notna().to_numpy()
+        last = s[has].groupby(codes[has], sort=False).last()
+        carry.update(zip((keys[g] for g in last.index), last.tolist()))
+        return s
+
+    def _outlier(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self.outlier_state is None:
+            self.outlier_state = _freeze_outlier(df, self.outlier_rules)
+        for r in self.outlier_state:
+            if r.get("status") != "ok" or r.get("lo") is None:
+                continue
+            col = r["col"]
+            before = pd.to_numeric(df[col], errors="coerce")
+            s_num = _to_numeric(df[col])
+            if pd.api.types.is_integer_dtype(s_num.dtype):
+                s_num = s_num.astype("float64")
+            clipped = _cast_back_like(df[col], s_num.clip(lower=r["lo"], upper=r["hi"]))
+            r["changed"] += int(((before != pd.to_numeric(clipped, errors="coerce")) & before.notna()).sum())
+            df[col] = clipped
+        return df
+
+    def process(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        self.report["chunks"] += 1
+        self.report["rows_in"] += len(chunk)
+        df = self._clean(chunk)
+        if self.strategies:
+            df = self._impute(df)
+        if self.outlier_rules:
+            df = self._outlier(df)
+        self.report["rows_out"] += len(df)
+        return df
+
+    def run(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        for chunk in chunks:
+            yield self.process(chunk)
+        self.report["type_info"] = self.plan or {}
+        if self.impute_state is not None:
+            ratio = {c: n / self._rows for c, n in self._missing.items()} if self._rows else {}
+            self.report["impute"] = {
+                **self.impute_state,
+                "missing_ratio": ratio,
+                "over_threshold": [c for c, r in ratio.items() if r > self.drop_threshold],
+            }
+        if self.outlier_state is not None:
+            self.report["outlier"] = self.outlier_state
+
+
+def preprocess_stream(
+    chunks: Iterable[pd.DataFrame],
+    date_fmt: str = "YYYY-MM-DD",
+    strategies: Optional[Dict[str, Union[str, Dict[str, Any]]]] = None,
+    outlier_rules: Optional[List[Dict[str, Any]]] = None,
+) -> Iterator[pd.DataFrame]:
+    """StreamPreprocessor 단축 함수 (리포트가 필요 없을 때)"""
+    return StreamPreprocessor(date_fmt, strategies, outlier_rules).run(chunks)
@@ -0,0 +1,146 @@
+"""
+파싱 결과 로컬 캐시
+같은 입력 파일을 여러 명령(profile → preprocess → report ...)에서 반복해 읽을 때
+첫 파싱 결과를 Parquet로 저장해 두고 재사용합니다.
+
+- 위치: <SEC_CACHE_DIR 또는 ~/.smart_excel_copilot>/cache
+- 키: 파일 지문(경로/크기/수정시각 + 앞뒤 64KB 해시) + 로드 옵션
+- 용량: SEC_CACHE_MAX_MB (기본 2048MB) 초과 시 가장 오래 안 쓴 항목부터 삭제(LRU)
+- SEC_CACHE=0 이면 비활성, pyarrow가 없어도 비활성
+"""
+from __future__ import annotations
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MB = 2048
+DEFAULT_MIN_BYTES = 1024 * 1024   # 이보다 작은 파일은 다시 읽는 편이 빠름
+_EDGE_BYTES = 64 * 1024
+
+
+def cache_root() -> Path:
+    """로컬 캐시 루트 (SEC_CACHE_DIR로 변경 가능)"""
+    return Path(os.getenv("SEC_CACHE_DIR") or (Path.home() / ".smart_excel_copilot"))
+
+
+def cache_dir() -> Path:
+    return cache_root() / "cache"
+
+
+def enabled() -> bool:
+    if os.getenv("SEC_CACHE", "1").strip().lower() in ("0", "false", "off", "no"):
+        return False
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def min_bytes() -> int:
+    try:
+        return int(os.getenv("SEC_CACHE_MIN_BYTES", DEFAULT_MIN_BYTES))
+    except ValueError:
+        return DEFAULT_MIN_BYTES
+
+
+def max_bytes() -> int:
+    try:
+        return int(float(os.getenv("SEC_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+    except ValueError:
+        return DEFAULT_MAX_MB * 1024 * 1024
+
+
+def fingerprint(path: str) -> str:
+    """파일 지문: 경로/크기/수정시각 + 앞뒤 일부 내용 해시 (전체 해시 없이 변경 감지)"""
+    p = Path(path)
+    st = p.stat()
+    h = hashlib.sha1()
+    h.update(f"{p.resolve().as_posix()}|{st.st_size}|{st.st_mtime_ns}".encode("utf-8"))
+    with open(p, "rb") as f:
+        h.update(f.read(_EDGE_BYTES))
+        if st.st_size > _EDGE_BYTES:
+            f.seek(max(_EDGE_BYTES, st.st_size - _EDGE_BYTES))
+            h.update(f.read(_EDGE_BYTES))
+    return h.hexdigest()
+
+
+def cache_key(path: str, **options: Any) -> str:
+    opts = json.dumps(options, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(f"{fingerprint(path)}|{opts}".encode("utf-8")).hexdigest()
+
+
+def _entry(key: str) -> Path:
+    return cache_dir() / f"{key}.parquet"
+
+
+def get(key: str) -> Optional[pd.DataFrame]:
+    f = _entry(key)
+    if not f.exists():
+        return None
+    try:
+        df = pd.read_parquet(f)
+        os.utime(f)  # LRU: 마지막 사용 시각 갱신
+        return df
+    except Exception:
+        logger.debug("캐시 읽기 실패, 항목 삭제: %s", f, exc_info=True)
+        f.unlink(missing_ok=True)
+        return None
+
+
+def put(key: str, df: pd.DataFrame) -> bool:
+    """DataFrame을 캐시에 저장. Parquet로 표현할 수 없는 열(혼합 object 등)이면 건너뜀"""
+    f = _entry(key)
+    try:
+        f.parent.mkdir(parents=True, exist_ok=True)
+        tmp = f.with_suffix(".tmp")
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, f)
+    except Exception:
+        logger.debug("캐시 저장 건너뜀: %s", f, exc_info=True)
+        f.with_suffix(".tmp").unlink(missing_ok=True)
+        return False
+    evict()
+    return True
+
+
+def evict(limit: Optional[int] = None) -> int:
+    """용량 한도를 넘으면 오래 안 쓴 항목부터 삭제. 반환: 삭제한 항목 수"""
+    limit = max_bytes() if limit is None else limit
+    entries = []
+    for f in cache_dir().glob("*.parquet"):
+        try:
+            st = f.stat()
+            entries.append((st.st_mtime, st.st_size, f))
+        except OSError:
+            continue
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, f in sorted(entries, key=lambda e: e[0]):
+        if total <= limit:
+            break
+        f.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    return removed
+
+
+def stats() -> Dict[str, Any]:
+    files = list(cache_dir().glob("*.parquet"))
+    return {
+        "dir": str(cache_dir()),
+        "enabled": enabled(),
+        "entries": len(files),
+        "bytes": sum(f.stat().st_size for f in files),
+        "max_bytes": max_bytes(),
+    }
+
+
+def clear() -> int:
+    return evict(limit=0)
@@ -0,0 +1,158 @@
+"""
+압축 입력/출력 스트림
+.gz/.bz2/.xz/.zst/.zip 파일을 디스크에 풀지 않고 해제 스트림으로 열어 CSV 리더에 바로 넘깁니다.
+
+- 확장자로 압축 방식 판별 (data.csv.gz → gzip, 안쪽 형식 .csv)
+- .zip은 CSV 여러 개를 묶은 번들로 보고 멤버 단위로 읽음 (통합문서의 시트처럼)
+- zstd는 zstandard 패키지(pip install .[zstd]) 또는 Python 3.14+ compression.zstd 필요
+"""
+from __future__ import annotations
+import bz2
+import gzip
+import io
+import lzma
+import zipfile
+from pathlib import Path
+from typing import IO, List, Optional, Tuple, Union, cast
+
+COMPRESSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zst": "zstd", ".zip": "zip"}
+SUFFIXES = {method: suffix for suffix, method in COMPRESSIONS.items()}
+DATA_SUFFIXES = (".csv", ".tsv", ".txt")   # .zip 번들에서 읽는 멤버
+_GZIP_LEVEL = 6     # 기본 9는 느리고 크기 차이는 작음
+_ZSTD_LEVEL = 3
+_WRITE_BUFFER = 1 << 20
+
+PathLike = Union[str, Path]
+
+
+def compression_of(path: PathLike) -> Optional[str]:
+    """확장자로 압축 방식 판별 ('gzip' | 'bz2' | 'xz' | 'zstd' | 'zip' | None)"""
+    return COMPRESSIONS.get(Path(path).suffix.lower())
+
+
+def split_suffix(path: PathLike) -> Tuple[Path, str]:
+    """data.csv.gz → (data.csv, '.gz'). 압축 파일이 아니면 (path, '')"""
+    p = Path(path)
+    if compression_of(p):
+        return p.with_suffix(""), p.suffix
+    return p, ""
+
+
+def _check_method(method: str) -> str:
+    method = method.lower()
+    if method not in SUFFIXES:
+        raise ValueError(f"알 수 없는 압축 방식: {method} (가능: {', '.join(SUFFIXES)})")
+    return method
+
+
+def _zstd():
+    """zstd 구현 선택: Python 3.14+ 표준 모듈 → zstandard 패키지"""
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+        return "stdlib", zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+        return "zstandard", zstandard
+    except ImportError:
+        raise ImportError("zstd 압축 파일을 읽고 쓰려면 zstandard가 필요합니다 (pip install .[zstd])") from None
+
+
+def zip_members(path: PathLike) -> List[str]:
+    """zip 번들 안의 데이터 파일(CSV/TSV/TXT) 이름 목록 (폴더·macOS 메타데이터 제외)"""
+    with zipfile.ZipFile(path) as zf:
+        return [i.filename for i in zf.infolist()
+                if not i.is_dir() and not i.filename.startswith("__MACOSX/")
+                and i.filename.lower().endswith(DATA_SUFFIXES)]
+
+
+def open_read(path: PathLike, member: Optional[str] = None) -> IO[bytes]:
+    """압축 파일을 해제 스트림(바이너리)으로 열기. zip은 member(없으면 첫 데이터 파일)"""
+    method = compression_of(path)
+    if method == "gzip":
+        return cast(IO[bytes], gzip.open(path, "rb"))    # GzipFile은 타입 스텁상 IO[bytes]가 아님
+    if method == "bz2":
+        return bz2.open(path, "rb")
+    if method == "xz":
+        return lzma.open(path, "rb")
+    if method == "zstd":
+        impl, mod = _zstd()
+        if impl == "stdlib":
+            return mod.open(path, "rb")
+        reader = mod.ZstdDecompressor().stream_reader(open(path, "rb"), read_across_frames=True, closefd=True)
+        return io.BufferedReader(reader)
+    if method == "zip":
+        if member is None:
+            names = zip_members(path)
+            if not names:
+                raise ValueError(f"zip 안에 CSV 파일이 없습니다: {path}")
+            member = names[0]
+        zf = zipfile.ZipFile(path)
+        return io.BufferedReader(_ZipEntry(zf, zf.open(member, "r")))
+    return open(path, "rb")
+
+
+def open_write(path: PathLike, method: Optional[str] = None) -> IO[bytes]:
+    """압축 파일을 쓰기 스트림(바이너리)으로 열기. method가 없으면 확장자로 판별.
+    zip은 확장자를 뺀 이름(.csv 없으면 추가)의 멤버 하나로 기록
+    """
+    method = _check_method(method) if method else compression_of(path)
+    if method == "gzip":
+        return cast(IO[bytes], gzip.open(path, "wb", compresslevel=_GZIP_LEVEL))
+    if method == "bz2":
+        return bz2.open(path, "wb")
+    if method == "xz":
+        return lzma.open(path, "wb")
+    if method == "zstd":
+        impl, mod = _zstd()
+        if impl == "stdlib":
+            return mod.open(path, "wb", level=_ZSTD_LEVEL)
+        writer = mod.ZstdCompressor(level=_ZSTD_LEVEL).stream_writer(open(path, "wb"), closefd=True)
+        return io.BufferedWriter(writer, _WRITE_BUFFER)
+    if method == "zip":
+        inner = Path(path).with_suffix("").name if compression_of(path) == "zip" else Path(path).name
+        if not inner.lower().endswith(DATA_SUFFIXES):
+            inner += ".csv"
+        zf = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, compresslevel=_GZIP_LEVEL)
+        return io.BufferedWriter(_ZipEntry(zf, zf.open(inner, "w", force_zip64=True)), _WRITE_BUFFER)
+    return open(path, "wb")
+
+
+def with_suffix(path: PathLike, method: Optional[str]) -> Path:
+    """method에 맞는 압축 확장자를 붙인 경로 (이미 붙어 있으면 그대로)"""
+    p = Path(path)
+    if not method:
+        return p
+    suffix = SUFFIXES[_check_method(method)]
+    return p if p.suffix.lower() == suffix else p.with_name(p.name + suffix)
+
+
+class _ZipEntry(io.RawIOBase):
+    """zip 멤버 스트림 + 닫을 때 ZipFile도 함께 닫기"""
+
+    def __init__(self, zf: zipfile.ZipFile, entry):
+        self._zf = zf
+        self._entry = entry
+
+    def readable(self) -> bool:
+        return self._entry.readable()
+
+    def writable(self) -> bool:
+        return self._entry.writable()
+
+    def readinto(self, b) -> int:
+        data = self._entry.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def write(self, b) -> int:
+        return self._entry.write(b)
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                self._entry.close()
+            finally:
+                self._zf.close()
+        super().close()
@@ -1,71 +1,689 @@
 from __future__ import annotations
-import io, os, codecs
+import io, os, re, json, codecs, contextlib, functools, glob, logging, time, zipfile
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree.ElementTree import ParseError
 from pathlib import Path
 from typing import Optional, Tuple
 import pandas as pd
 import chardet
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List, Union
+from . import cache as _cache
+from . import compression as _compress
+from . import xlsx_reader, xlsx_writer
 
-def _try_read_csv(path: Path, encoding: str) -> pd.DataFrame:
-    return pd.read_csv(path, encoding=encoding)
+logger = logging.getLogger(__name__)
 
-def _detect_csv_encoding(path: Path) -> str:
-    # 매우 단순한 감지: UTF-8-SIG 우선, 안되면 cp949
+IO_ENGINES = ("pandas", "arrow")
+_ARROW_BLOCK_SIZE = 8 * 1024 * 1024
+XLSX_STREAM_MIN_ROWS = 50_000   # 이 행 수 이상이면 write_table이 스트리밍 xlsx 작성기 사용
+
+def _arrow_available() -> bool:
     try:
-        with open(path, 'rb') as f:
-            raw = f.read(4096)
-        if raw.startswith(codecs.BOM_UTF8):
-            return 'utf-8-sig'
-    except Exception:
-        pass
-    # pandas 시도
-    for enc in ('utf-8', 'utf-8-sig', 'cp949'):
+        import pyarrow.csv  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def _resolve_engine(engine: Optional[str]) -> str:
+    """요청한 IO 엔진을 확인하고, pyarrow가 없으면 pandas로 폴백"""
+    engine = (engine or "pandas").lower()
+    if engine not in IO_ENGINES:
+        raise ValueError(f"알 수 없는 IO 엔진: {engine} (가능: {', '.join(IO_ENGINES)})")
+    if engine == "arrow" and not _arrow_available():
+        logger.warning("pyarrow가 설치되어 있지 않아 pandas 엔진으로 전환합니다 (pip install .[fastio])")
+        return "pandas"
+    return engine
+
+def _arrow_read_options(encoding: str):
+    import pyarrow.csv as pv
+    enc = codecs.lookup(encoding or "utf-8").name
+    # utf-8(BOM 포함)은 pyarrow 네이티브 경로, 그 외는 pyarrow가 내부에서 변환
+    if enc in ("utf-8", "utf-8-sig"):
+        enc = "utf8"
+    return pv.ReadOptions(encoding=enc, use_threads=True, block_size=_ARROW_BLOCK_SIZE)
+
+def _arrow_to_pandas(table) -> pd.DataFrame:
+    import pyarrow as pa
+    def _mapper(t):
+        if pa.types.is_string(t) or pa.types.is_large_string(t):
+            return pd.StringDtype("pyarrow")
+        return None
+    return table.to_pandas(types_mapper=_mapper, split_blocks=True, self_destruct=True)
+
+def _csv_input(file_path: str, member: Optional[str] = None):
+    """CSV 리더에 넘길 입력. 압축 파일이면 해제 스트림을 여는 함수
+    (arrow 엔진은 스키마 확인과 본 읽기에서 두 번 열기 때문에 스트림 대신 함수를 넘김)
+    """
+    if _compress.compression_of(file_path) is None:
+        return file_path
+    return functools.partial(_compress.open_read, file_path, member)
+
+def _open_input(src):
+    return src() if callable(src) else src
+
+@contextlib.contextmanager
+def _opened(src):
+    """_csv_input 결과를 리더에 넘길 입력으로 열고, 해제 스트림이면 끝날 때 닫음"""
+    f = _open_input(src)
+    try:
+        yield f
+    finally:
+        if f is not src:
+            f.close()
+
+def _closing_chunks(reader, stream) -> Iterator[pd.DataFrame]:
+    """청크 반복이 끝나거나 중단되면 리더와 해제 스트림(없으면 None)을 닫음"""
+    try:
+        yield from reader
+    finally:
+        reader.close()
+        if stream is not None:
+            stream.close()
+
+def _read_csv_arrow(path, encoding: str, usecols: Optional[set] = None) -> pd.DataFrame:
+    """pyarrow 멀티스레드 파서로 CSV 읽기. 문자열은 Arrow 기반 string dtype 유지
+    usecols: 읽을 열 이름 집합 (없는 이름은 무시, None이면 전체)
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pv
+    ropts = _arrow_read_options(encoding)
+    # 날짜/시각 자동 변환은 pandas 엔진과 동작이 달라지므로 첫 블록 기준으로 문자열 고정
+    with _opened(path) as src:
+        probe = pv.open_csv(src, read_options=ropts)
+        fields = [f for f in probe.schema if usecols is None or f.name in usecols]
+        probe.close()
+    temporal = {f.name: pa.string() for f in fields if pa.types.is_temporal(f.type)}
+    copts = pv.ConvertOptions(strings_can_be_null=True, column_types=temporal,
+                              include_columns=None if usecols is None else [f.name for f in fields])
+    with _opened(path) as src:
+        table = pv.read_csv(src, read_options=ropts, convert_options=copts)
+    return _arrow_to_pandas(table)
+
+def _iter_csv_arrow(path, encoding: str, chunksize: int, usecols: Optional[set] = None) -> Iterator[pd.DataFrame]:
+    """pyarrow 스트리밍 리더로 chunksize 행씩 읽기.
+    스트리밍 리더는 첫 블록의 타입을 끝까지 강제하므로 문자열로 읽은 뒤 청크별로 캐스팅
+    (pandas 청크 읽기와 같은 청크 단위 타입 추론)
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pv
+    ropts = _arrow_read_options(encoding)
+    with _opened(path) as src:
+        probe = pv.open_csv(src, read_options=ropts)
+        inferred = [f for f in probe.schema if usecols is None or f.name in usecols]
+        probe.close()
+    copts = pv.ConvertOptions(strings_can_be_null=True,
+                              column_types={f.name: pa.string() for f in inferred},
+                              include_columns=None if usecols is None else [f.name for f in inferred])
+
+    def _cast(table):
+        cols = []
+        for i, f in enumerate(inferred):
+            col = table.column(i)
+            if pa.types.is_integer(f.type) or pa.types.is_floating(f.type) or pa.types.is_boolean(f.type):
+                for t in (f.type, pa.float64()):
+                    try:
+                        col = pc.cast(col, t)
+                        break
+                    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                        continue
+            cols.append(col)
+        return pa.Table.from_arrays(cols, names=table.column_names)
+
+    buf, n = [], 0
+    with _opened(path) as src:      # 생성기가 끝나거나 닫힐 때 해제 스트림도 닫힘
+        reader = pv.open_csv(src, read_options=ropts, convert_options=copts)
+        for batch in reader:
+            buf.append(batch)
+            n += batch.num_rows
+            while n >= chunksize:
+                table = pa.Table.from_batches(buf)
+                yield _arrow_to_pandas(_cast(table.slice(0, chunksize)))
+                rest = table.slice(chunksize)
+                buf, n = rest.to_batches(), rest.num_rows
+    if n:
+        yield _arrow_to_pandas(_cast(pa.Table.from_batches(buf)))
+
+def _try_read_csv(path: Path, encoding: str, engine: str = "pandas", chunksize: Optional[int] = None,
+                  usecols: Optional[set] = None):
+    if engine == "arrow":
+        if chunksize:
+            return _iter_csv_arrow(path, encoding, chunksize, usecols)
+        return _read_csv_arrow(path, encoding, usecols)
+    # 호출 가능한 usecols: 헤더에 없는 이름은 오류 없이 건너뜀
+    kw = {} if usecols is None else {"usecols": lambda c: c in usecols}
+    if chunksize:
+        # 헤더·인코딩 오류는 호출 시점에 드러나도록 리더는 바로 만들고, 스트림은 반복이 끝날 때 닫음
+        stream = _open_input(path)
         try:
-            pd.read_csv(path, encoding=enc, nrows=5)
-            return enc
-        except Exception:
+            reader = pd.read_csv(stream, encoding=encoding, chunksize=chunksize, **kw)
+        except BaseException:
+            if stream is not path:
+                stream.close()
+            raise
+        return _closing_chunks(reader, stream if stream is not path else None)
+    with _opened(path) as src:
+        return pd.read_csv(src, encoding=encoding, **kw)
+
+_FILTER_CHUNK_ROWS = 200_000   # 필터가 있으면 이 행 수씩 읽어 조건에 맞는 행만 남김
+
+def _filter_values(values) -> list:
+    """필터 값 목록. 문자열 '2024'가 숫자 열의 2024/2024.0과도 일치하도록 숫자 형태를 함께 넣음"""
+    if isinstance(values, (str, int, float)) or values is None:
+        values = [values]
+    out = list(values)
+    for v in values:
+        try:
+            f = float(v)
+        except (TypeError, ValueError):
             continue
-    return 'utf-8'
+        if f == f:
+            out.append(f)
+    return out
+
+def _apply_filters(df: pd.DataFrame, filters: Optional[Dict[str, Any]],
+                   columns: Optional[List[str]]) -> pd.DataFrame:
+    """{열: 값 | [값, …]} 조건(AND)으로 행을 거르고 columns만 남김. 없는 열의 조건은 무시"""
+    if filters:
+        mask = pd.Series(True, index=df.index)
+        for col, values in filters.items():
+            if col not in df.columns:
+                continue
+            vals = _filter_values(values)
+            s = df[col]
+            hit = s.isin(vals)
+            if not hit.all():
+                hit |= s.astype("string").isin([str(v) for v in vals]).fillna(False).astype(bool)
+            mask &= hit
+        if not mask.all():
+            df = df[mask]
+    if columns is not None:
+        keep = [c for c in df.columns if c in set(columns)]
+        if len(keep) != len(df.columns):
+            df = df[keep]
+    return df
+
+_RE_WHERE = re.compile(r"^\s*(.+?)\s*(?:==|=|\s+in\s+)\s*(.+?)\s*$", re.IGNORECASE)
+
+def parse_filters(exprs: Union[str, Iterable[str], None]) -> Dict[str, List[str]]:
+    """'도시 in [서울, 부산]', '카테고리=식품' 같은 단순 조건식을 {열: [값, …]}으로 변환.
+    같은 열이 여러 번 나오면 값을 합침 (열 사이는 AND, 값 사이는 OR)
+    """
+    if isinstance(exprs, str):
+        exprs = [exprs]
+    out: Dict[str, List[str]] = {}
+    for expr in exprs or []:
+        m = _RE_WHERE.match(expr)
+        if not m:
+            raise ValueError(f"필터 조건을 해석할 수 없습니다: {expr!r} (예: '도시 in [서울, 부산]', '카테고리=식품')")
+        col, raw = m.group(1).strip("'\"` "), m.group(2).strip()
+        if raw.startswith(("[", "(")) and raw.endswith(("]", ")")):
+            raw = raw[1:-1]
+        values = [v.strip().strip("'\"") for v in raw.split(",")]
+        out.setdefault(col, []).extend(v for v in values if v)
+    return out
+
+_SAMPLE_HEAD_BYTES = 256 * 1024   # 앞부분 샘플
+_SAMPLE_MID_BYTES = 64 * 1024     # 중간 샘플 1개 크기
+_SAMPLE_MID_COUNT = 3             # 중간 샘플 개수
+_ENCODING_CACHE_MAX = 512
+_encoding_cache: Dict[str, Dict[str, Any]] = {}
+
+def _encoding_cache_file() -> Path:
+    return _cache.cache_root() / "encoding_cache.json"
+
+def _file_key(path: Path) -> str:
+    st = path.stat()
+    return f"{path.resolve().as_posix()}|{st.st_size}|{st.st_mtime_ns}"
+
+def _load_encoding_cache() -> Dict[str, Dict[str, Any]]:
+    if not _encoding_cache:
+        try:
+            _encoding_cache.update(json.loads(_encoding_cache_file().read_text(encoding="utf-8")))
+        except Exception:
+            pass
+    return _encoding_cache
+
+def _store_encoding_cache(key: str, result: Dict[str, Any]) -> None:
+    cache = _load_encoding_cache()
+    cache[key] = result
+    while len(cache) > _ENCODING_CACHE_MAX:
+        cache.pop(next(iter(cache)))
+    try:
+        f = _encoding_cache_file()
+        f.parent.mkdir(parents=True, exist_ok=True)
+        tmp = f.with_suffix(".tmp")
+        tmp.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, f)
+    except Exception:
+        pass  # 캐시 저장 실패는 무시 (읽기 전용 홈 등)
+
+def _read_samples(path: Path) -> list:
+    """앞부분 + 중간 몇 군데만 읽어 감지용 샘플로 사용"""
+    size = path.stat().st_size
+    with open(path, 'rb') as f:
+        samples = [f.read(_SAMPLE_HEAD_BYTES)]
+        if size > _SAMPLE_HEAD_BYTES + _SAMPLE_MID_BYTES:
+            for i in range(1, _SAMPLE_MID_COUNT + 1):
+                f.seek(size * i // (_SAMPLE_MID_COUNT + 1))
+                chunk = f.read(_SAMPLE_MID_BYTES)
+                # 멀티바이트 문자 중간에서 시작하지 않도록 다음 줄부터 사용
+                samples.append(chunk[chunk.find(b"\n") + 1:])
+    return samples
+
+def _decodes_strict(samples: list, encoding: str) -> bool:
+    for raw in samples:
+        # final=False: 샘플 끝에서 잘린 멀티바이트 문자는 허용
+        dec = codecs.getincrementaldecoder(encoding)(errors="strict")
+        try:
+            dec.decode(raw, final=False)
+        except UnicodeDecodeError:
+            return False
+    return True
+
+def _read_stream_samples(path: Path, member: Optional[str]) -> list:
+    """압축 파일은 건너뛰며 읽을 수 없으므로 해제 스트림의 앞부분만 (일반 파일 샘플 총량만큼)"""
+    with _compress.open_read(path, member) as f:
+        return [f.read(_SAMPLE_HEAD_BYTES + _SAMPLE_MID_BYTES * _SAMPLE_MID_COUNT)]
+
+def _sniff_encoding(path: Path, member: Optional[str] = None) -> Dict[str, Any]:
+    if _compress.compression_of(path):
+        samples = _read_stream_samples(path, member)
+    else:
+        samples = _read_samples(path)
+    head = samples[0]
+    if head.startswith(codecs.BOM_UTF8):
+        return {"encoding": "utf-8-sig", "confidence": 1.0, "language": "", "method": "bom"}
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return {"encoding": "utf-16", "confidence": 1.0, "language": "", "method": "bom"}
+    for enc in ("utf-8", "cp949"):
+        if _decodes_strict(samples, enc):
+            return {"encoding": enc, "confidence": 1.0, "language": "Korean" if enc == "cp949" else "", "method": "strict"}
+    result = dict(chardet.detect(b"".join(samples)))
+    result["method"] = "chardet"
+    return result
+
+def detect_encoding(file_path: str, member: Optional[str] = None) -> Dict[str, Any]:
+    """파일의 인코딩을 감지합니다.
+    BOM → utf-8/cp949 엄격 디코딩 → chardet 순으로, 파일 전체가 아닌 앞부분과 중간 샘플만 봅니다.
+    압축 파일(.gz/.bz2/.xz/.zst/.zip)은 해제 스트림의 앞부분으로 감지 (zip은 member, 없으면 첫 CSV)
+    결과는 (경로, 크기, 수정시각) 기준으로 캐시되어 같은 파일은 다시 감지하지 않습니다.
+    """
+    p = Path(file_path)
+    if p.suffix.lower() in ('.xlsx', '.xlsm', '.xls'):
+        return {"encoding": None, "confidence": 1.0, "language": "", "method": "binary"}
+    key = _file_key(p) if member is None else f"{_file_key(p)}|{member}"
+    cached = _load_encoding_cache().get(key)
+    if cached is not None:
+        return dict(cached)
+    result = _sniff_encoding(p, member)
+    _store_encoding_cache(key, result)
+    return dict(result)
 
-def detect_encoding(file_path: str) -> Dict[str, Any]:
-    """파일의 인코딩을 감지합니다."""
-    with open(file_path, 'rb') as f:
-        raw_data = f.read()
-        result = chardet.detect(raw_data)
-        return result
+def _iter_frame(df: pd.DataFrame, chunksize: int) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start:start + chunksize]
 
-def load_table(file_path: str, sheet: Optional[str] = None, encoding: Optional[str] = None) -> Tuple[pd.DataFrame, Dict[str, Any]]:
-    """CSV 또는 Excel 파일을 로드합니다."""
+def _read_xlsx(file_path: str, sheet: Union[str, int, None], chunksize: Optional[int],
+               usecols: Optional[set] = None, filters: Optional[Dict[str, Any]] = None):
+    """스트리밍 XLSX 리더로 읽기. sheet=None이면 pd.read_excel처럼 {시트명: DataFrame}
+    (청크 모드는 첫 시트). 리더가 해석하지 못하는 파일은 pd.read_excel로 폴백
+    usecols/filters는 리더에 그대로 넘겨 선택한 열만 해석하고 조건에 맞는 행만 배열로 만듦
+    """
+    cols = None if usecols is None else list(usecols)
+    try:
+        if chunksize:
+            xlsx_reader.sheet_names(file_path)  # 패키지 구조를 먼저 확인해 폴백 여부 결정
+            return xlsx_reader.iter_xlsx(file_path, sheet=sheet or 0, usecols=cols, chunksize=chunksize, where=filters)
+        if sheet is None:
+            return {name: xlsx_reader.read_xlsx(file_path, name, usecols=cols, where=filters)
+                    for name in xlsx_reader.sheet_names(file_path)}
+        return xlsx_reader.read_xlsx(file_path, sheet, usecols=cols, where=filters)
+    except (KeyError, zipfile.BadZipFile, ParseError):
+        logger.warning("스트리밍 XLSX 리더 실패, pd.read_excel로 폴백: %s", file_path, exc_info=True)
+    df = pd.read_excel(file_path, sheet_name=sheet, usecols=None if usecols is None else (lambda c: c in usecols))
+    if chunksize:
+        if isinstance(df, dict):
+            df = next(iter(df.values()))
+        return _iter_frame(df, chunksize)
+    return df
+
+def load_table(file_path: str, sheet: Union[str, int, None] = None, encoding: Optional[str] = None,
+               chunksize: Optional[int] = None, engine: Optional[str] = None,
+               cache: bool = True, columns: Optional[List[str]] = None,
+               filters: Optional[Dict[str, Any]] = None) -> Tuple[Any, Dict[str, Any]]:
+    """CSV 또는 Excel 파일을 로드합니다.
+    chunksize가 주어지면 DataFrame 대신 chunksize 행 단위 DataFrame 이터레이터를 반환합니다.
+    engine: 'pandas'(기본) | 'arrow' (pyarrow 멀티스레드 CSV 파서, 미설치 시 pandas로 폴백)
+    cache: 파싱 결과를 로컬 Parquet 캐시에서 재사용 (app.io.cache, 청크 모드 제외)
+    columns: 읽을 열 이름 목록 (파일에 없는 이름은 무시, 순서는 파일 기준)
+    filters: {열: 값 | [값, …]} 일치 조건 (열 사이 AND, 값 사이 OR, 예: parse_filters('도시 in [서울, 부산]')).
+      CSV는 나눠 읽으며 청크마다, XLSX는 리더에서 행 단위로 거르므로 조건에 맞는 행만 메모리에 남음.
+      필터 결과의 인덱스는 0부터 다시 매김
+    압축 CSV(.gz/.bz2/.xz/.zst)는 디스크에 풀지 않고 해제 스트림으로 읽습니다.
+    .zip은 CSV 묶음으로 보고 sheet 자리에 멤버 이름/번호를 받습니다 (없으면 멤버가 하나일 때 DataFrame,
+    여럿이면 {멤버: DataFrame}, 청크 모드는 첫 멤버)
+    """
+    member = None
+    if _compress.compression_of(file_path) == "zip":
+        members = _compress.zip_members(file_path)
+        if not members:
+            raise Exception(f"파일 로드 실패: {file_path}, 오류: zip 안에 CSV 파일이 없습니다")
+        if sheet is None and len(members) > 1 and not chunksize:
+            out = {}
+            for name in members:
+                out[name], meta = load_table(file_path, sheet=name, encoding=encoding, engine=engine,
+                                             cache=cache, columns=columns, filters=filters)
+            meta["members"] = members
+            return out, meta
+        try:
+            member = sheet if isinstance(sheet, str) else members[sheet or 0]
+        except IndexError:
+            member = None
+        if member not in members:
+            raise Exception(f"파일 로드 실패: {file_path}, 오류: zip에 없는 멤버입니다: {sheet} (멤버: {members})")
+        sheet = member
+    detected = None
     if not encoding:
-        detected = detect_encoding(file_path)
-        encoding = detected.get('encoding', 'utf-8')
+        detected = detect_encoding(file_path, member)
+        encoding = detected.get('encoding') or 'utf-8'
+    engine = _resolve_engine(engine)
+    meta = {"encoding": encoding, "detected": detected, "engine": engine}
+    if member is not None:
+        meta["member"] = member
+    if chunksize:
+        meta["chunksize"] = chunksize
+    columns = None if columns is None else list(columns)
+    filters = filters or None
+    # 조건에 쓰는 열은 거른 뒤 columns에 없으면 버림
+    usecols = None if columns is None else set(columns) | set(filters or {})
+    if columns is not None:
+        meta["columns"] = columns
+    if filters:
+        meta["filters"] = filters
+    
+    key = None
+    if cache and not chunksize and _cache.enabled() and os.path.getsize(file_path) >= _cache.min_bytes():
+        opts = {"sheet": sheet, "encoding": encoding, "engine": engine}
+        if columns is not None or filters:
+            opts.update(columns=columns, filters=filters)
+        key = _cache.cache_key(file_path, **opts)
+        df = _cache.get(key)
+        if df is not None:
+            meta["cache"] = "hit"
+            return df, meta
+        meta["cache"] = "miss"
     
     try:
-        if file_path.endswith(('.xlsx', '.xls')):
-            df = pd.read_excel(file_path, sheet_name=sheet)
+        if file_path.lower().endswith(('.xlsx', '.xlsm')):
+            df = _read_xlsx(file_path, sheet, chunksize, usecols, filters)
+        elif file_path.lower().endswith('.xls'):
+            df = pd.read_excel(file_path, sheet_name=sheet,
+                               usecols=None if usecols is None else (lambda c: c in usecols))
+            if chunksize:
+                # 구형 xls는 청크 읽기를 지원하지 않으므로 읽은 뒤 나눠서 전달
+                if isinstance(df, dict):
+                    df = next(iter(df.values()))
+                df = _iter_frame(df, chunksize)
+        elif filters and not chunksize:
+            # 전체를 올리지 않고 나눠 읽으면서 조건에 맞는 행만 모음
+            parts = [_apply_filters(part, filters, columns) for part in
+                     _try_read_csv(_csv_input(file_path, member), encoding, engine=engine,
+                                   chunksize=_FILTER_CHUNK_ROWS, usecols=usecols)]
+            df = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=columns)
         else:
-            df = pd.read_csv(file_path, encoding=encoding)
-        
-        return df, {"encoding": encoding, "detected": detected if not encoding else None}
+            df = _try_read_csv(_csv_input(file_path, member), encoding, engine=engine, chunksize=chunksize, usecols=usecols)
     except Exception as e:
         raise Exception(f"파일 로드 실패: {file_path}, 오류: {str(e)}")
+    
+    if chunksize:
+        if columns is not None or filters:
+            df = (_apply_filters(part, filters, columns) for part in df)
+        return df, meta
+    if columns is not None or filters:
+        if isinstance(df, dict):
+            df = {name: _finish_filtered(d, filters, columns) for name, d in df.items()}
+        else:
+            df = _finish_filtered(df, filters, columns)
+    
+    if key is not None and isinstance(df, pd.DataFrame):
+        _cache.put(key, df)
+    return df, meta
+
+def _finish_filtered(df: pd.DataFrame, filters: Optional[Dict[str, Any]],
+                     columns: Optional[List[str]]) -> pd.DataFrame:
+    out = _apply_filters(df, filters, columns)
+    return out.reset_index(drop=True) if filters else out
+
+def sheet_names(file_path: str) -> List[str]:
+    """통합문서의 시트 이름 목록 (.xlsx는 스트리밍 리더로 workbook.xml만 읽음, .zip은 CSV 멤버 목록)"""
+    if _compress.compression_of(file_path) == "zip":
+        return _compress.zip_members(file_path)
+    if file_path.lower().endswith(".xls"):
+        return pd.ExcelFile(file_path).sheet_names
+    return xlsx_reader.sheet_names(file_path)
+
+def read_columns(file_path: str, sheet: Union[str, int, None] = None, encoding: Optional[str] = None) -> List[str]:
+    """데이터 행 없이 헤더(열 이름)만 읽기 — load_table(columns=…)에 넘길 열을 정할 때 사용"""
+    low = file_path.lower()
+    if low.endswith(('.xlsx', '.xlsm')):
+        try:
+            return list(xlsx_reader.read_xlsx(file_path, sheet or 0, nrows=0).columns)
+        except (KeyError, zipfile.BadZipFile, ParseError):
+            pass
+    if low.endswith(('.xlsx', '.xlsm', '.xls')):
+        return list(pd.read_excel(file_path, sheet_name=sheet or 0, nrows=0).columns)
+    member = None
+    if _compress.compression_of(file_path) == "zip":
+        member = sheet if isinstance(sheet, str) else _compress.zip_members(file_path)[sheet or 0]
+    encoding = encoding or detect_encoding(file_path, member).get('encoding') or 'utf-8'
+    with _compress.open_read(file_path, member) as f:
+        return list(pd.read_csv(f, encoding=encoding, nrows=0).columns)
+
+_GLOB_CHARS = set("*?[")
+
+def expand_paths(paths_or_globs: Union[str, Iterable[str]]) -> List[str]:
+    """경로/글롭 패턴 목록 → 실제 파일 목록 (순서 유지, 중복 제거). 문자열은 쉼표로 구분 가능"""
+    if isinstance(paths_or_globs, (str, os.PathLike)):
+        paths_or_globs = [x.strip() for x in str(paths_or_globs).split(",") if x.strip()]
+    out: List[str] = []
+    for item in paths_or_globs:
+        item = str(item)
+        matches = sorted(glob.glob(item, recursive=True)) if _GLOB_CHARS & set(item) else [item]
+        for m in matches:
+            if m not in out and not os.path.isdir(m):
+                out.append(m)
+    return out
+
+def _load_one(path: str, sheet: Union[str, int, None], engine: Optional[str], cache: bool,
+              columns: Optional[List[str]] = None, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """load_many 작업 단위 (프로세스 풀에서 실행되므로 모듈 최상위 함수)"""
+    t0 = time.perf_counter()
+    info: Dict[str, Any] = {"path": path, "sheet": sheet}
+    try:
+        df, meta = load_table(path, sheet=sheet, engine=engine, cache=cache, columns=columns, filters=filters)
+        info.update(rows=len(df), cols=len(df.columns), encoding=meta.get("encoding"), cache=meta.get("cache"))
+    except Exception as e:
+        df = None
+        info["error"] = str(e)
+    info["seconds"] = round(time.perf_counter() - t0, 3)
+    return {"df": df, "info": info}
+
+def load_many(paths_or_globs: Union[str, Iterable[str]], sheets: Union[str, int, List[Union[str, int]], None] = None,
+              concat: bool = False, workers: Optional[int] = None, engine: Optional[str] = None,
+              cache: bool = True, columns: Optional[List[str]] = None,
+              filters: Optional[Dict[str, Any]] = None) -> Tuple[Any, Dict[str, Any]]:
+    """여러 파일/시트를 프로세스 풀에서 동시에 로드합니다.
+    sheets: None이면 통합문서의 모든 시트, 이름/번호 하나면 그 시트만, 목록이면 해당 시트들
+      (.zip CSV 묶음은 멤버가 시트 역할, CSV는 무시)
+    columns/filters: 파일마다 load_table에 그대로 전달
+    반환: (결과, meta)
+      - concat=False: {경로: DataFrame} (sheets가 None/목록이면 통합문서는 {경로: {시트: DataFrame}})
+      - concat=True: 하나로 합친 DataFrame (출처 열 __file, __sheet 추가)
+      - meta: {"files": [파일·시트별 rows/seconds/error], "errors": 실패 수, "workers", "seconds"}
+    """
+    t0 = time.perf_counter()
+    files = expand_paths(paths_or_globs)
+    if not files:
+        raise FileNotFoundError(f"일치하는 입력 파일이 없습니다: {paths_or_globs}")
+    single_sheet = isinstance(sheets, (str, int))
+    tasks: List[Tuple[str, Union[str, int, None]]] = []
+    for f in files:
+        if not f.lower().endswith((".xlsx", ".xlsm", ".xls", ".zip")):
+            tasks.append((f, None))
+        elif isinstance(sheets, (str, int)):
+            tasks.append((f, sheets))
+        else:
+            names: List[Union[str, int]]
+            try:
+                names = list(sheets or sheet_names(f))
+            except Exception:
+                names = [0]  # 시트 목록을 못 읽으면 작업에서 오류로 보고됨
+            tasks.extend((f, name) for name in names)
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tasks)))
+    if workers == 1:
+        results = [_load_one(f, sh, engine, cache, columns, filters) for f, sh in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            n = len(tasks)
+            results = list(pool.map(_load_one, *zip(*tasks), [engine] * n, [cache] * n, [columns] * n, [filters] * n))
+
+    infos = [r["info"] for r in results]
+    meta = {"files": infos, "errors": sum(1 for i in infos if "error" in i), "workers": workers}
+    if concat:
+        frames = []
+        for (f, sh), r in zip(tasks, results):
+            if r["df"] is not None:
+                extra = {"__file": f} if sh is None else {"__file": f, "__sheet": sh}
+                frames.append(r["df"].assign(**extra))
+        out: Any = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    else:
+        out = {}
+        for (f, sh), r in zip(tasks, results):
+            if r["df"] is None:
+                continue
+            if sh is None or single_sheet:
+                out[f] = r["df"]
+            else:
+                out.setdefault(f, {})[sh] = r["df"]
+    meta["seconds"] = round(time.perf_counter() - t0, 3)
+    return out, meta
 
 def save_table(df: pd.DataFrame, src_path: str, suffix: str = "_clean") -> str:
-    p = Path(src_path)
+    p, comp = _compress.split_suffix(src_path)
+    if comp:
+        # 압축 입력은 같은 방식으로 압축한 CSV로 저장 (data.csv.gz → data_clean.csv.gz)
+        return write_table(df, str(p.with_name(p.stem + suffix + (p.suffix or ".csv") + comp)))["path"]
     out_path = str(p.with_name(p.stem + suffix + p.suffix))
     if p.suffix.lower() in {'.csv', '.txt'}:
         df.to_csv(out_path, index=False)
     elif p.suffix.lower() in {'.xlsx', '.xls'}:
-        df.to_excel(out_path, index=False)
+        write_table(df, out_path)
     else:
         df.to_csv(out_path + '.csv', index=False)
         out_path = out_path + '.csv'
     return out_path
 
-def write_table(df: pd.DataFrame, path: str, sheet: str | None = None):
-    """테이블을 파일로 저장합니다."""
+def _open_csv_output(p: Path, comp: Optional[str]):
+    """CSV 출력 텍스트 스트림 (utf-8-sig). comp가 있으면 압축 스트림 위에 엶"""
+    if not comp:
+        return open(p, "w", encoding="utf-8-sig", newline="")
+    return io.TextIOWrapper(_compress.open_write(p, comp), encoding="utf-8-sig", newline="")
+
+def _csv_output_path(path: str, compression: Optional[str]) -> Tuple[Path, Optional[str]]:
+    """압축 방식 결정 (인자 > 확장자)과 확장자가 붙은 출력 경로"""
     p = Path(path); p.parent.mkdir(parents=True, exist_ok=True)
-    if p.suffix.lower() in (".xlsx", ".xls"):
-        df.to_excel(p, index=False, sheet_name=(sheet or "Sheet1"))
+    comp = compression or _compress.compression_of(p)
+    return _compress.with_suffix(p, comp), comp
+
+def _datetime_columns(df: pd.DataFrame) -> List[str]:
+    return [c for c in df.columns if pd.api.types.is_datetime64_any_dtype(df[c].dtype)]
+
+def _csv_time_columns(df: pd.DataFrame) -> List[str]:
+    """시각까지 기록할 datetime 열 (자정이 아닌 값이 하나라도 있는 열)"""
+    return [c for c in _datetime_columns(df) if (df[c].dropna().dt.normalize() != df[c].dropna()).any()]
+
+def _format_csv_times(chunk: pd.DataFrame, time_cols: List[str]) -> pd.DataFrame:
+    """첫 청크에서 시각을 기록한 열은 이후 청크가 모두 자정이어도 같은 서식으로 (나머지 날짜 열은 to_csv 기본 서식)"""
+    fix = [c for c in time_cols if c in chunk.columns and c not in _csv_time_columns(chunk[[c]])]
+    if not fix:
+        return chunk
+    return chunk.assign(**{c: chunk[c].dt.strftime("%Y-%m-%d %H:%M:%S") for c in fix})
+
+def _apply_date_formats(ws, df: pd.DataFrame) -> None:
+    """to_excel로 쓴 시트의 datetime 열에 스트리밍 작성기와 같은 서식 (모두 자정이면 yyyy-mm-dd)"""
+    for c in _datetime_columns(df):
+        dt = df[c].dropna()
+        date_only = len(dt) and (dt.dt.normalize() == dt).all()
+        fmt = xlsx_writer.DEFAULT_DATE_FORMAT if date_only else xlsx_writer.DEFAULT_DATETIME_FORMAT
+        col = df.columns.get_loc(c) + 1
+        for (cell,) in ws.iter_rows(min_row=2, max_row=len(df) + 1, min_col=col, max_col=col):
+            cell.number_format = fmt
+
+def write_table(df: pd.DataFrame, path: str, sheet: str | None = None,
+                number_formats: Optional[Dict[str, str]] = None, streaming: Optional[bool] = None,
+                split: str = "sheets", compression: Optional[str] = None) -> Dict[str, Any]:
+    """테이블을 파일로 저장합니다.
+    xlsx는 XLSX_STREAM_MIN_ROWS 행 이상이거나 number_formats가 있으면 스트리밍 작성기(app.io.xlsx_writer)로,
+    그 밖에는 df.to_excel로 저장합니다. streaming=True/False로 강제할 수 있습니다.
+    datetime 열 서식은 여기서 정합니다: xlsx는 날짜 셀(두 경로 모두 자정뿐이면 yyyy-mm-dd),
+    CSV는 모두 자정이면 'YYYY-MM-DD', 아니면 'YYYY-MM-DD HH:MM:SS'.
+    시트 행 한도를 넘으면 항상 스트리밍으로 sheet_1, sheet_2, …(split="files"면 여러 파일)로 나눕니다.
+    CSV는 compression('gzip'|'bz2'|'xz'|'zstd'|'zip') 또는 경로 확장자(.csv.gz 등)에 따라 압축해 씁니다
+    (확장자가 없으면 붙임).
+    반환: {"path", "rows", "split", "parts"} (CSV는 {"path", "rows"})
+    """
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    if streaming is None:
+        streaming = len(df) >= XLSX_STREAM_MIN_ROWS or bool(number_formats)
+    if p.suffix.lower() in (".xlsx", ".xls") and len(df) > xlsx_writer.MAX_SHEET_ROWS - 1:
+        streaming = True
+    if p.suffix.lower() in (".xlsx", ".xls") and streaming:
+        return xlsx_writer.export_xlsx(df, p, sheet=sheet or "Sheet1", number_formats=number_formats, split=split)
+    elif p.suffix.lower() in (".xlsx", ".xls"):
+        with pd.ExcelWriter(p, engine="openpyxl") as xw:
+            df.to_excel(xw, index=False, sheet_name=(sheet or "Sheet1"))
+            _apply_date_formats(xw.sheets[sheet or "Sheet1"], df)
+        return {"path": str(p), "rows": len(df), "split": False,
+                "parts": [{"path": str(p), "sheet": sheet or "Sheet1", "rows": len(df)}]}
     else:
-        df.to_csv(p, index=False, encoding="utf-8-sig")
+        p, comp = _csv_output_path(path, compression)
+        if not comp:
+            df.to_csv(p, index=False, encoding="utf-8-sig")
+        else:
+            with _open_csv_output(p, comp) as f:
+                df.to_csv(f, index=False)
+        return {"path": str(p), "rows": len(df)}
+
+
+def export_table(chunks: Iterable[pd.DataFrame], path: str, sheet: str | None = None,
+                 split: str = "sheets", compression: Optional[str] = None) -> Dict[str, Any]:
+    """DataFrame 청크를 순서대로 이어 씁니다(메모리 사용량은 청크 1개 분량).
+    xlsx는 시트 행 한도를 넘으면 나눠 저장, CSV는 write_table처럼 압축 가능. 반환 형식은 write_table과 같음.
+    datetime 열 서식은 첫 청크 기준 (첫 청크에 시각이 있던 열은 이후 청크도 시각까지)
+    """
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    if p.suffix.lower() in (".xlsx", ".xls"):
+        return xlsx_writer.export_xlsx(chunks, p, sheet=sheet or "Sheet1", split=split)
+    p, comp = _csv_output_path(path, compression)
+    n_rows = 0
+    time_cols: List[str] = []
+    with _open_csv_output(p, comp) as f:
+        for i, chunk in enumerate(chunks):
+            if i == 0:
+                time_cols = _csv_time_columns(chunk)
+            else:
+                chunk = _format_csv_times(chunk, time_cols)
+            chunk.to_csv(f, index=False, header=(i == 0))
+            n_rows += len(chunk)
+    return {"path": str(p), "rows": n_rows}
+
+
+def write_table_chunks(chunks: Iterable[pd.DataFrame], path: str, sheet: str | None = None) -> int:
+    """DataFrame 청크를 순서대로 이어 씁니다(export_table 참고).
+    반환: 기록한 데이터 행 수
+    """
+    return export_table(chunks, path, sheet=sheet)["rows"]
@@ -0,0 +1,427 @@
+"""
+스트리밍 XLSX 리더
+openpyxl 객체 모델을 만들지 않고 시트 XML과 sharedStrings를 iterparse로 직접 읽어
+열 단위 NumPy 배열로 DataFrame을 만듭니다.
+
+- 열 선택(usecols), 행 수 제한(nrows), 값 필터(where)를 읽는 단계에서 적용
+- iter_xlsx()로 chunksize 행씩 나눠 읽기 (메모리 = sharedStrings + 청크 1개)
+- 결과는 pd.read_excel(header=0)과 같은 규칙: 첫 행이 헤더, 빈 헤더는 'Unnamed: i',
+  날짜 서식 숫자는 datetime64, 정수만 있는 열은 int64
+"""
+from __future__ import annotations
+import re
+import zipfile
+import posixpath
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from xml.etree.ElementTree import iterparse
+import numpy as np
+import pandas as pd
+
+_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_NS_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_T_ROW, _T_C, _T_V, _T_IS, _T_T, _T_R, _T_RPH = (
+    _NS + "row", _NS + "c", _NS + "v", _NS + "is", _NS + "t", _NS + "r", _NS + "rPh"
+)
+
+# Excel 기본 날짜/시각 서식 ID
+_BUILTIN_DATE_FMTS = set(range(14, 23)) | {45, 46, 47}
+_RE_FMT_STRIP = re.compile(r'"[^"]*"|\\.|\[[^\]]*\]')
+_RE_FMT_DATE = re.compile(r"[dmyhs]", re.IGNORECASE)
+_DIGITS = "0123456789"
+
+_KIND_NUM, _KIND_STR, _KIND_BOOL, _KIND_DATE = 1, 2, 4, 8
+
+
+def _col_index(ref: str) -> int:
+    """'AB12' → 27 (0-based 열 번호)"""
+    letters = ref.rstrip("0123456789")
+    n = 0
+    for ch in letters:
+        n = n * 26 + (ord(ch) - 64)
+    return n - 1
+
+
+def _is_date_format(code: str) -> bool:
+    if not code or code.lower() == "general":
+        return False
+    return bool(_RE_FMT_DATE.search(_RE_FMT_STRIP.sub("", code)))
+
+
+class _Workbook:
+    """xlsx 패키지 메타데이터(시트 목록/공유 문자열/날짜 서식) 로더"""
+
+    def __init__(self, path: str):
+        self.zf = zipfile.ZipFile(path)
+        self.sheets, self.date1904 = self._read_workbook()
+        self._strings: Optional[List[str]] = None
+        self._date_styles: Optional[set] = None
+
+    def close(self):
+        self.zf.close()
+
+    def _read_workbook(self) -> Tuple[Dict[str, str], bool]:
+        rels: Dict[str, str] = {}
+        with self.zf.open("xl/_rels/workbook.xml.rels") as f:
+            for _, el in iterparse(f):
+                if el.tag == _NS_PKG_REL + "Relationship":
+                    target = el.get("Target", "")
+                    target = target.lstrip("/") if target.startswith("/") else posixpath.join("xl", target)
+                    rels[el.get("Id", "")] = posixpath.normpath(target)
+        sheets: Dict[str, str] = {}
+        date1904 = False
+        with self.zf.open("xl/workbook.xml") as f:
+            for _, el in iterparse(f):
+                if el.tag == _NS + "sheet":
+                    sheets[el.get("name", "")] = rels.get(el.get(_NS_REL + "id", ""), "")
+                elif el.tag == _NS + "workbookPr":
+                    date1904 = el.get("date1904", "0") in ("1", "true")
+        return sheets, date1904
+
+    @property
+    def strings(self) -> List[str]:
+        if self._strings is None:
+            out: List[str] = []
+            if "xl/sharedStrings.xml" in self.zf.namelist():
+                with self.zf.open("xl/sharedStrings.xml") as f:
+                    for _, el in iterparse(f):
+                        if el.tag == _NS + "si":
+                            out.append(_inline_text(el))
+                            el.clear()
+            self._strings = out
+        return self._strings
+
+    @property
+    def date_styles(self) -> set:
+        """날짜/시각 서식이 적용된 cellXfs 인덱스 집합"""
+        if self._date_styles is None:
+            styles = set()
+            if "xl/styles.xml" in self.zf.namelist():
+                custom: Dict[int, str] = {}
+                xfs: List[int] = []
+                in_cell_xfs = False
+                with self.zf.open("xl/styles.xml") as f:
+                    for ev, el in iterparse(f, events=("start", "end")):
+                        if el.tag == _NS + "cellXfs":
+                            in_cell_xfs = ev == "start"
+                        elif ev == "end" and el.tag == _NS + "numFmt":
+                            custom[int(el.get("numFmtId"))] = el.get("formatCode", "")
+                        elif ev == "end" and el.tag == _NS + "xf" and in_cell_xfs:
+                            xfs.append(int(el.get("numFmtId", 0)))
+                for i, fmt_id in enumerate(xfs):
+                    if fmt_id in _BUILTIN_DATE_FMTS or _is_date_format(custom.get(fmt_id, "")):
+                        styles.add(i)
+            self._date_styles = styles
+        return self._date_styles
+
+    def sheet_part(self, sheet: Union[str, int, None]) -> str:
+        names = list(self.sheets)
+        if sheet is None:
+            sheet = 0
+        if isinstance(sheet, int):
+            if sheet >= len(names):
+                raise ValueError(f"시트 인덱스 범위 초과: {sheet} (시트 수 {len(names)})")
+            sheet = names[sheet]
+        if sheet not in self.sheets:
+            raise ValueError(f"시트를 찾을 수 없습니다: {sheet} / 사용 가능 시트: {names}")
+        return self.sheets[sheet]
+
+
+def _inline_text(el) -> str:
+    """<si>/<is> 요소의 텍스트 (서식 run 결합, 윗주(rPh) 제외)"""
+    t = el.find(_T_T)
+    if t is not None and len(el) == 1:
+        return t.text or ""
+    parts = []
+    for r in el.iter(_T_R):
+        rt = r.find(_T_T)
+        if rt is not None and rt.text:
+            parts.append(rt.text)
+    if not parts and t is not None:
+        return t.text or ""
+    return "".join(parts)
+
+
+def _iter_rows(wb: _Workbook, part: str, select: Optional[set] = None
+               ) -> Iterator[Tuple[int, Dict[int, Tuple[int, Any]], bool]]:
+    """(행 번호, {열 번호: (종류, 값)}, 값 있는 셀 존재 여부) 를 순서대로 생성.
+    행 요소는 처리 후 바로 해제
+    select: 값을 해석할 열 번호 집합. 비어 있으면 전체 (헤더를 읽은 뒤 채워도 됨)
+    """
+    strings = wb.strings
+    date_styles = wb.date_styles
+    col_of: Dict[str, int] = {}      # 'AB' → 27
+    is_date: Dict[str, bool] = {}    # 스타일 인덱스 문자열 → 날짜 서식 여부
+    with wb.zf.open(part) as f:
+        parent = None
+        for ev, el in iterparse(f, events=("start", "end")):
+            if ev == "start":
+                if el.tag == _NS + "sheetData":
+                    parent = el
+                continue
+            if el.tag != _T_ROW:
+                continue
+            row_no = int(el.get("r", 0))
+            cells: Dict[int, Tuple[int, Any]] = {}
+            filled = False
+            pos = 0
+            for c in el:
+                if c.tag != _T_C:
+                    continue
+                ref = c.get("r")
+                if ref:
+                    letters = ref.rstrip(_DIGITS)
+                    col = col_of.get(letters)
+                    if col is None:
+                        col = col_of[letters] = _col_index(letters)
+                else:
+                    col = pos
+                pos = col + 1
+                if select and col not in select:
+                    filled = filled or len(c) > 0
+                    continue
+                t = c.get("t")
+                if t == "inlineStr":
+                    is_el = c.find(_T_IS)
+                    if is_el is not None:
+                        cells[col] = (_KIND_STR, _inline_text(is_el))
+                    continue
+                v = c.find(_T_V)
+                if v is None or v.text is None:
+                    continue
+                if t == "s":
+                    cells[col] = (_KIND_STR, strings[int(v.text)])
+                elif t is None or t == "n":
+                    st = c.get("s")
+                    if st is None:
+                        cells[col] = (_KIND_NUM, float(v.text))
+                    else:
+                        d = is_date.get(st)
+                        if d is None:
+                            d = is_date[st] = int(st) in date_styles
+                        cells[col] = (_KIND_DATE, _Serial(v.text)) if d else (_KIND_NUM, float(v.text))
+                elif t == "b":
+                    cells[col] = (_KIND_BOOL, v.text == "1")
+                else:  # str(수식 결과), e(오류)
+                    cells[col] = (_KIND_STR, v.text)
+            yield row_no, cells, filled or bool(cells)
+            el.clear()
+            if parent is not None:
+                parent.clear()
+
+
+class _Serial(float):
+    """날짜 서식이 적용된 셀의 Excel 일련번호 (혼합 열에서 일반 숫자와 구분)"""
+    __slots__ = ()
+
+
+def _serial_to_datetime(arr: np.ndarray, date1904: bool) -> np.ndarray:
+    """Excel 일련번호 배열 → datetime64[us]. openpyxl(from_excel)과 같게 소수부는 밀리초 반올림"""
+    origin = np.datetime64("1904-01-01" if date1904 else "1899-12-30", "us")
+    day, frac = np.divmod(arr, 1)
+    us = day * 86_400_000_000 + np.round(frac * 86_400_000) * 1000
+    missing = np.isnan(us)
+    out = origin + np.where(missing, 0, us).astype("timedelta64[us]")
+    out[missing] = np.datetime64("NaT")
+    return out
+
+
+def _finish_column(values: List[Any], kinds: int, date1904: bool) -> Any:
+    """수집한 셀 값 목록을 dtype에 맞는 배열로 변환"""
+    n = len(values)
+    if kinds == 0:
+        return np.full(n, np.nan)
+    if kinds in (_KIND_NUM, _KIND_DATE):
+        arr = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+        if kinds == _KIND_DATE:
+            return _serial_to_datetime(arr, date1904)
+        if n and not np.isnan(arr).any() and np.all(np.mod(arr, 1) == 0) and np.abs(arr).max() < 2 ** 53:
+            return arr.astype(np.int64)
+        return arr
+    if kinds == _KIND_BOOL and None not in values:
+        return np.array(values, dtype=bool)
+    # 혼합 열: 날짜 서식 셀만 Timestamp로, 정수 값은 int로 (openpyxl 셀 값과 동일)
+    pos = [i for i, v in enumerate(values) if isinstance(v, _Serial)]
+    if pos:
+        stamps = _serial_to_datetime(np.array([values[i] for i in pos], dtype=np.float64), date1904)
+        for i, ts in zip(pos, pd.DatetimeIndex(stamps)):
+            values[i] = ts
+    if kinds & _KIND_NUM:
+        values = [int(v) if isinstance(v, float) and v.is_integer() else v for v in values]
+    values = [np.nan if v is None else v for v in values]
+    # 문자열/혼합: pd.read_excel과 같은 dtype 추론(pandas 3에서는 str dtype)
+    return pd.Series(values, dtype=object).infer_objects().array
+
+
+def _header_names(cells: Dict[int, Tuple[int, Any]], width: int) -> List[str]:
+    names: List[str] = []
+    seen: Dict[str, int] = {}
+    for i in range(width):
+        kv = cells.get(i)
+        if kv is None:
+            name = f"Unnamed: {i}"
+        else:
+            v = kv[1]
+            name = str(int(v)) if isinstance(v, float) and v.is_integer() else str(v)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _resolve_usecols(names: List[str], usecols: Optional[Sequence[Union[str, int]]]) -> List[int]:
+    if usecols is None:
+        return list(range(len(names)))
+    idx = []
+    for u in usecols:
+        if isinstance(u, int):
+            idx.append(u)
+        elif u in names:
+            idx.append(names.index(u))
+    return sorted(set(i for i in idx if 0 <= i < len(names)))
+
+
+def _where_sets(names: List[str], where: Optional[Dict[str, Any]]) -> List[Tuple[int, set]]:
+    """{열: 값 | [값, …]} → [(열 번호, 허용값 집합)]. 헤더에 없는 열은 무시
+    셀 값은 문자열/실수로 읽히므로 '2024'와 2024.0이 서로 일치하도록 문자열·숫자 형태를 함께 넣음
+    """
+    out = []
+    for col, values in (where or {}).items():
+        if col not in names:
+            continue
+        if isinstance(values, (str, int, float)) or values is None:
+            values = [values]
+        allowed = set()
+        for v in values:
+            allowed.add(v)
+            allowed.add(str(v))
+            try:
+                f = float(v)
+            except (TypeError, ValueError):
+                continue
+            if f == f:
+                allowed.add(f)
+        out.append((names.index(col), allowed))
+    return out
+
+
+def _row_matches(cells: Dict[int, Tuple[int, Any]], match: List[Tuple[int, set]]) -> bool:
+    for ci, allowed in match:
+        kv = cells.get(ci)
+        if kv is None or (kv[1] not in allowed and str(kv[1]) not in allowed):
+            return False
+    return True
+
+
+def sheet_names(path: str) -> List[str]:
+    wb = _Workbook(path)
+    try:
+        return list(wb.sheets)
+    finally:
+        wb.close()
+
+
+def iter_xlsx(path: str, sheet: Union[str, int, None] = None,
+              usecols: Optional[Sequence[Union[str, int]]] = None,
+              nrows: Optional[int] = None, chunksize: Optional[int] = None,
+              where: Optional[Dict[str, Any]] = None) -> Iterator[pd.DataFrame]:
+    """시트를 chunksize 행 단위 DataFrame으로 스트리밍 (chunksize 없으면 한 번에)
+    where: {열: 값 | [값, …]} — 모든 조건을 만족하는 행만 배열로 만듦 (nrows는 원본 행 기준,
+    결과 인덱스는 남은 행 기준 0부터)
+    """
+    wb = _Workbook(path)
+    try:
+        part = wb.sheet_part(sheet)
+        select: set = set()
+        rows = _iter_rows(wb, part, select)
+        header = next(((no, cells) for no, cells, _ in rows if cells), None)
+        if header is None:
+            yield pd.DataFrame()
+            return
+        header_no, header_cells = header
+        names = _header_names(header_cells, max(header_cells) + 1)
+        keep = _resolve_usecols(names, usecols)
+        match = _where_sets(names, where)
+        if usecols is not None:
+            select.update(keep or [-1])  # 헤더 이후 행은 선택한 열만 해석
+            select.update(ci for ci, _ in match)
+        keep_names = [names[i] for i in keep]
+
+        cols: List[List[Any]] = [[] for _ in keep]
+        kinds = [0] * len(keep)
+        limit = float("inf") if nrows is None else nrows
+        total = 0  # 읽은 원본 행 수 (nrows 기준)
+        out = 0    # 결과에 담은 행 수 (where로 거른 뒤)
+
+        def _widen(width: int):
+            # 헤더보다 넓은 데이터 행: pd.read_excel처럼 'Unnamed: i' 열을 추가
+            for i in range(len(names), width):
+                names.append(f"Unnamed: {i}")
+                keep.append(i)
+                keep_names.append(names[i])
+                cols.append([None] * len(cols[0]) if cols else [])
+                kinds.append(0)
+
+        def _append(cells: Dict[int, Tuple[int, Any]]):
+            if usecols is None and cells and max(cells) >= len(names):
+                _widen(max(cells) + 1)
+            for j, ci in enumerate(keep):
+                kv = cells.get(ci)
+                if kv is None:
+                    cols[j].append(None)
+                else:
+                    kinds[j] |= kv[0]
+                    cols[j].append(kv[1])
+
+        def _flush(n: int) -> pd.DataFrame:
+            data = {name: _finish_column(cols[j], kinds[j], wb.date1904) for j, name in enumerate(keep_names)}
+            df = pd.DataFrame(data, columns=keep_names, index=pd.RangeIndex(out - n, out))
+            for j in range(len(keep)):
+                cols[j] = []
+                kinds[j] = 0
+            return df
+
+        last_no = header_no
+        pending = 0
+        emitted = False
+        for row_no, cells, filled in rows:
+            if not filled:
+                continue
+            # 중간의 빈 행은 pd.read_excel처럼 NaN 행으로 유지
+            gap = row_no - last_no - 1 if row_no else 0
+            last_no = row_no if row_no else last_no + 1
+            for _ in range(max(gap, 0)):
+                if total >= limit:
+                    break
+                total += 1
+                if not match:  # 빈 행은 어떤 조건과도 일치하지 않음
+                    _append({})
+                    out += 1
+                    pending += 1
+            if total >= limit:
+                break
+            total += 1
+            if match and not _row_matches(cells, match):
+                continue
+            _append(cells)
+            out += 1
+            pending += 1
+            if chunksize and pending >= chunksize:
+                emitted = True
+                yield _flush(pending)
+                pending = 0
+        if pending or not emitted:
+            yield _flush(pending)
+    finally:
+        wb.close()
+
+
+def read_xlsx(path: str, sheet: Union[str, int, None] = None,
+              usecols: Optional[Sequence[Union[str, int]]] = None,
+              nrows: Optional[int] = None, where: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    """시트 하나를 DataFrame으로 읽기 (pd.read_excel(sheet_name=sheet) 대체)"""
+    return next(iter_xlsx(path, sheet=sheet, usecols=usecols, nrows=nrows, where=where))
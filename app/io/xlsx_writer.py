@@ -0,0 +1,396 @@
+"""
+스트리밍 XLSX 작성기
+openpyxl 셀 객체 없이 시트 XML을 배치 단위로 zip 항목에 바로 써 내려갑니다.
+
+- 메모리: 배치(batch_rows 행) 1개 분량 + 상한이 있는 공유 문자열표
+  (반복되는 짧은 문자열만 등록, 상한을 넘거나 긴 문자열은 inlineStr로 기록)
+- 열별 숫자 서식(number_formats={"금액": "₩#,##0"}), 시트 이름 지정, 여러 시트
+- 시트 한도(1,048,576행)를 넘으면 name_1, name_2, … 시트나 여러 파일로 자동 분할 (export_xlsx)
+- datetime64 열은 Excel 날짜 일련번호 + 날짜 서식으로 저장 (pd.read_excel로 다시 읽으면 datetime64)
+"""
+from __future__ import annotations
+import os
+import re
+import zipfile
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from xml.sax.saxutils import escape, quoteattr
+import numpy as np
+import pandas as pd
+
+DEFAULT_BATCH_ROWS = 20_000
+DEFAULT_MAX_SHARED_STRINGS = 100_000   # 공유 문자열표 상한 (메모리 상한 역할)
+DEFAULT_DATETIME_FORMAT = "yyyy-mm-dd hh:mm:ss"
+DEFAULT_DATE_FORMAT = "yyyy-mm-dd"
+MAX_SHEET_ROWS = 1_048_576
+MAX_SHEET_COLS = 16_384
+
+_EPOCH = np.datetime64("1899-12-30", "ns")
+_DAY_NS = 86_400 * 10 ** 9
+_RE_ILLEGAL_XML = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_RE_BAD_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+_SST_MAX_LEN = 255  # 이보다 긴 문자열은 항상 inlineStr
+_NUMFMT_BASE_ID = 164  # 사용자 정의 서식 ID 시작값
+
+_XML_HEAD = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS_PKG = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+
+def _col_letter(i: int) -> str:
+    """0 → 'A', 27 → 'AB'"""
+    s = ""
+    i += 1
+    while i:
+        i, r = divmod(i - 1, 26)
+        s = chr(65 + r) + s
+    return s
+
+
+def _text(v: Any) -> str:
+    return escape(_RE_ILLEGAL_XML.sub("", str(v)))
+
+
+def _check_sheet_name(name: str, used: List[str]) -> str:
+    if not name or len(name) > 31 or _RE_BAD_SHEET_CHARS.search(name):
+        raise ValueError(f"사용할 수 없는 시트 이름입니다(31자 이내, []:*?/\\ 제외): {name!r}")
+    if name.lower() in (u.lower() for u in used):
+        raise ValueError(f"시트 이름이 중복됩니다: {name!r}")
+    return name
+
+
+def split_sheet_names(base: str, n: int) -> List[str]:
+    """'정리본' → ['정리본_1', '정리본_2', …] (31자 한도에 맞춰 앞부분을 자름)"""
+    names = []
+    for i in range(1, n + 1):
+        suffix = f"_{i}"
+        names.append(base[:31 - len(suffix)] + suffix)
+    return names
+
+
+def _split_rows(chunks: Iterable[pd.DataFrame], max_rows: int) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """청크를 (분할 번호, 조각)으로 다시 나눔. 분할 하나는 최대 max_rows 행"""
+    part, used = 0, 0
+    for chunk in chunks:
+        if len(chunk) == 0:
+            yield part, chunk
+            continue
+        start = 0
+        while start < len(chunk):
+            if used == max_rows:
+                part, used = part + 1, 0
+            take = min(max_rows - used, len(chunk) - start)
+            yield part, chunk.iloc[start:start + take]
+            used += take
+            start += take
+
+
+class XlsxStreamWriter:
+    """배치 단위로 시트를 기록하는 write-only xlsx 작성기
+
+    with XlsxStreamWriter("out.xlsx") as w:
+        w.write_sheet("정리본", df, number_formats={"금액": "#,##0"})
+        w.write_sheet("요약", chunks)          # DataFrame 이터레이터도 가능
+    """
+
+    def __init__(self, path: Union[str, Path], batch_rows: int = DEFAULT_BATCH_ROWS,
+                 max_shared_strings: int = DEFAULT_MAX_SHARED_STRINGS, max_rows: Optional[int] = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_rows = max(1, int(batch_rows))
+        self.max_shared_strings = max_shared_strings
+        self.max_rows = max(1, int(max_rows or MAX_SHEET_ROWS - 1))
+        self.parts: Dict[str, List[Dict[str, Any]]] = {}
+        self._sst: Dict[str, int] = {}
+        self.sheets: List[str] = []
+        self._formats: List[str] = []   # cellXfs 1.. 에 대응하는 서식 코드 (0 = 기본, 헤더는 별도)
+        self._zf = zipfile.ZipFile(self.path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1)
+        self._closed = False
+
+    def __enter__(self) -> "XlsxStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ---- 스타일 ----
+    def _style_of(self, fmt: Optional[str]) -> int:
+        """서식 코드 → cellXfs 인덱스 (0: 기본, 1: 헤더, 2..: 서식)"""
+        if not fmt:
+            return 0
+        if fmt not in self._formats:
+            self._formats.append(fmt)
+        return self._formats.index(fmt) + 2
+
+    # ---- 셀 직렬화 ----
+    def _column_cells(self, s: pd.Series, letter: str, rows: pd.Series, fmt: Optional[str]) -> pd.Series:
+        """열 하나를 '<c ...>...</c>' 문자열 Series로 (결측은 빈 문자열)"""
+        ref = '<c r="' + letter + rows
+        dtype = s.dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            mask = s.notna().to_numpy()
+            vals = pd.Series(np.where(s.fillna(False).to_numpy(dtype=bool), "1", "0"), index=rows.index)
+            out = ref + '" t="b"><v>' + vals + "</v></c>"
+        elif pd.api.types.is_numeric_dtype(dtype):
+            num = pd.to_numeric(s, errors="coerce").astype("float64").to_numpy()
+            mask = np.isfinite(num)
+            if pd.api.types.is_integer_dtype(dtype):
+                vals = s.astype("string").fillna("0")
+            else:
+                vals = pd.Series(np.where(mask, num, 0.0), index=rows.index).astype(str)
+            style = self._style_of(fmt)
+            attr = f'" s="{style}"><v>' if style else '"><v>'
+            out = ref + attr + vals + "</v></c>"
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            if getattr(dtype, "tz", None) is not None:
+                s = s.dt.tz_localize(None)
+            ns = s.to_numpy(dtype="datetime64[ns]")
+            mask = ~np.isnat(ns)
+            serial = (ns - _EPOCH).astype("int64") / _DAY_NS
+            style = self._style_of(fmt or DEFAULT_DATETIME_FORMAT)
+            vals = pd.Series(np.where(mask, serial, 0.0), index=rows.index).astype(str)
+            out = ref + f'" s="{style}"><v>' + vals + "</v></c>"
+        elif isinstance(dtype, pd.StringDtype) or (pd.api.types.is_object_dtype(dtype) and pd.api.types.infer_dtype(s, skipna=True) == "string"):
+            # 배치 안의 고유값만 공유 문자열표에 등록 (한도 초과분은 inlineStr)
+            codes, uniques = pd.factorize(s)
+            mask = codes >= 0
+            cells = np.array([self._string_cell(u) for u in uniques] + [""], dtype=object)
+            out = ref + cells[codes]
+        elif isinstance(dtype, pd.CategoricalDtype) and pd.api.types.infer_dtype(dtype.categories, skipna=True) == "string":
+            # 문자열 범주(optimize_memory): 배치에 나온 범주만 셀 꼬리로 만들고 코드로 펼침
+            codes = s.cat.codes.to_numpy()
+            mask = codes >= 0
+            cells = np.full(len(dtype.categories) + 1, "", dtype=object)
+            for k in np.unique(codes[mask]):
+                cells[k] = self._string_cell(dtype.categories[k])
+            out = ref + cells[codes]
+        else:
+            # 혼합 object/category 등: 값마다 형식 판단
+            mixed = [self._cell(letter, r, v, fmt) for r, v in zip(rows.tolist(), s.tolist())]
+            return pd.Series(mixed, index=rows.index, dtype=object).astype(str)
+        return out.astype(object).where(mask, "").astype(str)
+
+    def _string_cell(self, v: str) -> str:
+        """'<c r="A1' 뒤에 붙일 문자열 셀 꼬리. 짧은 문자열은 공유 문자열표 인덱스로 기록"""
+        idx = self._sst.get(v)
+        if idx is None and len(self._sst) < self.max_shared_strings and len(v) <= _SST_MAX_LEN:
+            idx = self._sst[v] = len(self._sst)
+        if idx is not None:
+            return f'" t="s"><v>{idx}</v></c>'
+        return f'" t="inlineStr"><is><t xml:space="preserve">{_text(v)}</t></is></c>'
+
+    def _cell(self, letter: str, r: str, v: Any, fmt: Optional[str]) -> str:
+        if v is None or (isinstance(v, float) and not np.isfinite(v)) or v is pd.NaT or v is pd.NA:
+            return ""
+        if isinstance(v, (bool, np.bool_)):
+            return f'<c r="{letter}{r}" t="b"><v>{int(v)}</v></c>'
+        if isinstance(v, (int, float, np.integer, np.floating)):
+            style = self._style_of(fmt)
+            s_attr = f' s="{style}"' if style else ""
+            text = repr(float(v)) if isinstance(v, (float, np.floating)) else str(int(v))
+            return f'<c r="{letter}{r}"{s_attr}><v>{text}</v></c>'
+        if isinstance(v, (pd.Timestamp, np.datetime64)) or hasattr(v, "isoformat") and hasattr(v, "year"):
+            ts = pd.Timestamp(v)
+            if ts.tzinfo is not None:
+                ts = ts.tz_localize(None)
+            serial = float((ts.to_datetime64().astype("datetime64[ns]") - _EPOCH).astype("int64") / _DAY_NS)
+            style = self._style_of(fmt or DEFAULT_DATETIME_FORMAT)
+            return f'<c r="{letter}{r}" s="{style}"><v>{serial!r}</v></c>'
+        return f'<c r="{letter}{r}' + self._string_cell(str(v))
+
+    # ---- 시트 ----
+    def write_sheet(self, name: str, data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+                    number_formats: Optional[Dict[str, str]] = None) -> int:
+        """시트 하나를 기록. data는 DataFrame 또는 같은 열 구성의 DataFrame 이터레이터.
+        시트 한도(max_rows 행)를 넘으면 name_1, name_2, … 시트로 나눠 기록하고 self.parts[name]에 남깁니다.
+        반환: 기록한 데이터 행 수 (헤더 제외)
+        """
+        if self._closed:
+            raise ValueError("이미 닫힌 작성기입니다")
+        _check_sheet_name(name, self.sheets)
+        chunks = [data] if isinstance(data, pd.DataFrame) else data
+        state: Dict[str, Any] = {"number_formats": number_formats or {}}
+        first = len(self.sheets)
+        counts: List[int] = []
+        for _, pieces in groupby(_split_rows(chunks, self.max_rows), key=itemgetter(0)):
+            counts.append(self._write_part(len(self.sheets) + 1, (piece for _, piece in pieces), state))
+            self.sheets.append(name)
+        if not counts:
+            counts.append(self._write_part(len(self.sheets) + 1, [], state))
+            self.sheets.append(name)
+        if len(counts) > 1:
+            names = split_sheet_names(name, len(counts))
+            for n in names:
+                _check_sheet_name(n, self.sheets[:first])
+            self.sheets[first:] = names
+        self.parts[name] = [{"sheet": sn, "rows": n} for sn, n in zip(self.sheets[first:], counts)]
+        return sum(counts)
+
+    def _write_part(self, idx: int, chunks: Iterable[pd.DataFrame], state: Dict[str, Any]) -> int:
+        """sheet{idx}.xml 하나를 기록. 헤더/열 서식은 state에 저장해 다음 분할 시트에서 재사용"""
+        n_rows = 0
+        with self._zf.open(f"xl/worksheets/sheet{idx}.xml", "w", force_zip64=True) as raw:
+            raw.write((_XML_HEAD + f'<worksheet xmlns="{_NS_MAIN}" xmlns:r="{_NS_REL}">'
+                       '<sheetViews><sheetView workbookViewId="0"><pane ySplit="1" topLeftCell="A2" '
+                       'activePane="bottomLeft" state="frozen"/></sheetView></sheetViews>'
+                       "<sheetData>").encode("utf-8"))
+            header_written = False
+            for chunk in chunks:
+                if "letters" not in state:
+                    self._plan_columns(chunk, state)
+                if not header_written:
+                    raw.write(state["header"])
+                    header_written = True
+                letters, col_fmts = state["letters"], state["col_fmts"]
+                for start in range(0, len(chunk), self.batch_rows):
+                    batch = chunk.iloc[start:start + self.batch_rows]
+                    r0 = n_rows + 2
+                    rows = pd.Series(np.arange(r0, r0 + len(batch)).astype(str), dtype=object)
+                    xml = '<row r="' + rows + '">'
+                    for i in range(batch.shape[1]):
+                        s = batch.iloc[:, i].reset_index(drop=True)
+                        xml = xml + self._column_cells(s, letters[i], rows, col_fmts.get(i))
+                    xml = xml + "</row>"
+                    raw.write("".join(xml.tolist()).encode("utf-8"))
+                    n_rows += len(batch)
+            raw.write(b"</sheetData></worksheet>")
+        return n_rows
+
+    def _plan_columns(self, chunk: pd.DataFrame, state: Dict[str, Any]) -> None:
+        """첫 청크에서 헤더 XML과 열별 서식을 확정"""
+        columns = [str(c) for c in chunk.columns]
+        if len(columns) > MAX_SHEET_COLS:
+            raise ValueError(f"열 수가 Excel 한도({MAX_SHEET_COLS})를 넘습니다: {len(columns)}")
+        letters = [_col_letter(i) for i in range(len(columns))]
+        header = "".join(
+            f'<c r="{letters[i]}1" s="1" t="inlineStr"><is><t>{_text(c)}</t></is></c>'
+            for i, c in enumerate(columns))
+        number_formats = state["number_formats"]
+        col_fmts: Dict[int, Optional[str]] = {}
+        for i, c in enumerate(chunk.columns):
+            fmt = number_formats.get(c, number_formats.get(str(c)))
+            if fmt is None and pd.api.types.is_datetime64_any_dtype(chunk.iloc[:, i].dtype):
+                # 첫 청크가 모두 자정이면 날짜만 표시
+                dt = chunk.iloc[:, i].dropna()
+                if len(dt) and (dt.dt.normalize() == dt).all():
+                    fmt = DEFAULT_DATE_FORMAT
+            col_fmts[i] = fmt
+        state.update(letters=letters, col_fmts=col_fmts,
+                     header=f'<row r="1">{header}</row>'.encode("utf-8"))
+
+    # ---- 패키지 마무리 ----
+    def _styles_xml(self) -> str:
+        numfmts = "".join(
+            f'<numFmt numFmtId="{_NUMFMT_BASE_ID + i}" formatCode={quoteattr(code)}/>'
+            for i, code in enumerate(self._formats))
+        xfs = ('<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+               '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>')
+        xfs += "".join(
+            f'<xf numFmtId="{_NUMFMT_BASE_ID + i}" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+            for i in range(len(self._formats)))
+        return (_XML_HEAD + f'<styleSheet xmlns="{_NS_MAIN}">'
+                + (f'<numFmts count="{len(self._formats)}">{numfmts}</numFmts>' if self._formats else "")
+                + '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+                  '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+                  '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+                  '<fill><patternFill patternType="gray125"/></fill></fills>'
+                  '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+                  '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+                + f'<cellXfs count="{2 + len(self._formats)}">{xfs}</cellXfs>'
+                  '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+                  "</styleSheet>")
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if not self.sheets:
+                self.write_sheet("Sheet1", pd.DataFrame())
+            n = len(self.sheets)
+            overrides = ('<Override PartName="/xl/sharedStrings.xml" ContentType="application/'
+                         'vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>' if self._sst else "")
+            overrides += "".join(
+                f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                for i in range(1, n + 1))
+            self._zf.writestr("[Content_Types].xml", _XML_HEAD +
+                '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                '<Default Extension="xml" ContentType="application/xml"/>'
+                '<Override PartName="/xl/workbook.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+                '<Override PartName="/xl/styles.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+                + overrides + "</Types>")
+            self._zf.writestr("_rels/.rels", _XML_HEAD +
+                f'<Relationships xmlns="{_NS_PKG}">'
+                f'<Relationship Id="rId1" Type="{_NS_REL}/officeDocument" Target="xl/workbook.xml"/>'
+                "</Relationships>")
+            sheets = "".join(
+                f'<sheet name={quoteattr(name)} sheetId="{i}" r:id="rId{i}"/>'
+                for i, name in enumerate(self.sheets, start=1))
+            self._zf.writestr("xl/workbook.xml", _XML_HEAD +
+                f'<workbook xmlns="{_NS_MAIN}" xmlns:r="{_NS_REL}"><sheets>{sheets}</sheets></workbook>')
+            rels = "".join(
+                f'<Relationship Id="rId{i}" Type="{_NS_REL}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+                for i in range(1, n + 1))
+            rels += f'<Relationship Id="rId{n + 1}" Type="{_NS_REL}/styles" Target="styles.xml"/>'
+            if self._sst:
+                rels += f'<Relationship Id="rId{n + 2}" Type="{_NS_REL}/sharedStrings" Target="sharedStrings.xml"/>'
+            self._zf.writestr("xl/_rels/workbook.xml.rels", _XML_HEAD +
+                f'<Relationships xmlns="{_NS_PKG}">{rels}</Relationships>')
+            self._zf.writestr("xl/styles.xml", self._styles_xml())
+            if self._sst:
+                with self._zf.open("xl/sharedStrings.xml", "w", force_zip64=True) as raw:
+                    raw.write((_XML_HEAD + f'<sst xmlns="{_NS_MAIN}" uniqueCount="{len(self._sst)}">').encode("utf-8"))
+                    for v in self._sst:  # dict는 등록 순서(= 인덱스 순서) 유지
+                        raw.write(f'<si><t xml:space="preserve">{_text(v)}</t></si>'.encode("utf-8"))
+                    raw.write(b"</sst>")
+        finally:
+            self._zf.close()
+
+
+def write_xlsx(data: Union[pd.DataFrame, Iterable[pd.DataFrame]], path: Union[str, Path],
+               sheet: str = "Sheet1", number_formats: Optional[Dict[str, str]] = None,
+               batch_rows: int = DEFAULT_BATCH_ROWS) -> int:
+    """DataFrame(또는 청크 이터레이터)을 시트 하나짜리 xlsx로 스트리밍 저장. 반환: 데이터 행 수"""
+    with XlsxStreamWriter(path, batch_rows=batch_rows) as w:
+        return w.write_sheet(sheet, data, number_formats=number_formats)
+
+
+def export_xlsx(data: Union[pd.DataFrame, Iterable[pd.DataFrame]], path: Union[str, Path],
+                sheet: str = "Sheet1", number_formats: Optional[Dict[str, str]] = None,
+                split: str = "sheets", max_rows: Optional[int] = None,
+                batch_rows: int = DEFAULT_BATCH_ROWS) -> Dict[str, Any]:
+    """행 한도를 넘는 데이터를 나눠 저장하는 xlsx 내보내기
+    split: 'sheets' → 한 파일 안에 sheet_1, sheet_2, … / 'files' → path, path_2, … (분할 시 path_1부터)
+    반환: {"path", "rows", "split": 분할 여부, "parts": [{"path", "sheet", "rows"}, …]}
+          ("path"는 실제로 있는 파일: 파일로 나눴으면 첫 조각 path_1)
+    """
+    max_rows = max_rows or MAX_SHEET_ROWS - 1
+    p = Path(path)
+    if split == "sheets":
+        with XlsxStreamWriter(p, batch_rows=batch_rows, max_rows=max_rows) as w:
+            w.write_sheet(sheet, data, number_formats=number_formats)
+        parts = [{"path": str(p), **part} for part in w.parts[sheet]]
+    elif split == "files":
+        chunks = [data] if isinstance(data, pd.DataFrame) else data
+        parts = []
+        for part_no, pieces in groupby(_split_rows(chunks, max_rows), key=itemgetter(0)):
+            target = p if part_no == 0 else p.with_name(f"{p.stem}_{part_no + 1}{p.suffix}")
+            n = write_xlsx((piece for _, piece in pieces), target, sheet=sheet,
+                           number_formats=number_formats, batch_rows=batch_rows)
+            parts.append({"path": str(target), "sheet": sheet, "rows": n})
+        if not parts:
+            parts.append({"path": str(p), "sheet": sheet, "rows": write_xlsx([], p, sheet=sheet)})
+        if len(parts) > 1:
+            first = p.with_name(f"{p.stem}_1{p.suffix}")
+            os.replace(p, first)
+            parts[0]["path"] = str(first)
+    else:
+        raise ValueError(f"split은 'sheets' 또는 'files'만 가능합니다: {split!r}")
+    return {"path": parts[0]["path"], "rows": sum(x["rows"] for x in parts), "split": len(parts) > 1, "parts": parts}
@@ -130,21 +130,28 @@ def build_report(df: pd.DataFrame, out_path: str,
     wb.save(out_path)
     
     # 2) 피벗 + 차트 (기존 엔진 재사용)
-    shape = create_pivot_from_df(df, out_path, "03_피벗", list(rows), list(values), filters=filters or {})
-    add_chart(out_path, "03_피벗", title=title, chart_type=chart_type)
+    # (행 한도를 넘는 피벗은 03_피벗_1, 03_피벗_2, … 로 나뉨 → 차트는 첫 시트 기준)
+    shape, pivot_sheets = create_pivot_from_df(df, out_path, "03_피벗", list(rows), list(values),
+                                               filters=filters or {}, return_sheets=True)
+    pivot_sheet = pivot_sheets[0]["sheet"]
+    add_chart(out_path, pivot_sheet, title=title, chart_type=chart_type)
     
     # 3) 값 서식(통화)
     if apply_currency_format:
         val_cols = []
         # 피벗 결과 헤더에서 "금액" 포함 열을 자동 식별
         wb2 = load_workbook(out_path)
-        hdr = [c.value for c in wb2["03_피벗"][1]]
+        hdr = [c.value for c in wb2[pivot_sheet][1]]
         for h in hdr:
             if h and ("금액" in str(h) or "sum" in str(h).lower()):
                 val_cols.append(str(h))
         wb2.close()
         
         if val_cols:
-            _apply_number_formats(out_path, "03_피벗", val_cols)
+            for part in pivot_sheets:
+                _apply_number_formats(out_path, part["sheet"], val_cols)
     
-    return {"out": out_path, "pivot_shape": shape}
+    rep = {"out": out_path, "pivot_shape": shape}
+    if len(pivot_sheets) > 1:
+        rep["pivot_sheets"] = pivot_sheets
+    return rep
@@ -32,3 +32,14 @@ def validate(df: pd.DataFrame, spec: Dict[str, Any]) -> Dict[str, Any]:
             else:
                 report.append({"check":"range","col":col,"ok":False,"error":"col_not_found"})
     return {"summary": {"ok": all(x.get("ok", False) for x in report)}, "details": report}
+
+def spec_columns(spec: Dict[str, Any]) -> List[str]:
+    """DSL이 검사하는 열 이름 (등장 순서, 중복 제거) — 입력을 이 열만 읽을 때 사용"""
+    cols: List[str] = []
+    for c in spec.get("checks", []):
+        for key in ("unique", "required"):
+            cols.extend(c.get(key, []))
+        for key in ("regex", "range"):
+            if key in c:
+                cols.append(c[key]["column"])
+    return list(dict.fromkeys(cols))
@@ -74,7 +74,7 @@ def timeit(fn, *args, **kwargs):
     return result, dt
 
 
-def run(n_rows: int = 200_000):
+def run(n_rows: int = 200_000, jobs: int = 1):
     print(f"[bench] generating synthetic data: {n_rows} rows ...", flush=True)
     df, t_gen = timeit(synth_data, n_rows)
     print(f"[bench] data generated in {t_gen:.2f}s", flush=True)
@@ -84,7 +84,7 @@ def run(n_rows: int = 200_000):
     print(f"[bench] profile done in {t_prof:.2f}s, cols={len(profile['columns'])}", flush=True)
 
     print("[bench] cleaning (level1) ...", flush=True)
-    df_clean, t_clean = timeit(level1_clean, df, True, 'YYYY-MM-DD', True, True)
+    df_clean, t_clean = timeit(level1_clean, df, True, 'YYYY-MM-DD', True, True, workers=jobs)
     print(f"[bench] clean done in {t_clean:.2f}s, shape={df_clean.shape}", flush=True)
     print("[bench] columns after clean:", list(df_clean.columns), flush=True)
 
@@ -95,6 +95,7 @@ def run(n_rows: int = 200_000):
 
     out = {
         'rows': int(n_rows),
+        'jobs': int(jobs),
         't_generate_s': round(t_gen, 3),
         't_profile_s': round(t_prof, 3),
         't_clean_s': round(t_clean, 3),
@@ -120,5 +121,6 @@ if __name__ == '__main__':
     import argparse
     ap = argparse.ArgumentParser()
     ap.add_argument('--rows', type=int, default=200_000)
+    ap.add_argument('--jobs', type=int, default=1)
     args = ap.parse_args()
-    run(args.rows)
+    run(args.rows, args.jobs)
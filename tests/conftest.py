@@ -23,3 +23,9 @@ def _force_utf8_env():
     
     print(f"✅ UTF-8 환경 설정 완료: PYTHONIOENCODING={os.environ.get('PYTHONIOENCODING')}")
     print(f"✅ LC_ALL={os.environ.get('LC_ALL')}, LANG={os.environ.get('LANG')}")
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_cache_dir(tmp_path_factory):
+    """인코딩/파일 캐시가 사용자 홈 대신 임시 폴더를 쓰도록 합니다."""
+    os.environ["SEC_CACHE_DIR"] = str(tmp_path_factory.mktemp("sec_cache"))
@@ -2,7 +2,7 @@
 import pytest
 import pandas as pd
 import numpy as np
-from app.excel_ops.clean import _parse_date_fast, level1_clean
+from app.excel_ops.clean import _parse_date_fast, level1_clean, plan_columns
 
 
 class TestDateParsing:
@@ -64,6 +64,58 @@ class TestDateParsing:
         assert "10:00:00" in result.iloc[0]
         assert "23:59:59" in result.iloc[1]
     
+    def test_unique_values_parsed_once_and_cached(self):
+        """고유값만 파싱하고, 같은 값은 다음 호출에서 캐시 사용"""
+        from app.excel_ops.clean import clear_date_cache, date_cache_info
+        clear_date_cache()
+        s = pd.Series(["2024-01-01", "2024/01/02", None, "bad"] * 1000, index=range(5, 4005))
+        result, hit_ratio = _parse_date_fast(s)
+        assert date_cache_info() == {"hits": 0, "misses": 3, "size": 3}
+        assert hit_ratio == 0.5
+        assert result.index.equals(s.index)
+        assert result.iloc[:4].tolist()[:2] == ["2024-01-01", "2024-01-02"]
+        assert result.iloc[2:4].isna().all()
+
+        _parse_date_fast(pd.Series(["2024-01-01", "2024-03-01"]))
+        assert date_cache_info()["hits"] == 1 and date_cache_info()["misses"] == 4
+
+    def test_inferred_korean_formats(self):
+        """한국식 형식은 추론한 형식으로 파싱, 추론되지 않는 값만 느린 경로"""
+        s = pd.Series(["2024년 3월 5일", "24.03.05", "2024. 3. 5.", "2024-03-05 오후 3:05",
+                       "2024년 3월 5일 14시 30분", "Mar 5, 2024", "2024-02-30"])
+        result, hit_ratio = _parse_date_fast(s, keep_time=True)
+        assert result.tolist()[:6] == [
+            "2024-03-05 00:00:00", "2024-03-05 00:00:00", "2024-03-05 00:00:00",
+            "2024-03-05 15:05:00", "2024-03-05 14:30:00", "2024-03-05 00:00:00",
+        ]
+        assert pd.isna(result.iloc[6])
+        assert hit_ratio == pytest.approx(6 / 7)
+
+    def test_two_digit_slash_dates_not_read_as_yymmdd(self):
+        """2자리 세 묶음은 '.'/'-'만 YY.MM.DD, '/'는 기존 해석(MM/DD/YY) 유지"""
+        s = pd.Series(["12/05/24", "24.05.12", "24-05-12"])
+        result, hit_ratio = _parse_date_fast(s, keep_time=False)
+        assert result.tolist() == ["2024-12-05", "2024-05-12", "2024-05-12"]
+        assert hit_ratio == 1.0
+
+    def test_infer_date_formats(self):
+        """표본 값 모양에서 strptime 형식을 많이 쓰인 순으로 추론, 열 계획 로그에도 기록"""
+        from app.excel_ops.clean import infer_date_formats
+        s = pd.Series(["2024년 3월 5일", "2024년 12월 15일", "24.03.05", None, "메모"])
+        assert infer_date_formats(s) == ["%Y년 %m월 %d일", "%y.%m.%d"]
+        _, _, log = level1_clean(pd.DataFrame({"주문일": s.iloc[:3]}), return_logs=True)
+        assert log["columns"]["주문일"]["date_formats"] == ["%Y년 %m월 %d일", "%y.%m.%d"]
+
+    def test_fixed_width_parsed_in_blocks(self, monkeypatch):
+        """같은 모양의 값은 블록 단위로 파싱해도 블록 경계와 무관하게 같은 결과"""
+        import app.excel_ops.clean as clean
+        s = pd.Series([f"2024-01-{d:02d} 0{d % 10}:30:00" for d in range(1, 29)] * 3 + ["2024-02-30 00:00:00"])
+        whole = clean._parse_date_shapes(s.astype("string"))
+        monkeypatch.setattr(clean, "_FIXED_WIDTH_BLOCK", 7)
+        blocked = clean._parse_date_shapes(s.astype("string"))
+        assert blocked.equals(whole)
+        assert whole.iloc[0] == pd.Timestamp("2024-01-01 01:30:00") and pd.isna(whole.iloc[-1])
+
     def test_mixed_date_formats(self):
         """혼합 날짜 형식 파싱 테스트"""
         s = pd.Series(["2024-01-01", "2024/12/31", "2024.06.15", "20240615"])
@@ -107,6 +159,120 @@ class TestLevel1Clean:
         # 금액이 숫자로 변환되었는지 확인
         assert pd.api.types.is_numeric_dtype(result["금액"])
 
+    def test_date_output_datetime(self):
+        """date_output="datetime"이면 날짜 열을 datetime64로 유지 (시각 보존 열만 시각 포함)"""
+        df = pd.DataFrame({
+            "주문일": ["2024-01-01 10:30:00", "2024/12/31", None],
+            "업데이트일": ["2024-01-02 10:30:00", "2024-01-03", "bad"],
+        })
+        text = level1_clean(df)
+        out = level1_clean(df, date_output="datetime")
+        assert str(out["주문일"].dtype) == "datetime64[ns]"
+        assert out["주문일"].tolist()[:2] == [pd.Timestamp("2024-01-01"), pd.Timestamp("2024-12-31")]
+        assert out["업데이트일"].iloc[0] == pd.Timestamp("2024-01-02 10:30:00")
+        assert out.isna().equals(text.isna())
+        with pytest.raises(ValueError):
+            level1_clean(df, date_output="epoch")
+
+    def test_copy_false_matches_copy(self):
+        """copy=False(입력 소유권을 넘김)도 결과는 copy=True와 같음"""
+        df = pd.DataFrame({
+            "주문 일": ["2024-01-01", " 2024/02/03 ", None],
+            "금액": ["₩1,000", "2,000원", ""],
+            "활성": ["Y", "N", "Y"],
+        })
+        expected = level1_clean(df.copy())
+        out = level1_clean(df, copy=False)
+        pd.testing.assert_frame_equal(out, expected)
+
+
+class TestColumnPlan:
+    """열 유형 계획 테스트"""
+
+    def test_plan_is_returned_in_logs(self):
+        """계획이 type_info/normalize_log로 반환되고 그 변환만 적용"""
+        df = pd.DataFrame({
+            "활성": ["Y", "N", "예"] * 4,
+            "금액": ["₩1,000", "2,000원", "3000"] * 4,
+            "수량": ["1,200", "5", "7"] * 4,
+            "주문일": ["2024-01-01", "2024/02/03", "2024.03.04"] * 4,
+            "메모": ["a", "b", "c"] * 4,
+        })
+        out, type_info, log = level1_clean(df, return_logs=True)
+        assert type_info == {"활성": "bool", "금액": "currency", "수량": "number", "주문일": "date", "메모": "string"}
+        assert log["sample_rows"] == 12
+        assert log["columns"]["활성"]["hit"]["bool"] == 1.0
+        assert out["수량"].tolist()[:3] == [1200, 5, 7]
+        assert out["주문일"].tolist()[:3] == ["2024-01-01", "2024-02-03", "2024-03-04"]
+
+    def test_plan_uses_sample_and_tolerates_empty_columns(self):
+        """긴 열은 표본으로 판단, 값이 전혀 없는 문자열 열도 오류 없이 string"""
+        df = pd.DataFrame({
+            "금액": ["1,000원"] * 20_000,
+            "비고": pd.Series([None] * 20_000, dtype="string"),
+        })
+        plan, log = plan_columns(df, sample_rows=100)
+        assert plan == {"금액": "currency", "비고": "string"}
+        assert log["sample_rows"] == 100
+        out = level1_clean(df, drop_empty=False)
+        assert out["금액"].iloc[-1] == 1000
+
+
+
+class TestParallelClean:
+    """열 병렬 클리닝 테스트"""
+
+    def test_workers_match_single_process(self, monkeypatch):
+        """프로세스 풀 결과가 열 순서·type_info·통화 열까지 단일 프로세스와 같음"""
+        from app.excel_ops import clean
+        monkeypatch.setattr(clean, "PARALLEL_MIN_CELLS", 0)
+        df = pd.DataFrame({
+            "거래ID": range(300),
+            "금액": ["₩1,000", "2,000원", "3000"] * 100,
+            "활성": ["Y", "N", "예"] * 100,
+            "주문일": ["2024-01-01", "2024/02/03", "2024.03.04"] * 100,
+            "단가": ["$5", "€7", "9"] * 100,
+            "메모": ["  a  b ", None, "c"] * 100,
+        })
+        one = level1_clean(df, return_logs=True)
+        many = level1_clean(df, return_logs=True, workers=3)
+        pd.testing.assert_frame_equal(one[0], many[0])
+        assert list(one[1].items()) == list(many[1].items())
+        assert one[2] == many[2]
+        assert list(many[0].columns)[-2:] == ["금액__currency", "단가__currency"]
+
+
+
+class TestUniqueTransforms:
+    """고유값 단위 변환 테스트"""
+
+    def test_transforms_run_on_uniques_only(self):
+        """변환은 고유값(+결측 1칸)에만 적용되고 결과는 원래 행·인덱스로 펼쳐짐"""
+        from app.excel_ops.clean import _transform_uniques
+        seen = []
+
+        def upper(u):
+            seen.append(len(u))
+            return u.str.upper()
+
+        s = pd.Series(["a", "b", None, "a"] * 50, index=range(10, 210), name="x")
+        out = _transform_uniques(s, upper, lambda u: u + "!")
+        assert seen == [3]
+        assert out.index.equals(s.index) and out.name == "x"
+        assert out.iloc[:4].tolist()[:2] == ["A!", "B!"] and pd.isna(out.iloc[2])
+
+    def test_trim_bool_currency_keep_row_results(self):
+        """트림·불리언·통화 결과가 행 단위 계산과 같음 (결측 포함)"""
+        from app.excel_ops.clean import _trim_spaces, _normalize_bool, _parse_currency_fast
+        s = pd.Series([" 서울  시 ", None, "Y", "₩1,000", "N", "2,000원"] * 20)
+        assert _trim_spaces(s).iloc[:2].tolist()[0] == "서울 시"
+        b, hit = _normalize_bool(s)
+        assert str(b.dtype) == "boolean" and hit == pytest.approx(2 / 6)
+        assert b.iloc[[2, 4]].tolist() == [True, False] and pd.isna(b.iloc[1])
+        nums, cur, cur_hit = _parse_currency_fast(s, currency_split=True)
+        assert nums.iloc[3] == 1000 and nums.iloc[5] == 2000 and pd.isna(nums.iloc[1])
+        assert cur.iloc[3] == "KRW" and cur.iloc[1] is None and cur_hit == pytest.approx(2 / 6)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,49 @@
+# tests/test_cli.py
+import json
+import zipfile
+import pytest
+from app.cli import build_parser
+from app.io.loader import load_table
+
+
+def _run(argv):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+class TestZipBundleInput:
+    """CSV가 여럿인 .zip 입력 (--sheet 없이는 모든 멤버를 합쳐서)"""
+
+    @pytest.fixture
+    def bundle(self, tmp_path):
+        p = tmp_path / "two.zip"
+        with zipfile.ZipFile(p, "w") as zf:
+            zf.writestr("a.csv", "이름,금액\n홍길동,1\n김철수,2\n".encode("utf-8"))
+            zf.writestr("b.csv", "이름,금액\n이영희,3\n".encode("cp949"))
+        return p
+
+    def test_profile_and_clean_read_all_members(self, bundle, capsys):
+        """profile/clean이 멤버를 합친 DataFrame으로 처리, --sheet로 멤버 하나(멤버별 인코딩 감지)"""
+        _run(["profile", "--path", str(bundle), "--no-cache"])
+        out = json.loads(capsys.readouterr().out)
+        assert out["shape"] == [3, 4]
+
+        _run(["clean", "--path", str(bundle), "--apply", "--no-cache"])
+        saved = json.loads(capsys.readouterr().out)["saved"]
+        df, _ = load_table(saved, cache=False)                    # zip 입력은 같은 방식으로 압축한 CSV로 저장
+        assert df["이름"].tolist() == ["홍길동", "김철수", "이영희"]
+        assert df["sheet"].tolist() == ["a.csv", "a.csv", "b.csv"]            # 열 이름 정리로 __sheet → sheet
+
+        _run(["clean", "--path", str(bundle), "--sheet", "b.csv", "--no-cache"])
+        assert "이영희" in capsys.readouterr().out
+
+    def test_stream_and_unknown_member_fail_clearly(self, bundle):
+        """--stream은 멤버를 고르라는 메시지, 없는 멤버는 멤버 목록과 함께 로드 실패"""
+        with pytest.raises(SystemExit, match="a.csv"):
+            _run(["preprocess", "--path", str(bundle), "--stream"])
+        with pytest.raises(Exception, match=r"파일 로드 실패.*\['a.csv', 'b.csv'\]"):
+            load_table(str(bundle), sheet=5, cache=False)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,166 @@
+# tests/test_dedupe.py
+import pytest
+import numpy as np
+import pandas as pd
+from app.excel_ops.dedupe import dedupe, dedupe_external
+from app.io.loader import load_table
+
+
+@pytest.fixture
+def history():
+    return pd.DataFrame({
+        "거래 ID": [3, 1, 3, 2, 1, 3, np.nan, np.nan],
+        "업데이트일": pd.to_datetime(["2024-01-02", "2024-01-05", "2024-01-09", None,
+                                  "2024-01-01", "2024-01-09", "2024-01-03", None]),
+        "금액": [10, 20, 30, 40, 50, 60, 70, 80],
+    }, index=list("abcdefgh"))
+
+
+class TestHashDedupe:
+    """키 해시 기반 중복 제거 (정렬 없음, 원래 행 순서 유지)"""
+
+    def test_first_last_keep_row_order(self, history):
+        """first/last는 키별로 같은 행을 남기고 원래 순서를 유지 (결측 키도 하나의 그룹)"""
+        first, info = dedupe(history, ["거래_id"], "first")
+        assert list(first.index) == ["a", "b", "d", "g"]
+        assert info == {"keys": ["거래 ID"], "removed": 4, "keep": "first"}
+        last, _ = dedupe(history, ["거래_id"], "last")
+        assert list(last.index) == ["d", "e", "f", "h"]
+
+    def test_last_by_picks_max_then_first_tie(self, history):
+        """last_by는 기준 열 최댓값 행(같으면 먼저 나온 행, 결측은 가장 작은 값)을 남김"""
+        out, info = dedupe(history, ["거래 ID"], "last_by:업데이트일")
+        assert list(out.index) == ["b", "c", "d", "g"]
+        assert info["removed"] == 4 and info["sorted_by"] == "업데이트일"
+        pd.testing.assert_frame_equal(out, history.loc[["b", "c", "d", "g"]])
+
+    def test_last_by_strings_and_floats(self):
+        """문자열 날짜·실수 기준 열도 값 크기로 비교"""
+        df = pd.DataFrame({
+            "id": ["x", "y", "x", "y", "x"],
+            "일자": pd.Series(["2024-03-01", None, "2024-12-31", "2024-01-01", "2024-04-01"], dtype="string"),
+            "점수": [1.5, np.nan, 0.5, np.nan, 2.0],
+        })
+        by_date, _ = dedupe(df, ["id"], "last_by:일자")
+        assert list(by_date.index) == [2, 3]
+        by_score, _ = dedupe(df, ["id"], "last_by:점수")
+        assert list(by_score.index) == [1, 4]
+
+
+
+class TestMergeDedupe:
+    """병합 모드: 남는 행에 버려지는 중복 행의 값을 열별 정책으로 합침"""
+
+    @pytest.fixture
+    def dup(self):
+        return pd.DataFrame({
+            "거래ID": [1, 1, 2, 2, 3, 2],
+            "금액": [100, 250, np.nan, 50, 7, np.nan],
+            "메모": [None, "b", "x", None, None, "y"],
+            "업데이트일": pd.to_datetime(["2024-01-01", "2024-02-01", None, "2024-03-01", "2024-01-05", None]),
+            "담당": ["a", None, "c", "d", None, "c"],
+        })
+
+    def test_policies_and_filled_cells(self, dup):
+        """정책별 집계 + 남는 행(first)에서 결측이던 셀만 filled로 셈"""
+        merge = {"금액": "max", "메모": "last_non_null", "업데이트일": "max", "담당": "concat"}
+        out, info = dedupe(dup, ["거래id"], "first", merge=merge)
+        assert list(out.index) == [0, 2, 4]
+        assert out["금액"].tolist() == [250, 50, 7]
+        assert out["메모"].tolist()[:2] == ["b", "y"] and pd.isna(out["메모"].iloc[2])
+        assert list(out["업데이트일"].dt.strftime("%m-%d")) == ["02-01", "03-01", "01-05"]
+        assert out["담당"].tolist()[:2] == ["a", "c | d"]
+        assert info["removed"] == 3
+        assert info["merge"]["filled"] == {"금액": 1, "메모": 1, "업데이트일": 1, "담당": 0}
+        assert info["merge"]["filled_cells"] == 3
+
+    def test_default_policy_and_last_by(self, dup):
+        """'*'는 나머지 열 기본 정책, 명시하지 않으면 keep 규칙으로 고른 행의 값 유지"""
+        out, info = dedupe(dup, ["거래ID"], "last_by:업데이트일", merge={"*": "first_non_null", "금액": "keep"})
+        assert list(out.index) == [1, 3, 4]
+        assert out["금액"].tolist() == [250, 50, 7]                 # keep: 남는 행 값
+        assert out["메모"].tolist()[:2] == ["b", "x"]
+        assert out["담당"].tolist()[:2] == ["a", "c"]
+        assert info["sorted_by"] == "업데이트일" and info["merge"]["filled"]["메모"] == 1
+        assert info["merge"]["filled_cells"] == 2                   # 담당 d → c는 결측 채움이 아님
+
+    def test_sum_all_missing_stays_missing_and_errors(self, dup):
+        """전부 결측인 그룹의 sum은 결측, 잘못된 정책·키 열 병합은 ValueError"""
+        out, info = dedupe(dup.assign(금액=[1, 2, np.nan, np.nan, 3, np.nan]), ["거래ID"], "last", merge={"금액": "sum"})
+        assert out["금액"].tolist()[:2] == [3, 3] and pd.isna(out["금액"].iloc[2])
+        assert info["merge"]["filled_cells"] == 0
+        with pytest.raises(ValueError):
+            dedupe(dup, ["거래ID"], merge={"금액": "median"})
+        with pytest.raises(ValueError):
+            dedupe(dup, ["거래ID"], merge={"거래ID": "max"})
+        with pytest.raises(ValueError):
+            dedupe(dup, [], merge={"금액": "max"})
+
+    def test_policy_checked_against_dtype(self, dup):
+        """명시한 숫자 정책이 텍스트 열이면 열 이름을 담은 ValueError, '*' 기본값은 맞지 않는 열을 keep으로"""
+        with pytest.raises(ValueError, match="메모"):
+            dedupe(dup, ["거래ID"], merge={"메모": "mean"})
+        with pytest.raises(ValueError, match="업데이트일"):
+            dedupe(dup, ["거래ID"], merge={"업데이트일": "sum"})
+        out, info = dedupe(dup, ["거래ID"], "first", merge={"*": "mean"})
+        assert out["금액"].tolist() == [175, 50, 7]
+        assert pd.isna(out["메모"].iloc[0]) and out["메모"].iloc[1] == "x"     # keep: 남는 행 값
+        assert info["merge"]["skipped"] == {"메모": "skip:not_applicable:mean", "담당": "skip:not_applicable:mean"}
+        assert set(info["merge"]["policies"]) == {"금액", "업데이트일"}
+
+
+class TestExternalDedupe:
+    """외부 메모리 중복 제거: 해시 파티션 스필 → 파티션별 처리 → 청크로 내보냄"""
+
+    @pytest.fixture
+    def csv_path(self, tmp_path):
+        rng = np.random.default_rng(7)
+        n = 20_000
+        df = pd.DataFrame({
+            "거래ID": rng.integers(0, 4000, n).astype(float),
+            "업데이트일": rng.choice(pd.date_range("2024-01-01", periods=90).strftime("%Y-%m-%d"), n),
+            "금액": rng.integers(0, 100, n),
+        })
+        df.loc[::97, "거래ID"] = np.nan      # 결측 키가 있는 청크와 없는 청크의 dtype이 달라짐
+        path = tmp_path / "history.csv"
+        df.to_csv(path, index=False)
+        return str(path)
+
+    @pytest.mark.parametrize("keep", ["first", "last", "last_by:업데이트일"])
+    def test_matches_in_memory(self, csv_path, tmp_path, keep):
+        """작은 예산(파티션 재분할 발생)에서도 결과·순서·removed가 메모리 내 dedupe와 같고 스필 파일은 지워짐"""
+        full, _ = load_table(csv_path, cache=False)
+        expected, info = dedupe(full, ["거래id"], keep)
+        spill_dir = tmp_path / "spill"
+        spill_dir.mkdir()
+        chunks, report = dedupe_external(csv_path, ["거래id"], keep, memory_mb=0.05,
+                                         chunksize=3000, tmp_dir=str(spill_dir))
+        assert report["partitions"] > 1 and report["input_rows"] == len(full)
+        assert report["removed"] == info["removed"]
+        pd.testing.assert_frame_equal(pd.concat(list(chunks)), expected)
+        assert not any(spill_dir.iterdir())
+
+    def test_all_columns_and_export(self, csv_path, tmp_path):
+        """키가 없으면 전체 열 기준, 결과 이터레이터는 export_table로 바로 저장"""
+        from app.io.loader import export_table
+        full, _ = load_table(csv_path, cache=False)
+        expected, info = dedupe(full, [], "first")
+        chunks, report = dedupe_external(csv_path, [], "first", memory_mb=0.05, chunksize=3000)
+        assert report["keys"] == "ALL" and report["removed"] == info["removed"]
+        saved = export_table(chunks, str(tmp_path / "out.csv"))
+        assert saved["rows"] == len(expected)
+
+
+    def test_key_dtype_changes_between_chunks(self, tmp_path):
+        """청크마다 키 dtype 추론이 달라도(int64 청크의 1, 문자열 청크의 "1", 결측) 같은 키로 비교"""
+        path = tmp_path / "mixed.csv"
+        path.write_text("거래ID,금액\n1,10\n2,20\n,25\n1,30\nA-7,40\n,45\n", encoding="utf-8")
+        full, _ = load_table(str(path), cache=False)
+        expected, info = dedupe(full, ["거래ID"], "last")
+        chunks, report = dedupe_external(str(path), ["거래ID"], "last", chunksize=3)
+        out = pd.concat(list(chunks))
+        assert report["removed"] == info["removed"] == 2
+        assert out["금액"].tolist() == expected["금액"].tolist() == [20, 30, 40, 45]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,69 @@
+# tests/test_dedupe_index.py
+import pytest
+import numpy as np
+import pandas as pd
+from app.excel_ops.dedupe import dedupe
+from app.excel_ops.dedupe_index import DedupeIndex
+
+
+def _day(seed: int, n: int = 2000, float_ids: bool = False) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    ids = rng.integers(0, 1500, n)
+    return pd.DataFrame({
+        "거래ID": ids.astype(float) if float_ids else ids,    # 파일마다 키 dtype이 달라도 같은 키
+        "업데이트일": rng.choice(pd.date_range("2024-01-01", periods=40).strftime("%Y-%m-%d"), n),
+        "금액": rng.integers(0, 100, n),
+    })
+
+
+class TestDedupeIndex:
+    """영구 키 인덱스로 새 파일만 중복 제거"""
+
+    @pytest.mark.parametrize("keep", ["first", "last", "last_by:업데이트일"])
+    def test_matches_full_history_dedupe(self, tmp_path, keep):
+        """인덱스로 거른 새 파일 행 = 이전 파일 전체와 합쳐 dedupe했을 때 남는 새 파일 행"""
+        days = [_day(s, float_ids=bool(s % 2)) for s in range(4)]
+        with DedupeIndex(tmp_path / "idx.sqlite", keys=["거래id"], keep=keep) as idx:
+            for d in days[:3]:
+                idx.update(d)
+            out, report = idx.dedupe(days[3])
+        history = pd.concat([d.assign(거래ID=d["거래ID"].astype(float)) for d in days[:3]], ignore_index=True)
+        full = pd.concat([history, days[3].assign(new=True)], ignore_index=True)
+        kept, _ = dedupe(full, ["거래ID"], keep)
+        expected = kept[kept["new"].eq(True)]
+        assert out["금액"].tolist() == expected["금액"].tolist()
+        assert list(out.index) == sorted(out.index)
+        assert report["removed"] == report["removed_in_file"] + report["removed_by_index"] == len(days[3]) - len(out)
+
+    def test_update_is_atomic_and_files_are_tracked(self, tmp_path, monkeypatch):
+        """반영 중 오류가 나면 인덱스는 이전 상태, 반영한 파일은 지문으로 기록"""
+        src = tmp_path / "day1.csv"
+        _day(1).to_csv(src, index=False)
+        with DedupeIndex(tmp_path / "idx.sqlite", keys=["거래ID"], keep="last_by:업데이트일") as idx:
+            idx.update(_day(0))
+            before = idx.info()["entries"]
+
+            def boom(*a, **k):
+                raise RuntimeError("disk full")
+            monkeypatch.setattr(idx, "_record_file", boom)
+            with pytest.raises(RuntimeError):
+                idx.update(_day(5, n=5000), source=src)
+            assert idx.info()["entries"] == before and not idx.applied(src)
+            monkeypatch.undo()
+            idx.update(pd.read_csv(src), source=src)
+            assert idx.applied(src) and idx.info()["files"] == 1
+        with pytest.raises(ValueError):
+            DedupeIndex(tmp_path / "idx.sqlite", keys=["거래ID"], keep="first")
+        with pytest.raises(FileNotFoundError):
+            DedupeIndex(tmp_path / "none.sqlite")
+
+    def test_compact_drops_old_keys(self, tmp_path):
+        """compact(before=)는 기준값이 더 오래된 키를 지우고 파일을 줄임"""
+        with DedupeIndex(tmp_path / "idx.sqlite", keys=["거래ID"], keep="last_by:업데이트일") as idx:
+            idx.update(pd.DataFrame({"거래ID": [1, 2, 3], "업데이트일": ["2024-01-01", "2024-02-01", "2024-03-01"]}))
+            report = idx.compact(before="2024-02-01")
+            assert report["removed"] == 1 and idx.info()["entries"] == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
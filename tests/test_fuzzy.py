@@ -0,0 +1,53 @@
+# tests/test_fuzzy.py
+import pytest
+import numpy as np
+import pandas as pd
+from app.excel_ops.fuzzy import (fuzzy_dedupe, fuzzy_clusters, normalize_names, _union_find,
+                                 FUZZY_BANDS, FUZZY_WINDOW)
+
+
+@pytest.fixture
+def merchants():
+    return pd.DataFrame({
+        "상호명": ["(주)스타벅스 코리아", "스타벅스코리아 주식회사", "㈜스타벅스  코리아", "이디야커피 강남점",
+                "이디야 커피 강남점", "이디야커피 강남정", "투썸플레이스", None, "ACME Co., Ltd.", "acme inc"],
+        "수정일": ["2024-01-01", "2024-03-01", "2024-02-01", "2024-01-05", "2024-01-09",
+                "2024-01-07", "2024-01-01", "2024-01-01", "2024-01-01", "2024-01-02"],
+    })
+
+
+class TestFuzzyDedupe:
+    """유사 중복 클러스터링 (정규화 → MinHash LSH 블로킹 → 유니온-파인드)"""
+
+    def test_normalize_names(self):
+        """회사 형태 표기·공백·기호·전각을 지운 비교용 문자열"""
+        s = pd.Series(["(주) 스타벅스 코리아", "㈜스타벅스코리아", "ＡＣＭＥ Co., Ltd.", None])
+        assert normalize_names(s).tolist()[:3] == ["스타벅스코리아", "스타벅스코리아", "acme"]
+        assert pd.isna(normalize_names(s).iloc[3])
+
+    def test_clusters_and_survivors(self, merchants):
+        """표기 차이·오타는 같은 클러스터, 결측은 각자. survivor는 keep 규칙으로 클러스터마다 하나"""
+        out, report = fuzzy_dedupe(merchants, "상호명", mark=True)
+        c = out["__cluster"].tolist()
+        assert c[0] == c[1] == c[2] and c[3] == c[4] == c[5] and c[8] == c[9]
+        assert len({c[0], c[3], c[6], c[7], c[8]}) == 5
+        assert out["__survivor"].tolist() == [True, False, False, True, False, False, True, True, True, False]
+        assert report["removed"] == 5 and report["clusters"] == 3 and report["rows_in_clusters"] == 8
+        latest, _ = fuzzy_dedupe(merchants, ["상호명"], keep="last_by:수정일")
+        assert latest.index.tolist() == [1, 4, 6, 7, 9]
+
+    def test_union_find_is_transitive(self):
+        """a~b, b~c면 a, b, c는 한 클러스터 (루트는 가장 작은 번호)"""
+        edges = np.array([[4, 5], [0, 3], [3, 5], [1, 2]])
+        assert _union_find(7, edges).tolist() == [0, 1, 1, 0, 0, 0, 6]
+
+    def test_candidate_pairs_stay_linear(self):
+        """후보 쌍 수는 고유값 수 × (밴드 + 1) × window 이하 (모든 쌍 비교 없음)"""
+        rng = np.random.default_rng(0)
+        names = ["".join(rng.choice(list("가나다라마바사아자차카타파하"), 6)) for _ in range(3000)]
+        _, stats = fuzzy_clusters(pd.DataFrame({"상호명": names}), "상호명")
+        assert stats["candidate_pairs"] <= stats["unique_values"] * (FUZZY_BANDS + 1) * FUZZY_WINDOW
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,136 @@
+# tests/test_impute.py
+import pytest
+import numpy as np
+import pandas as pd
+from app.excel_ops.impute import impute, impute_frame, handle_missing_values
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(3)
+    n = 1001
+    a = rng.normal(100, 20, n)
+    a[rng.random(n) < 0.2] = np.nan
+    b = rng.integers(0, 9, n).astype(float)
+    b[::7] = np.nan
+    return pd.DataFrame({
+        "금액": a,
+        "수량": b,
+        "재고": pd.array(np.where(np.arange(n) % 5 == 0, None, np.arange(n) % 4), dtype="Int64"),
+        "도시": pd.Series(np.where(np.arange(n) % 6 == 0, None, ["서울", "부산", "서울"] * 333 + ["대구"] * 2),
+                        dtype="string"),
+        "메모": [None if i % 4 == 0 else f"m{i}" for i in range(n)],
+        "빈열": np.nan,
+    })
+
+
+class TestImputeFrame:
+    """통계를 방법별로 한 번에 계산하고 한꺼번에 채우는 결측치 엔진"""
+
+    def test_matches_column_by_column_pandas(self, frame):
+        """평균/중앙값(짝수·홀수 개, 정수 열)/최빈값/상수 대체 결과가 열별 pandas 계산과 같음"""
+        strategies = {"금액": "median", "수량": "mean", "재고": "median", "도시": "mode",
+                      "메모": {"strategy": "value", "fill_value": "-"}}
+        out, report = impute_frame(frame, strategies)
+        assert out["금액"].tolist() == frame["금액"].fillna(frame["금액"].median()).tolist()
+        assert out["수량"].to_numpy() == pytest.approx(frame["수량"].fillna(frame["수량"].mean()).to_numpy())
+        assert out["재고"].dtype == "Float64"                  # 정수 열에 소수 중앙값 → Float64로 올려 채움
+        assert out["재고"].tolist() == frame["재고"].astype("Float64").fillna(frame["재고"].median()).tolist()
+        assert out["도시"].tolist() == frame["도시"].fillna("서울").tolist()
+        assert out["메모"].isna().sum() == 0
+        assert frame["금액"].isna().any()                  # copy=True: 입력은 그대로
+        missing = frame.isna().sum()
+        assert [(e["col"], e["filled"], e["status"]) for e in report["columns"]] == [
+            (c, int(missing[c]), "ok") for c in strategies]
+        assert report["filled"] == int(missing[list(strategies)].sum())
+
+    def test_row_methods_and_statuses(self, frame):
+        """ffill/bfill/interpolate/drop, 숫자가 아닌 열의 평균·값 없는 열·없는 열은 상태로 보고"""
+        out, report = impute_frame(frame, {"금액": "forward_fill", "수량": "interpolate", "메모": "backward_fill",
+                                           "도시": "mean", "빈열": "median", "없는열": "zero", "재고": "drop"})
+        pd.testing.assert_series_equal(out["금액"], frame["금액"].ffill()[out.index])
+        pd.testing.assert_series_equal(out["수량"], frame["수량"].interpolate()[out.index])
+        assert out["메모"].tolist() == frame["메모"].bfill()[out.index].tolist()
+        status = {e["col"]: e["status"] for e in report["columns"]}
+        assert status == {"금액": "ok", "수량": "ok", "메모": "ok", "도시": "skip:not_numeric",
+                          "빈열": "ok", "없는열": "skip:not_found", "재고": "ok"}
+        assert report["dropped_rows"] == int(frame["재고"].isna().sum()) == len(frame) - len(out)
+
+    def test_handle_missing_values_reports_instead_of_printing(self, frame, capsys):
+        """결측 비율이 높은 열 삭제 후 처리, 출력 대신 보고"""
+        out, report = handle_missing_values(frame, {"빈열": "zero", "금액": "mean"}, return_report=True)
+        assert "빈열" not in out.columns and out["금액"].notna().all()
+        assert report["dropped_columns"] == ["빈열"]
+        assert report["columns"][0] == {"col": "빈열", "method": "zero", "status": "dropped"}
+        assert capsys.readouterr().out == ""
+
+
+class TestImputeRules:
+    """impute(rules) 별칭·보고 형식"""
+
+    def test_aliases_and_duplicates(self, frame):
+        """avg/ffill/value 별칭, 같은 열의 규칙이 여러 개면 첫 규칙만 적용"""
+        out, report = impute(frame, [
+            {"col": "수량", "method": "avg"},
+            {"col": "금액", "method": "ffill"},
+            {"col": "메모", "method": "value", "value": ""},
+            {"col": "수량", "method": "zero"},
+            {"col": "도시", "method": "unknown"},
+        ])
+        assert out["수량"].to_numpy() == pytest.approx(frame["수량"].fillna(frame["수량"].mean()).to_numpy())
+        assert out["금액"].tolist()[1:] == frame["금액"].ffill().tolist()[1:]
+        assert [(e["method"], e["status"]) for e in report["impute"]] == [
+            ("avg", "ok"), ("ffill", "ok"), ("value", "ok"), ("zero", "skip:duplicate"),
+            ("unknown", "skip:unknown_method")]
+
+
+class TestGroupImpute:
+    """by 그룹 통계로 채우고, 값이 없는 그룹은 전체 통계로"""
+
+    @pytest.fixture
+    def sales(self):
+        return pd.DataFrame({
+            "카테고리": ["식품", "식품", "식품", "의류", "의류", "잡화", "잡화", None],
+            "도시": ["서울", "서울", "부산", "서울", "서울", "서울", "서울", "서울"],
+            "금액": [10, np.nan, 30, np.nan, 50, np.nan, np.nan, np.nan],
+            "메모": ["a", None, "b", "c", None, None, None, None],
+            "수량": pd.array([1, None, 2, 4, None, None, 7, None], dtype="Int64"),
+        })
+
+    def test_group_stats_with_global_fallback(self, sales):
+        """그룹 중앙값·최빈값·평균(정수 열은 Float64), 빈 그룹·결측 키 그룹은 전체 통계"""
+        out, report = impute(sales, [
+            {"col": "금액", "method": "median", "by": ["카테고리", "도시"]},
+            {"col": "메모", "method": "mode", "by": "카테고리"},
+            {"col": "수량", "method": "mean", "by": ["카테고리"]},
+        ])
+        assert out["금액"].tolist() == [10, 10, 30, 50, 50, 30, 30, 30]
+        assert out["메모"].tolist() == ["a", "a", "b", "c", "c", "a", "a", "a"]
+        assert out["수량"].tolist() == [1, 1.5, 2, 4, 4, 7, 7, 3.5]
+        g = {e["col"]: (e["groups"], e["group_filled"], e["fallback"], e["filled"]) for e in report["impute"]}
+        assert g == {"금액": (5, 2, 3, 5), "메모": (4, 2, 3, 5), "수량": (4, 3, 1, 4)}
+
+    def test_group_ffill_and_missing_by(self, sales):
+        """ffill은 그룹 안에서만(대체 없음), 없는 by 열은 건너뜀"""
+        out, report = impute_frame(sales, {"금액": {"strategy": "forward_fill", "by": ["카테고리"]},
+                                           "메모": {"strategy": "mode", "by": ["지역"]}})
+        pd.testing.assert_series_equal(out["금액"], sales["금액"].groupby(sales["카테고리"], dropna=False).ffill())
+        assert out["메모"].isna().sum() == sales["메모"].isna().sum()
+        assert [e["status"] for e in report["columns"]] == ["ok", "skip:by_not_found:['지역']"]
+
+    def test_matches_groupby_transform_at_scale(self):
+        """많은 그룹에서 groupby().transform + 전체 중앙값과 같은 결과"""
+        rng = np.random.default_rng(5)
+        n = 200_000
+        df = pd.DataFrame({"카테고리": rng.integers(0, 300, n), "도시": rng.integers(0, 200, n).astype(str),
+                           "금액": rng.normal(size=n)})
+        df.loc[rng.random(n) < 0.3, "금액"] = np.nan
+        out, report = impute(df, [{"col": "금액", "method": "median", "by": ["카테고리", "도시"]}])
+        group = df.groupby(["카테고리", "도시"])["금액"].transform("median")
+        expected = df["금액"].fillna(group).fillna(df["금액"].median())
+        np.testing.assert_allclose(out["금액"].to_numpy(), expected.to_numpy())
+        assert report["impute"][0]["fallback"] > 0 and out["금액"].notna().all()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,431 @@
+# tests/test_loader.py
+import pytest
+from pathlib import Path
+import pandas as pd
+from app.io import loader
+from app.io.loader import detect_encoding, load_table
+
+
+class TestDetectEncoding:
+    """샘플링 기반 인코딩 감지 테스트"""
+
+    def test_bom_and_strict_decode(self, tmp_path):
+        """BOM / utf-8 / cp949 판별"""
+        p1 = tmp_path / "bom.csv"
+        p1.write_bytes("이름,금액\n홍길동,1000\n".encode("utf-8-sig"))
+        p2 = tmp_path / "utf8.csv"
+        p2.write_bytes("이름,금액\n홍길동,1000\n".encode("utf-8"))
+        p3 = tmp_path / "cp949.csv"
+        p3.write_bytes("이름,금액\n홍길동,1000\n".encode("cp949"))
+
+        assert detect_encoding(str(p1))["encoding"] == "utf-8-sig"
+        assert detect_encoding(str(p2))["encoding"] == "utf-8"
+        assert detect_encoding(str(p3))["encoding"] == "cp949"
+
+    def test_middle_sample_catches_late_non_ascii(self, tmp_path, monkeypatch):
+        """앞부분이 ASCII여도 중간 샘플에서 cp949를 찾아냄"""
+        monkeypatch.setattr(loader, "_SAMPLE_HEAD_BYTES", 1024)
+        monkeypatch.setattr(loader, "_SAMPLE_MID_BYTES", 1024)
+        body = "id,city\n" + "".join(f"{i},seoul\n" for i in range(2000)) + "".join(f"{i},서울\n" for i in range(2000))
+        p = tmp_path / "late.csv"
+        p.write_bytes(body.encode("cp949"))
+        assert detect_encoding(str(p))["encoding"] == "cp949"
+
+    def test_result_is_cached_by_stat(self, tmp_path, monkeypatch):
+        """같은 파일(크기/수정시각 동일)은 다시 감지하지 않음"""
+        p = tmp_path / "c.csv"
+        p.write_bytes("a,b\n1,2\n".encode("utf-8"))
+        detect_encoding(str(p))
+
+        def _fail(path):
+            raise AssertionError("감지가 다시 실행됨")
+        monkeypatch.setattr(loader, "_sniff_encoding", _fail)
+        assert detect_encoding(str(p))["encoding"] == "utf-8"
+
+    def test_load_table_uses_detected_encoding(self, tmp_path):
+        p = tmp_path / "cp.csv"
+        p.write_bytes("도시,금액\n부산,10\n".encode("cp949"))
+        df, meta = load_table(str(p))
+        assert meta["encoding"] == "cp949"
+        assert df["도시"].iloc[0] == "부산"
+
+
+class TestArrowEngine:
+    """pyarrow CSV 엔진 테스트"""
+
+    def _write(self, tmp_path):
+        p = tmp_path / "t.csv"
+        p.write_bytes("id,주문일,업데이트일,금액\n1,2024-01-01,2024-01-01 10:00:00,\"1,000원\"\n2,2024-01-02,2024-01-02 11:00:00,\n".encode("cp949"))
+        return str(p)
+
+    def test_arrow_matches_pandas_values(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        path = self._write(tmp_path)
+        a, _ = load_table(path, engine="pandas")
+        b, meta = load_table(path, engine="arrow")
+        assert meta["engine"] == "arrow"
+        assert isinstance(b["금액"].dtype, pd.StringDtype) and b["금액"].dtype.storage == "pyarrow"
+        # 날짜/시각 문자열은 자동 변환하지 않음
+        assert b["업데이트일"].iloc[0] == "2024-01-01 10:00:00"
+        assert a["id"].tolist() == b["id"].tolist()
+        assert a["금액"].isna().tolist() == b["금액"].isna().tolist()
+
+    def test_arrow_chunks_tolerate_type_drift(self, tmp_path, monkeypatch):
+        """첫 블록은 정수였던 열에 문자열이 섞여도 청크 읽기가 실패하지 않음"""
+        pytest.importorskip("pyarrow")
+        monkeypatch.setattr(loader, "_ARROW_BLOCK_SIZE", 64)
+        p = tmp_path / "drift.csv"
+        p.write_text("a,b\n" + "".join(f"{i},x\n" for i in range(50)) + "zz,y\n", encoding="utf-8")
+        chunks, _ = load_table(str(p), engine="arrow", chunksize=20)
+        parts = list(chunks)
+        assert [len(c) for c in parts] == [20, 20, 11]
+        assert pd.api.types.is_integer_dtype(parts[0]["a"])
+        assert parts[-1]["a"].iloc[-1] == "zz"
+
+    def test_falls_back_without_pyarrow(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(loader, "_arrow_available", lambda: False)
+        df, meta = load_table(self._write(tmp_path), engine="arrow")
+        assert meta["engine"] == "pandas"
+        assert len(df) == 2
+
+
+class TestInputCache:
+    """파싱 결과 Parquet 캐시 테스트"""
+
+    def test_second_load_is_served_from_cache(self, tmp_path, monkeypatch):
+        pytest.importorskip("pyarrow")
+        monkeypatch.setenv("SEC_CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.setenv("SEC_CACHE_MIN_BYTES", "0")
+        p = tmp_path / "c.csv"
+        p.write_text("도시,금액\n서울,1\n부산,2\n", encoding="utf-8")
+
+        a, m1 = load_table(str(p))
+        b, m2 = load_table(str(p))
+        assert m1["cache"] == "miss" and m2["cache"] == "hit"
+        pd.testing.assert_frame_equal(a, b)
+
+        # 내용이 바뀌면 다시 파싱
+        p.write_text("도시,금액\n대구,3\n", encoding="utf-8")
+        c, m3 = load_table(str(p))
+        assert m3["cache"] == "miss"
+        assert c["도시"].tolist() == ["대구"]
+
+    def test_lru_eviction_respects_budget(self, tmp_path, monkeypatch):
+        pytest.importorskip("pyarrow")
+        import os
+        import time
+        from app.io import cache
+        monkeypatch.setenv("SEC_CACHE_DIR", str(tmp_path / "cache"))
+        for i in range(3):
+            cache.put(f"k{i}", pd.DataFrame({"a": range(1000)}))
+            os.utime(cache._entry(f"k{i}"), (time.time() + i, time.time() + i))
+        one = cache._entry("k0").stat().st_size
+        removed = cache.evict(limit=one * 2)
+        assert removed == 1
+        assert not cache._entry("k0").exists()
+        assert cache.get("k2") is not None
+
+
+class TestXlsxReader:
+    """스트리밍 XLSX 리더 테스트"""
+
+    @pytest.fixture
+    def xlsx(self, tmp_path):
+        df = pd.DataFrame({
+            "id": range(7),
+            "날짜": pd.date_range("2024-01-01 09:30:00.250", periods=7, freq="h"),
+            "금액": [1.5, 2, None, 4, 5, 6, 7],
+            "도시": ["서울", None, "부산", "대구", "서울", "부산", "대구"],
+            "승인": [True, False, True, True, False, True, False],
+        })
+        p = tmp_path / "src.xlsx"
+        with pd.ExcelWriter(p) as w:
+            df.to_excel(w, index=False, sheet_name="원본")
+            df.head(2).to_excel(w, index=False, sheet_name="요약")
+        return p
+
+    def test_matches_read_excel(self, xlsx):
+        from app.io.xlsx_reader import read_xlsx, sheet_names
+        assert sheet_names(str(xlsx)) == ["원본", "요약"]
+        pd.testing.assert_frame_equal(read_xlsx(str(xlsx), "원본"), pd.read_excel(xlsx, sheet_name="원본"))
+
+    def test_projection_and_row_limit(self, xlsx):
+        from app.io.xlsx_reader import read_xlsx
+        out = read_xlsx(str(xlsx), "원본", usecols=["도시", "id"], nrows=3)
+        assert list(out.columns) == ["id", "도시"]
+        assert out["id"].tolist() == [0, 1, 2]
+
+    def test_load_table_chunks_and_all_sheets(self, xlsx):
+        chunks, _ = load_table(str(xlsx), sheet="원본", chunksize=3)
+        parts = list(chunks)
+        assert [len(c) for c in parts] == [3, 3, 1]
+        pd.testing.assert_frame_equal(pd.concat(parts), pd.read_excel(xlsx, sheet_name="원본"))
+
+        sheets, _ = load_table(str(xlsx))
+        assert list(sheets) == ["원본", "요약"] and len(sheets["요약"]) == 2
+
+
+class TestXlsxWriter:
+    """스트리밍 XLSX 작성기 테스트"""
+
+    def _frame(self, n=25):
+        return pd.DataFrame({
+            "id": range(n),
+            "날짜": pd.date_range("2024-01-01", periods=n, freq="D"),
+            "금액": [None if i % 5 == 0 else i * 1000.5 for i in range(n)],
+            "도시": ["서울", "부산 & 대구", None, "<광주>", "서울"] * (n // 5),
+            "승인": [i % 2 == 0 for i in range(n)],
+        })
+
+    def test_round_trip_and_number_formats(self, tmp_path):
+        from openpyxl import load_workbook
+        from app.io.xlsx_writer import write_xlsx
+        df = self._frame()
+        p = tmp_path / "out.xlsx"
+        assert write_xlsx(df, p, sheet="정리본", number_formats={"금액": "#,##0.00"}, batch_rows=7) == 25
+        back = pd.read_excel(p, sheet_name="정리본")
+        pd.testing.assert_frame_equal(back, df, check_dtype=False)
+
+        ws = load_workbook(p)["정리본"]
+        assert ws["C3"].number_format == "#,##0.00"
+        assert ws["B2"].number_format == "yyyy-mm-dd"
+
+    def test_multiple_sheets_from_chunks(self, tmp_path):
+        from app.io.xlsx_writer import XlsxStreamWriter
+        df = self._frame()
+        p = tmp_path / "multi.xlsx"
+        with XlsxStreamWriter(p) as w:
+            w.write_sheet("원본", (df.iloc[i:i + 10] for i in range(0, len(df), 10)))
+            w.write_sheet("요약", df.head(3))
+            with pytest.raises(ValueError):
+                w.write_sheet("원본", df)
+        sheets = pd.read_excel(p, sheet_name=None)
+        assert list(sheets) == ["원본", "요약"]
+        pd.testing.assert_frame_equal(sheets["원본"], df, check_dtype=False)
+
+    def test_write_table_streams_large_frames(self, tmp_path, monkeypatch):
+        from app.io import xlsx_writer
+        calls = []
+        real = xlsx_writer.export_xlsx
+        monkeypatch.setattr(xlsx_writer, "export_xlsx", lambda *a, **k: calls.append(1) or real(*a, **k))
+        loader.write_table(self._frame(), str(tmp_path / "small.xlsx"))
+        assert calls == []
+        monkeypatch.setattr(loader, "XLSX_STREAM_MIN_ROWS", 10)
+        loader.write_table(self._frame(), str(tmp_path / "large.xlsx"), sheet="정리본")
+        assert calls == [1]
+        assert len(pd.read_excel(tmp_path / "large.xlsx", sheet_name="정리본")) == 25
+
+    def test_small_write_uses_streaming_date_formats(self, tmp_path):
+        """to_excel 경로도 자정뿐인 열은 yyyy-mm-dd, 시각이 있는 열은 시각까지"""
+        from openpyxl import load_workbook
+        df = self._frame(5).assign(시각=pd.date_range("2024-01-01 09:30", periods=5, freq="h"))
+        loader.write_table(df, str(tmp_path / "small.xlsx"))
+        loader.write_table(df, str(tmp_path / "large.xlsx"), streaming=True)
+        for name in ("small.xlsx", "large.xlsx"):
+            ws = load_workbook(tmp_path / name).active
+            assert ws["B2"].number_format == ws["B6"].number_format == "yyyy-mm-dd"
+            assert ws["F2"].number_format == "yyyy-mm-dd hh:mm:ss"
+
+
+class TestRowLimitSplit:
+    """Excel 행 한도 초과 시 시트/파일 분할 테스트 (한도를 작게 바꿔 검증)"""
+
+    @pytest.fixture(autouse=True)
+    def small_limit(self, monkeypatch):
+        from app.io import xlsx_writer
+        monkeypatch.setattr(xlsx_writer, "MAX_SHEET_ROWS", 11)  # 헤더 + 10행
+
+    def test_write_table_splits_into_sheets(self, tmp_path):
+        df = pd.DataFrame({"id": range(25), "금액": [i * 10 for i in range(25)]})
+        res = loader.write_table(df, str(tmp_path / "out.xlsx"), sheet="정리본")
+        assert res["split"] is True
+        assert [(p["sheet"], p["rows"]) for p in res["parts"]] == [("정리본_1", 10), ("정리본_2", 10), ("정리본_3", 5)]
+        sheets = pd.read_excel(tmp_path / "out.xlsx", sheet_name=None)
+        pd.testing.assert_frame_equal(pd.concat(sheets.values(), ignore_index=True), df)
+
+    def test_chunks_spill_into_files(self, tmp_path):
+        df = pd.DataFrame({"id": range(23)})
+        chunks = (df.iloc[i:i + 7] for i in range(0, len(df), 7))
+        res = loader.export_table(chunks, str(tmp_path / "out.xlsx"), sheet="전처리본", split="files")
+        names = [Path(p["path"]).name for p in res["parts"]]
+        assert names == ["out_1.xlsx", "out_2.xlsx", "out_3.xlsx"]
+        assert res["path"] == res["parts"][0]["path"] and Path(res["path"]).exists()
+        assert not (tmp_path / "out.xlsx").exists()
+        back = pd.concat([pd.read_excel(p["path"], sheet_name="전처리본") for p in res["parts"]], ignore_index=True)
+        pd.testing.assert_frame_equal(back, df)
+
+    def test_pivot_is_split_across_sheets(self, tmp_path):
+        from app.autoexcel.engines_fallback import create_pivot_from_df
+        df = pd.DataFrame({"거래처": [f"C{i:02d}" for i in range(15)], "금액": range(15)})
+        out = str(tmp_path / "pivot.xlsx")
+        shape, sheets = create_pivot_from_df(df, out, "03_피벗", ["거래처"], [("금액", "sum")], return_sheets=True)
+        assert shape == (15, 2)
+        assert [(s["sheet"], s["rows"]) for s in sheets] == [("03_피벗_1", 10), ("03_피벗_2", 5)]
+
+
+class TestLoadMany:
+    """여러 파일/시트 병렬 로드 테스트"""
+
+    @pytest.fixture
+    def folder(self, tmp_path):
+        for m in (1, 2, 3):
+            pd.DataFrame({"월": [f"2024-0{m}"] * 2, "금액": [m * 100, m * 200]}).to_csv(
+                tmp_path / f"sales_0{m}.csv", index=False, encoding="utf-8-sig")
+        with pd.ExcelWriter(tmp_path / "book.xlsx") as w:
+            pd.DataFrame({"금액": [1, 2]}).to_excel(w, index=False, sheet_name="A")
+            pd.DataFrame({"금액": [3]}).to_excel(w, index=False, sheet_name="B")
+        (tmp_path / "broken.csv").write_bytes(b"")
+        return tmp_path
+
+    def test_glob_to_dict_with_timing(self, folder):
+        from app.io.loader import load_many
+        out, meta = load_many(str(folder / "sales_*.csv"), workers=2)
+        assert [Path(p).name for p in out] == ["sales_01.csv", "sales_02.csv", "sales_03.csv"]
+        assert meta["workers"] == 2 and meta["errors"] == 0
+        assert all(f["rows"] == 2 and f["seconds"] >= 0 for f in meta["files"])
+
+    def test_all_sheets_and_concat_with_errors(self, folder):
+        from app.io.loader import load_many
+        out, meta = load_many([str(folder / "book.xlsx"), str(folder / "broken.csv")], workers=2)
+        assert list(out[str(folder / "book.xlsx")]) == ["A", "B"]
+        assert meta["errors"] == 1
+        assert [f["path"] for f in meta["files"] if "error" in f] == [str(folder / "broken.csv")]
+
+        df, _ = load_many(str(folder / "book.xlsx"), concat=True, workers=1)
+        assert df["금액"].tolist() == [1, 2, 3]
+        assert df["__sheet"].tolist() == ["A", "A", "B"]
+
+
+class TestPushdown:
+    """열 선택·필터 푸시다운 테스트"""
+
+    @pytest.fixture
+    def frame(self):
+        return pd.DataFrame({
+            "거래ID": [f"A{i:03d}" for i in range(9)],
+            "도시": ["서울", "부산", "대구"] * 3,
+            "연도": [2023, 2024, 2024] * 3,
+            "금액": [100, 200, 300, 400, 500, 600, 700, 800, 900],
+            "메모": ["x"] * 9,
+        })
+
+    def test_parse_filters(self):
+        from app.io.loader import parse_filters
+        assert parse_filters(["도시 in [서울, 부산]", "카테고리=식품", "도시 == '대구'"]) == {
+            "도시": ["서울", "부산", "대구"], "카테고리": ["식품"]}
+        with pytest.raises(ValueError):
+            parse_filters("도시")
+
+    @pytest.mark.parametrize("suffix", [".csv", ".xlsx"])
+    def test_columns_and_filters(self, tmp_path, frame, suffix, monkeypatch):
+        p = tmp_path / f"data{suffix}"
+        if suffix == ".csv":
+            frame.to_csv(p, index=False, encoding="utf-8-sig")
+        else:
+            frame.to_excel(p, index=False)
+        monkeypatch.setattr(loader, "_FILTER_CHUNK_ROWS", 4)  # CSV는 여러 청크에 걸쳐 거름
+        want = frame[frame["도시"].isin(["서울", "부산"]) & (frame["연도"] == 2024)][["거래ID", "금액"]]
+        filters = {"도시": ["서울", "부산"], "연도": "2024"}
+
+        df, meta = load_table(str(p), sheet=0, columns=["거래ID", "금액", "없는열"], filters=filters, cache=False)
+        assert meta["columns"] == ["거래ID", "금액", "없는열"]
+        pd.testing.assert_frame_equal(df, want.reset_index(drop=True), check_dtype=False)
+
+        chunks, _ = load_table(str(p), columns=["거래ID", "금액"], filters=filters, chunksize=2, cache=False)
+        assert pd.concat(list(chunks))["거래ID"].tolist() == want["거래ID"].tolist()
+
+    def test_xlsx_reader_where_keeps_only_matching_rows(self, tmp_path, frame):
+        from app.io.xlsx_reader import read_xlsx
+        p = tmp_path / "data.xlsx"
+        frame.to_excel(p, index=False)
+        df = read_xlsx(str(p), usecols=["금액"], where={"도시": "대구"}, nrows=6)
+        assert df["금액"].tolist() == [300, 600]
+        assert list(df.columns) == ["금액"] and df.index.tolist() == [0, 1]
+
+    def test_columns_from_intent_and_dsl(self):
+        from app.autoexcel.engines_fallback import pivot_inputs
+        from app.validate.dsl import spec_columns
+        header = ["거래ID", "주문일", "카테고리", "금액", "도시", "메모"]
+        cols, filters = pivot_inputs(header, ["월", "카테고리"], [("금액", "sum")], {"도시": ["서울"], "없음": ["x"]})
+        assert cols == ["주문일", "카테고리", "금액", "도시"]
+        assert filters == {"도시": ["서울"]}
+        spec = {"checks": [{"unique": ["거래ID"]}, {"required": ["거래ID", "금액"]},
+                           {"regex": {"column": "메모", "pattern": "."}}]}
+        assert spec_columns(spec) == ["거래ID", "금액", "메모"]
+
+
+class TestCompressedIO:
+    """압축 입력/출력 테스트"""
+
+    @pytest.fixture
+    def frame(self):
+        return pd.DataFrame({"이름": ["홍길동", "김철수"] * 50, "금액": range(100)})
+
+    @pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz"])
+    def test_compressed_csv_with_encoding_detection(self, tmp_path, frame, suffix):
+        import bz2
+        import gzip
+        import lzma
+        raw = frame.to_csv(index=False).encode("cp949")
+        p = tmp_path / f"data.csv{suffix}"
+        p.write_bytes({".gz": gzip, ".bz2": bz2, ".xz": lzma}[suffix].compress(raw))
+
+        assert detect_encoding(str(p))["encoding"] == "cp949"
+        df, _ = load_table(str(p), cache=False)
+        pd.testing.assert_frame_equal(df, frame)
+        chunks, _ = load_table(str(p), chunksize=30, cache=False)
+        assert [len(c) for c in chunks] == [30, 30, 30, 10]
+
+    @pytest.mark.parametrize("engine", ["pandas", "arrow"])
+    def test_streams_closed_after_read(self, tmp_path, frame, engine, monkeypatch):
+        """전체 읽기·청크 읽기 모두 해제 스트림을 닫음 (청크는 반복이 끝날 때)"""
+        import gzip
+        from app.io import compression
+        if engine == "arrow":
+            pytest.importorskip("pyarrow")
+        p = tmp_path / "data.csv.gz"
+        p.write_bytes(gzip.compress(frame.to_csv(index=False).encode("utf-8")))
+        opened = []
+        real = compression.open_read
+        monkeypatch.setattr(compression, "open_read", lambda *a, **k: opened.append(real(*a, **k)) or opened[-1])
+
+        load_table(str(p), encoding="utf-8", engine=engine, cache=False)
+        assert opened and all(f.closed for f in opened)
+        opened.clear()
+        chunks, _ = load_table(str(p), encoding="utf-8", engine=engine, chunksize=30, cache=False)
+        assert sum(len(c) for c in chunks) == 100
+        assert opened and all(f.closed for f in opened)
+
+    def test_zip_bundle_members_as_sheets(self, tmp_path, frame):
+        import zipfile
+        from app.io.loader import load_many
+        p = tmp_path / "bundle.zip"
+        with zipfile.ZipFile(p, "w") as zf:
+            zf.writestr("a.csv", frame.to_csv(index=False).encode("utf-8-sig"))
+            zf.writestr("b/c.csv", frame.head(3).to_csv(index=False).encode("cp949"))
+            zf.writestr("readme.md", "무시")
+
+        out, meta = load_table(str(p), cache=False)
+        assert list(out) == ["a.csv", "b/c.csv"] and meta["members"] == ["a.csv", "b/c.csv"]
+        df, meta = load_table(str(p), sheet="b/c.csv", cache=False)
+        assert meta["encoding"] == "cp949" and df["이름"].tolist() == ["홍길동", "김철수", "홍길동"]
+        df, _ = load_many(str(p), concat=True, workers=1)
+        assert df["__sheet"].value_counts().to_dict() == {"a.csv": 100, "b/c.csv": 3}
+
+    def test_compressed_output(self, tmp_path, frame):
+        import gzip
+        import zipfile
+        from app.io.loader import export_table, save_table, write_table
+        saved = write_table(frame, str(tmp_path / "out.csv"), compression="gzip")
+        assert saved["path"].endswith("out.csv.gz")
+        assert gzip.decompress(Path(saved["path"]).read_bytes()).decode("utf-8-sig").startswith("이름,금액")
+
+        saved = export_table((frame.iloc[i:i + 40] for i in range(0, 100, 40)), str(tmp_path / "out.csv.zip"))
+        assert zipfile.ZipFile(saved["path"]).namelist() == ["out.csv"] and saved["rows"] == 100
+        pd.testing.assert_frame_equal(load_table(saved["path"], cache=False)[0], frame)
+
+        assert save_table(frame, saved["path"]).endswith("out_clean.csv.zip")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
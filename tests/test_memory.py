@@ -0,0 +1,60 @@
+# tests/test_memory.py
+import pytest
+import numpy as np
+import pandas as pd
+from app.excel_ops.memory import optimize_memory
+from app.excel_ops.dedupe import dedupe
+from app.autoexcel.engines_fallback import create_pivot_from_df
+
+
+@pytest.fixture
+def frame():
+    n = 3000
+    return pd.DataFrame({
+        "거래ID": np.arange(n, dtype=np.int64),
+        "수량": pd.array(np.arange(n) % 7, dtype="Int64"),
+        "금액": np.where(np.arange(n) % 10 == 0, np.nan, (np.arange(n) % 50) * 1000.0),
+        "단가": np.arange(n) * 0.5,
+        "도시": pd.Series(["서울", "부산", "대구"] * (n // 3), dtype="string"),
+        "메모": [f"메모{i}" for i in range(n)],
+    })
+
+
+class TestOptimizeMemory:
+    """메모리 최적화 단계 테스트"""
+
+    def test_downcasts_without_changing_values(self, frame):
+        """저카디널리티 문자열 → category, 정수·정수값 실수 → 작은 정수, 값은 그대로"""
+        out, report = optimize_memory(frame)
+        assert report["columns"] == {
+            "거래ID": {"from": "int64", "to": "int16"},
+            "수량": {"from": "Int64", "to": "Int8"},
+            "금액": {"from": "float64", "to": "Int32"},
+            "도시": {"from": "string", "to": "category"},
+        }
+        assert report["bytes_after"] < report["bytes_before"]
+        assert out["단가"].dtype == np.float64 and out["메모"].dtype == frame["메모"].dtype
+        for c in frame.columns:
+            assert out[c].astype(object).where(out[c].notna(), None).tolist() == \
+                frame[c].astype(object).where(frame[c].notna(), None).tolist()
+        again, report2 = optimize_memory(out, exclude=["도시"])
+        assert report2["columns"] == {}
+
+    def test_pivot_and_dedupe_on_compact_frame(self, frame, tmp_path):
+        """category 열로도 피벗(관측된 조합만)·중복 제거 결과가 같음"""
+        small, _ = optimize_memory(frame)
+        filters = {"도시": ["서울", "부산"]}
+        full_shape = create_pivot_from_df(frame, tmp_path / "a.xlsx", "피벗", ["도시"], [("수량", "sum")], filters)
+        small_shape = create_pivot_from_df(small, tmp_path / "b.xlsx", "피벗", ["도시"], [("수량", "sum")], filters)
+        assert full_shape == small_shape == (2, 2)
+        a = pd.read_excel(tmp_path / "a.xlsx", "피벗")
+        b = pd.read_excel(tmp_path / "b.xlsx", "피벗")
+        pd.testing.assert_frame_equal(a, b)
+
+        d1, _ = dedupe(frame, ["도시"], "first")
+        d2, _ = dedupe(small, ["도시"], "first")
+        assert d1["거래ID"].tolist() == d2["거래ID"].tolist()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,107 @@
+# tests/test_pipeline.py
+import pytest
+import pandas as pd
+from app.excel_ops.clean import level1_clean
+from app.excel_ops.pipeline import StreamPreprocessor
+from app.io.loader import load_table, write_table_chunks
+
+
+class TestStreamPreprocess:
+    """청크 단위 전처리 테스트"""
+
+    def test_plan_is_fixed_across_chunks(self):
+        """첫 청크의 열 결정이 이후 청크에도 그대로 적용되는지 확인"""
+        first = pd.DataFrame({"금액": ["₩1,000", "2000원"], "활성": ["Y", "N"]})
+        # 두 번째 청크는 단독으로 보면 숫자/문자열로 판단될 값들
+        second = pd.DataFrame({"금액": [3000, 4000], "활성": ["1", "0"]})
+
+        proc = StreamPreprocessor()
+        outs = list(proc.run([first, second]))
+
+        assert proc.report["type_info"]["금액"] == "currency"
+        assert proc.report["type_info"]["활성"] == "bool"
+        assert list(outs[0].columns) == list(outs[1].columns)
+        assert outs[1]["금액"].tolist() == [3000, 4000]
+        assert outs[1]["활성"].tolist() == [True, False]
+
+    def test_stream_matches_full_clean(self, tmp_path):
+        """청크 처리 결과가 전체 처리 결과와 같은지 확인"""
+        df = pd.DataFrame({
+            "주문일": ["2024-01-0%d" % (i % 9 + 1) for i in range(30)],
+            "금액": ["%d원" % (i * 100) for i in range(30)],
+            "도시": [" 서울 ", "부산"] * 15,
+        })
+        src = tmp_path / "src.csv"
+        df.to_csv(src, index=False, encoding="utf-8")
+
+        chunks, meta = load_table(str(src), encoding="utf-8", chunksize=7)
+        out_path = tmp_path / "out.csv"
+        n = write_table_chunks(StreamPreprocessor().run(chunks), str(out_path))
+
+        full = level1_clean(df)
+        streamed = pd.read_csv(out_path, encoding="utf-8-sig")
+        assert n == len(full)
+        assert streamed["금액"].tolist() == full["금액"].tolist()
+        assert streamed["주문일"].tolist() == full["주문일"].tolist()
+        assert streamed["도시"].tolist() == full["도시"].tolist()
+
+    def test_dates_are_formatted_at_write_time(self, tmp_path):
+        """날짜 열은 datetime64로 흐르고, CSV 서식은 첫 청크 기준으로 저장 시점에 결정"""
+        first = pd.DataFrame({"주문일": ["2024-01-01", "2024-01-02"],
+                              "업데이트일": ["2024-01-01 09:00:00", "2024-01-02"]})
+        second = pd.DataFrame({"주문일": ["2024-01-03"], "업데이트일": ["2024-01-03"]})
+        proc = StreamPreprocessor()
+        outs = list(proc.run([first, second]))
+        assert pd.api.types.is_datetime64_any_dtype(outs[0]["주문일"])
+
+        out_path = tmp_path / "out.csv"
+        write_table_chunks(outs, str(out_path))
+        lines = out_path.read_text(encoding="utf-8-sig").splitlines()
+        assert lines[1:] == ["2024-01-01,2024-01-01 09:00:00", "2024-01-02,2024-01-02 00:00:00",
+                             "2024-01-03,2024-01-03 00:00:00"]
+
+    def test_forward_fill_carries_across_chunks(self):
+        """forward_fill이 청크 경계를 넘어 이어지는지 확인"""
+        first = pd.DataFrame({"도시": ["서울", "부산"], "메모": ["a", "b"]})
+        second = pd.DataFrame({"도시": [None, "대구"], "메모": ["c", "d"]})
+        proc = StreamPreprocessor(strategies={"도시": "forward_fill"})
+        outs = list(proc.run([first, second]))
+        assert outs[1]["도시"].tolist() == ["부산", "대구"]
+
+    def test_group_forward_fill_stays_in_group(self):
+        """by가 있는 forward_fill은 그룹 안에서만, 그룹별 마지막 값을 다음 청크로 (결측 키도 한 그룹)"""
+        df = pd.DataFrame({"번호": range(6), "카테고리": ["식품", "의류", "의류", "식품", None, None],
+                           "메모": ["a", "b", None, None, "c", None]})
+        strategies = {"메모": {"strategy": "forward_fill", "by": ["카테고리"]}}
+        proc = StreamPreprocessor(strategies=strategies)
+        outs = list(proc.run([df.iloc[:2], df.iloc[2:5], df.iloc[5:]]))
+        assert pd.concat(outs)["메모"].tolist() == ["a", "b", "b", "a", "c", "c"]
+        assert proc.report["impute"]["row_by"] == {"메모": ["카테고리"]}
+        assert proc.report["impute"]["skipped"] == {}
+
+
+    def test_column_empty_in_first_chunk_is_kept(self):
+        """첫 청크에서만 비어 있는 열도 유지되고, 대체값은 값이 처음 나온 청크에서 고정"""
+        first = pd.DataFrame({"도시": ["서울", "부산"], "메모": [None, None], "금액": [None, None]})
+        second = pd.DataFrame({"도시": ["대구", "광주", "울산"], "메모": [" a ", None, "b"], "금액": [10, None, 30]})
+        proc = StreamPreprocessor(strategies={"금액": "mean", "메모": "mode"})
+        outs = list(proc.run([first, second]))
+        full = level1_clean(pd.concat([first, second], ignore_index=True))
+        assert list(outs[0].columns) == list(outs[1].columns) == list(full.columns)
+        assert outs[1]["메모"].tolist() == ["a", "a", "b"]
+        assert outs[1]["금액"].tolist() == [10, 20, 30]
+        assert proc.report["impute"]["over_threshold"] == ["금액", "메모"]
+
+    def test_fractional_fill_on_integer_column(self):
+        """정리 후 Int64가 된 열에 소수 평균을 채우면 Float64로 올려 채우고, 채울 수 없는 값은 보고"""
+        chunk = pd.DataFrame({"번호": range(4), "수량": ["1,200", "6", None, "7"], "재고": ["3", None, "5", "8"]})
+        proc = StreamPreprocessor(strategies={"수량": "mean", "재고": {"strategy": "value", "fill_value": "모름"}})
+        out = list(proc.run([chunk]))[0]
+        assert out["수량"].dtype == "Float64"
+        assert out["수량"].tolist() == pytest.approx([1200, 6, 1213 / 3, 7])
+        assert out["재고"].isna().sum() == 1                       # 숫자 열에 문자열 대체값: 조용히 넘기지 않고 보고
+        assert proc.report["impute"]["skipped"]["재고"].startswith("error:")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+preprocess 단계 체인의 최대 RSS 측정 (기본 50만 행 합성 데이터)
+  python tools/peak_rss.py [--rows 500000]
+
+- copy : 단계마다 입력을 복사 (copy=True, 라이브러리 기본값)
+- owned: 단계마다 소유권을 넘김 (copy=False, sec preprocess 동작)
+모드마다 새 프로세스에서 CSV 로드 → level1_clean → 결측치 → 이상치 순으로 실행하고,
+로드 직후와 체인 종료 후의 최대 RSS(MB)를 비교합니다. 결과는 logs/perf/peak_rss_*.json
+"""
+import argparse
+import json
+import pathlib
+import subprocess
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tests"))
+OUT = ROOT / "logs" / "perf"
+
+IMPUTE = {"금액": "median", "메모": "mode"}
+OUTLIER = [{"col": "금액", "method": "iqr_clip", "multiplier": 1.5}]
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS(MB). 측정할 수 없으면 None"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+    except ImportError:
+        pass
+    try:
+        import psutil  # Windows: peak working set
+        return round(psutil.Process().memory_info().peak_wset / 2**20, 1)
+    except Exception:
+        return None
+
+
+def child(mode: str, csv_path: str):
+    from app.io.loader import load_table
+    from app.excel_ops.clean import level1_clean
+    from app.excel_ops.impute import handle_missing_values
+    from app.excel_ops.outlier import outlier
+
+    copy = mode == "copy"
+    df, _ = load_table(csv_path, cache=False)
+    loaded = peak_rss_mb()
+    t0 = time.perf_counter()
+    df = level1_clean(df, date_output="datetime", copy=copy)
+    df = handle_missing_values(df, IMPUTE, copy=copy)
+    df, _ = outlier(df, OUTLIER, copy=copy)
+    print(json.dumps({"mode": mode, "rows": len(df), "load_peak_mb": loaded, "peak_mb": peak_rss_mb(),
+                      "seconds": round(time.perf_counter() - t0, 2)}))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=500_000)
+    ap.add_argument("--child", choices=["copy", "owned"])
+    ap.add_argument("--csv")
+    args = ap.parse_args()
+    if args.child:
+        return child(args.child, args.csv)
+
+    from bench_run import synth_data, DATA_DIR
+    csv_path = DATA_DIR / f"synth_{args.rows}.csv"
+    if not csv_path.exists():
+        synth_data(args.rows).to_csv(csv_path, index=False, encoding="utf-8")
+    results = {}
+    for mode in ("copy", "owned"):
+        proc = subprocess.run([sys.executable, __file__, "--child", mode, "--csv", str(csv_path)],
+                              capture_output=True, text=True, check=True, cwd=ROOT)
+        results[mode] = json.loads(proc.stdout.strip().splitlines()[-1])
+        print(json.dumps(results[mode], ensure_ascii=False))
+
+    OUT.mkdir(parents=True, exist_ok=True)
+    p = OUT / f"peak_rss_{int(time.time())}.json"
+    p.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"saved: {p}")
+
+
+if __name__ == "__main__":
+    main()